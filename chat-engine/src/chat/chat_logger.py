@@ -1,8 +1,23 @@
-"""ChatLogger — appends turns, tracks human interventions, saves both output files."""
+"""ChatLogger — appends turns, tracks human interventions, saves both output files.
+
+Both output files are written incrementally: the first save writes the header,
+every later save appends only the turns added since the previous save. The
+footer lives in a small trailer file that is atomically replaced on each save
+and folded into the file by close() at session end. Autosaving after every turn
+therefore costs the same at turn 500 as at turn 5, and lines already on disk are
+never rewritten — a crash mid-save can only lose the newest turn. Use
+read_output() to read a file whose session has not been closed.
+
+Each turn's history line (`Speaker: "text"`) and its token estimate are
+computed once, on append. A running token total over those lines lets callers
+ask how many recent turns fit a token budget without re-rendering anything.
+"""
 
 from __future__ import annotations
 
+import os
 import re
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -30,6 +45,11 @@ class ChatLogger:
         self._human_intervention_count = 0
         self._director_note_count = 0
         self._total_tokens = 0
+        self._files: dict[str, _IncrementalFile] = {}
+        # History view — one rendered line per turn, plus a running token total:
+        # _token_prefix[i] = estimated tokens of lines[:i]
+        self._lines: list[str] = []
+        self._token_prefix: list[int] = [0]
 
     # -----------------------------------------------------------------------
     # Write
@@ -58,6 +78,9 @@ class ChatLogger:
             director_note=director_note,
         )
         self._turns.append(record)
+        line = _history_line(record)
+        self._lines.append(line)
+        self._token_prefix.append(self._token_prefix[-1] + estimate_tokens(line) + 1)  # +1 for the newline
 
         if generator == "human":
             self._human_intervention_count += 1
@@ -78,13 +101,20 @@ class ChatLogger:
 
     def get_history(self, n: int = 20) -> str:
         """Return the last n turns as a formatted transcript string for prompt context."""
-        window = self._turns[-n:] if n > 0 else self._turns
-        lines = []
-        for t in window:
-            # Ensure text is already stripped of any speaker prefix the GM may have echoed
-            text = _strip_speaker_prefix(t.text, t.speaker)
-            lines.append(f'{t.speaker}: "{text}"')
-        return "\n".join(lines)
+        return "\n".join(self._lines[-n:] if n > 0 else self._lines)
+
+    def history_tokens(self, n: int) -> int:
+        """Estimated tokens of get_history(n), without rendering it."""
+        n = min(n, len(self._lines)) if n > 0 else len(self._lines)
+        return self._token_prefix[-1] - self._token_prefix[len(self._lines) - n]
+
+    def turns_within(self, budget_tokens: int) -> int:
+        """How many of the most recent turns fit in budget_tokens (0 if not even one)."""
+        if budget_tokens <= 0:
+            return 0
+        # First index whose suffix total is within budget: prefix[i] >= total - budget
+        first = bisect_left(self._token_prefix, self._token_prefix[-1] - budget_tokens)
+        return len(self._lines) - first
 
     def turn_count(self) -> int:
         return len(self._turns)
@@ -108,32 +138,22 @@ class ChatLogger:
 
     def save_transcript(self, path: str) -> None:
         """Write clean chat-style transcript — human turns indistinguishable from GM turns."""
-        out = Path(path)
-        out.parent.mkdir(parents=True, exist_ok=True)
-
-        lines = [
+        header = [
             f"# {self._title}",
             f"*Session started: {self._started_at}*",
             "",
             "---",
             "",
         ]
-        for t in self._turns:
-            text = _strip_speaker_prefix(t.text, t.speaker)
-            lines.append(f'{t.speaker}: "{text}"')
-
-        lines += [
+        footer = [
             "",
             "---",
             f"*Session ended — Turn {len(self._turns)} | Reason: user /stop*",
         ]
-        out.write_text("\n".join(lines), encoding="utf-8")
+        self._file(path).sync(header, self._turns, self._transcript_lines, footer)
 
     def save_runlog(self, path: str, end_reason: str = "user /stop") -> None:
         """Write application run log with full turn metadata."""
-        out = Path(path)
-        out.parent.mkdir(parents=True, exist_ok=True)
-
         header = [
             f"# Run Log — {self._title}",
             f"*Session: {self._started_at}*",
@@ -143,22 +163,6 @@ class ChatLogger:
             header.append(f"*Model: {self._model_label}*")
         header += ["", "---", ""]
 
-        turn_lines = []
-        for t in self._turns:
-            tag = f"[T{t.turn_number:03d}]"
-            speaker_col = f"SPEAKER: {t.speaker:<12}"
-            gen_col = f"GEN: {t.generator:<5}"
-            if t.generator == "human":
-                rule_col = f"CMD: {t.rule}"
-                input_col = f' | INPUT: "{t.cmd}"' if t.cmd else ""
-                turn_lines.append(f"{tag} {speaker_col} | {gen_col} | {rule_col}{input_col}")
-            else:
-                rule_col = f"RULE: {t.rule:<24}"
-                tok_col = f"TOKENS: {t.tokens}"
-                turn_lines.append(f"{tag} {speaker_col} | {gen_col} | {rule_col} | {tok_col}")
-            if t.director_note:
-                turn_lines.append(f'       DIRECTOR NOTE: "{t.director_note}"')
-
         footer = [
             "",
             "---",
@@ -170,9 +174,147 @@ class ChatLogger:
             f"*Transcript saved: (see meta)*",
             f"*Run log saved: {path}*",
         ]
+        self._file(path).sync(header, self._turns, _runlog_lines, footer)
+
+    def close(self) -> None:
+        """Append each output file's footer to it and remove its trailer. Call after the final saves."""
+        for f in self._files.values():
+            f.close()
+
+    def _transcript_lines(self, t: TurnRecord) -> list[str]:
+        return [self._lines[t.turn_number - 1]]  # same line the history view rendered on append
+
+    def _file(self, path: str) -> "_IncrementalFile":
+        f = self._files.get(path)
+        if f is None:
+            f = self._files[path] = _IncrementalFile(path)
+        return f
+
 
-        content = "\n".join(header + turn_lines + footer)
-        out.write_text(content, encoding="utf-8")
+# ---------------------------------------------------------------------------
+# Output rendering
+# ---------------------------------------------------------------------------
+
+def estimate_tokens(text: str) -> int:
+    """chars/4 token approximation used for all context budgeting."""
+    return (len(text) + 3) // 4
+
+
+def _history_line(t: TurnRecord) -> str:
+    # Ensure text is stripped of any speaker prefix the GM may have echoed
+    text = _strip_speaker_prefix(t.text, t.speaker)
+    return f'{t.speaker}: "{text}"'
+
+
+def _runlog_lines(t: TurnRecord) -> list[str]:
+    tag = f"[T{t.turn_number:03d}]"
+    speaker_col = f"SPEAKER: {t.speaker:<12}"
+    gen_col = f"GEN: {t.generator:<5}"
+    if t.generator == "human":
+        rule_col = f"CMD: {t.rule}"
+        input_col = f' | INPUT: "{t.cmd}"' if t.cmd else ""
+        lines = [f"{tag} {speaker_col} | {gen_col} | {rule_col}{input_col}"]
+    else:
+        rule_col = f"RULE: {t.rule:<24}"
+        tok_col = f"TOKENS: {t.tokens}"
+        lines = [f"{tag} {speaker_col} | {gen_col} | {rule_col} | {tok_col}"]
+    if t.director_note:
+        lines.append(f'       DIRECTOR NOTE: "{t.director_note}"')
+    return lines
+
+
+class _IncrementalFile:
+    """One output file laid out as header + one chunk per turn, with its footer in a trailer.
+
+    The body (header and turn chunks) only ever grows: a save appends the chunks
+    of new turns after the last one on disk, and turns already written are never
+    re-rendered or rewritten. The footer changes on every save, so it is not
+    kept in the body but in a small trailer file next to it (<path>.trailer):
+    the body length it belongs to, then the footer bytes. The trailer is written
+    to a temp file and swapped in with os.replace after the body write, so on
+    disk there is always a complete trailer for a complete body. A crash can
+    leave a torn chunk after that body length; read_output() ignores it and the
+    next save overwrites it.
+
+    close() appends the footer to the body and removes the trailer, leaving the
+    finished file. Should it stop in between, the trailer is still there and
+    read_output() cuts the body back to its length, so the footer appears once.
+
+    The file is rebuilt from scratch on the first save, or if it was removed or
+    shortened underneath us. read_output() returns bytes identical to joining
+    header, turn lines and footer with newlines in one go.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._turns_written = 0
+        self._body_end = -1                  # end of the last turn chunk; -1 = nothing written
+        self._trailer = b""
+
+    def sync(self, header: list[str], turns: list[TurnRecord], render, footer: list[str]) -> None:
+        self._trailer = ("\n" + "\n".join(footer)).encode("utf-8")
+        if self._must_rebuild():
+            self._rebuild(header, turns, render)
+        else:
+            chunks = [("\n" + "\n".join(render(t))).encode("utf-8") for t in turns[self._turns_written:]]
+            if chunks:
+                body = b"".join(chunks)
+                with open(self.path, "r+b") as f:
+                    f.seek(self._body_end)
+                    f.write(body)
+                    f.truncate()             # a torn chunk left by a crash, or a footer from close()
+                self._body_end += len(body)
+                self._turns_written = len(turns)
+        _replace(_trailer_path(self.path), b"%d\n" % self._body_end + self._trailer)
+
+    def close(self) -> None:
+        if self._body_end < 0:
+            return
+        with open(self.path, "r+b") as f:
+            f.seek(self._body_end)
+            f.write(self._trailer)
+            f.truncate()
+        try:
+            os.remove(_trailer_path(self.path))
+        except FileNotFoundError:
+            pass
+
+    def _must_rebuild(self) -> bool:
+        if self._body_end < 0:
+            return True
+        try:
+            return os.path.getsize(self.path) < self._body_end
+        except OSError:
+            return True
+
+    def _rebuild(self, header, turns, render) -> None:
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        body = "\n".join([*header, *("\n".join(render(t)) for t in turns)]).encode("utf-8")
+        _replace(self.path, body)
+        self._body_end = len(body)
+        self._turns_written = len(turns)
+
+
+def _trailer_path(path: str) -> str:
+    return path + ".trailer"
+
+
+def _replace(path: str, data: bytes) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def read_output(path: str) -> str:
+    """The contents of a transcript or run log, footer included, even mid-session."""
+    data = Path(path).read_bytes()
+    try:
+        trailer = Path(_trailer_path(path)).read_bytes()
+    except FileNotFoundError:
+        return data.decode("utf-8")      # closed: the footer is in the file
+    size, _, footer = trailer.partition(b"\n")
+    return (data[:int(size)] + footer).decode("utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -239,13 +381,14 @@ if __name__ == "__main__":
     print("TRANSCRIPT PREVIEW")
     print("=" * 60)
     logger.save_transcript("/tmp/test_transcript.md")
+    logger.save_runlog("/tmp/test_runlog.md")
+    logger.close()   # fold the footers in and remove the .trailer files
     print(Path("/tmp/test_transcript.md").read_text())
 
     print()
     print("=" * 60)
     print("RUN LOG PREVIEW")
     print("=" * 60)
-    logger.save_runlog("/tmp/test_runlog.md")
     print(Path("/tmp/test_runlog.md").read_text())
 
     print("OK — chat_logger smoke test complete.")
@@ -2,8 +2,9 @@
 
 One stateless Strands Agent call per turn. The full chat history and the
 next speaker's card travel in the turn prompt — the agent carries no state
-between calls. A fresh Agent instance is created per generate() call to
-guarantee isolation.
+between calls. Calls go through the session's SessionPool, which reuses one
+agent and one HTTP client but clears the conversation before every call, so
+each call is as isolated as a fresh Agent.
 
 System prompt is built once at construction from world info + all character
 cards. Turn prompt is built fresh each call with history + speaker selection.
@@ -14,9 +15,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
-from strands import Agent
-
-from src.chat.models.provider import get_model
+from src.chat.models.pool import SessionPool
 from src.chat.parser import CharacterCard, ChatConfig
 
 
@@ -54,6 +53,7 @@ class GMAgent:
         scenario: str,
         characters: list[CharacterCard],
         config: ChatConfig,
+        pool: SessionPool | None = None,
     ):
         self._config = config
         self._char_by_name = {c.name: c for c in characters}
@@ -61,9 +61,13 @@ class GMAgent:
             gm_prompt, writing_style, world_info, scenario, characters,
             config.response_length,
         )
-        # Model is built lazily on first generate() call so that prompt
+        # The pool builds its model lazily on the first call, so prompt
         # inspection and testing work without requiring API credentials.
-        self._model = None
+        self._pool = pool or SessionPool()
+
+    @property
+    def system_prompt(self) -> str:
+        return self._system_prompt
 
     # -----------------------------------------------------------------------
     # Prompt builders (exposed for inspection / testing)
@@ -228,16 +232,8 @@ class GMAgent:
     # -----------------------------------------------------------------------
 
     def _call(self, prompt: str) -> tuple[str, int]:
-        """Create a fresh stateless Agent and invoke it. Returns (text, tokens)."""
-        if self._model is None:
-            self._model = get_model()
-        agent = Agent(
-            system_prompt=self._system_prompt,
-            model=self._model,
-            tools=[],
-            callback_handler=None,
-        )
-        response = agent(prompt)
+        """Invoke a pooled stateless GM agent. Returns (text, tokens)."""
+        response = self._pool.invoke("gm", self._system_prompt, prompt)
         text = str(response).strip()
         tokens = _extract_tokens(response)
         return text, tokens
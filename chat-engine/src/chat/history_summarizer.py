@@ -5,10 +5,8 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
-from strands import Agent
-
 from src.chat.chat_logger import TurnRecord
-from src.chat.models.provider import get_model
+from src.chat.models.pool import SessionPool
 
 
 @dataclass
@@ -21,8 +19,8 @@ class SummaryUpdate:
 class HistorySummarizer:
     """Maintains a bounded semantic summary of turns that fall out of the live window."""
 
-    def __init__(self):
-        self._model = None
+    def __init__(self, pool: SessionPool | None = None):
+        self._pool = pool or SessionPool()
         self._system_prompt = (
             "You compress older multi-character dialogue into a compact continuity brief for an RPG-style chat. "
             "Preserve only story-relevant state: goals, commitments, revealed facts, tensions, emotional shifts, "
@@ -45,15 +43,7 @@ class HistorySummarizer:
         return SummaryUpdate(text=summary, tokens=tokens, raw=raw)
 
     def _call(self, prompt: str) -> tuple[str, int]:
-        if self._model is None:
-            self._model = get_model()
-        agent = Agent(
-            system_prompt=self._system_prompt,
-            model=self._model,
-            tools=[],
-            callback_handler=None,
-        )
-        response = agent(prompt)
+        response = self._pool.invoke("summarizer", self._system_prompt, prompt)
         text = str(response).strip()
         return text, _extract_tokens(response)
 
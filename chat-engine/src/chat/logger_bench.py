@@ -0,0 +1,111 @@
+"""Persistence benchmark — autosave cost per turn over a synthetic turn stream.
+
+Feeds N synthetic turns through a ChatLogger and, after every turn, saves the
+transcript and run log the way ChatSession._autosave does. Runs twice: once with
+the incremental writers and once with a full rewrite of both files per turn (the
+old behaviour), then prints the mean save time per block of turns and checks
+that both runs produced identical files (footer trailer included).
+
+Usage:
+    python -m src.chat.logger_bench
+    python -m src.chat.logger_bench --turns 2000 --block 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.chat.chat_logger import ChatLogger, read_output
+
+_SPEAKERS = ["Lyra Voss", "Brother Aldric", "Mira", "The Warden"]
+_WORDS = (
+    "ash ember vault oath stone lantern ruin whisper blade shadow gate conclave "
+    "memory river iron doubt promise silence bell crown"
+).split()
+
+
+def _synthetic_turns(n: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    turns = []
+    for i in range(n):
+        speaker = rng.choice(_SPEAKERS)
+        text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(15, 60))).capitalize() + "."
+        if i and i % 17 == 0:
+            turns.append(dict(speaker=speaker, text=text, generator="human",
+                              rule="human_injection", cmd=f"[as {speaker}] {text}"))
+        else:
+            note = "Raise the stakes" if i % 29 == 0 else None
+            turns.append(dict(speaker=speaker, text=text, generator="gm", rule="round_robin",
+                              tokens=rng.randint(40, 160), director_note=note))
+    return turns
+
+
+def _full_rewrite(logger: ChatLogger, transcript: str, runlog: str) -> None:
+    """Pre-incremental autosave: render every turn and rewrite both files."""
+    for path in (transcript, runlog):
+        logger._files.pop(path, None)
+    logger.save_transcript(transcript)
+    logger.save_runlog(runlog, end_reason="in progress")
+
+
+def _incremental(logger: ChatLogger, transcript: str, runlog: str) -> None:
+    logger.save_transcript(transcript)
+    logger.save_runlog(runlog, end_reason="in progress")
+
+
+def _run(turns: list[dict], out_dir: Path, save) -> list[float]:
+    logger = ChatLogger("Logger bench", "examples/bench.md", "bench")
+    logger._started_at = "2000-01-01T00:00:00"
+    transcript = str(out_dir / "transcript.md")
+    runlog = str(out_dir / "runlog.md")
+    timings = []
+    for t in turns:
+        logger.append_turn(**t)
+        start = time.perf_counter()
+        save(logger, transcript, runlog)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _block_means(timings: list[float], block: int) -> list[float]:
+    return [sum(timings[i:i + block]) / len(timings[i:i + block]) for i in range(0, len(timings), block)]
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Benchmark per-turn transcript/runlog persistence")
+    ap.add_argument("--turns", type=int, default=1000, help="synthetic turns to stream (default 1000)")
+    ap.add_argument("--block", type=int, default=100, help="turns per reported block (default 100)")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    turns = _synthetic_turns(args.turns, args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp)
+        files = ("transcript.md", "runlog.md")
+        full = _run(turns, out_dir, _full_rewrite)
+        full_text = [read_output(str(out_dir / name)) for name in files]
+        for path in out_dir.iterdir():
+            path.unlink()
+        inc = _run(turns, out_dir, _incremental)
+        identical = full_text == [read_output(str(out_dir / name)) for name in files]
+
+    print(f"{args.turns} turns, autosave after each (transcript + run log)\n")
+    print(f"{'turns':>13} | {'full rewrite':>12} | {'incremental':>12} | speedup")
+    print("-" * 56)
+    for i, (f, n) in enumerate(zip(_block_means(full, args.block), _block_means(inc, args.block))):
+        lo, hi = i * args.block + 1, min((i + 1) * args.block, args.turns)
+        print(f"{lo:>5}–{hi:<7} | {f * 1e3:>9.3f} ms | {n * 1e3:>9.3f} ms | {f / n:>6.1f}×")
+    print("-" * 56)
+    print(f"{'total':>13} | {sum(full):>10.3f} s | {sum(inc):>10.3f} s | {sum(full) / sum(inc):>6.1f}×")
+    print(f"\nOutput files identical: {'yes' if identical else 'NO'}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,19 @@ from __future__ import annotations
 
 import re
 import sys
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
-from src.chat.chat_logger import ChatLogger
+from src.chat.chat_logger import ChatLogger, estimate_tokens
 from src.chat.gm_agent import GMAgent
 from src.chat.history_summarizer import HistorySummarizer, format_history_with_summary
-from src.chat.models.provider import context_limit, history_window_override, model_label
+from src.chat.models.pool import SessionPool
+from src.chat.models.provider import context_limit, context_limit_override, history_window_override, model_label, speculation_enabled
 from src.chat.orchestrator import ChatOrchestrator
 from src.chat.orchestrator_agent import OrchestratorAgent
 from src.chat.parser import CharacterCard, ParsedChat, parse_chat_file
@@ -37,6 +44,36 @@ _HELP = """\
   /help            show this message"""
 
 
+# ---------------------------------------------------------------------------
+# History budgeting
+# ---------------------------------------------------------------------------
+
+_MIN_HISTORY_TURNS    = 2    # always show at least this many recent turns, whatever the budget
+_TURN_EXTRAS_TOKENS   = 150  # phase guidance, tone hint, director note and instructions
+
+
+# ---------------------------------------------------------------------------
+# Turn plan — everything decided before the GM call
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _TurnPlan:
+    turn_index: int             # len(turns) when planned — a plan is only valid for that history
+    speaker: str | None         # None = llm mode, the GM picks the speaker
+    rule: str
+    prompt: str
+    director_note: str | None
+    debt: dict[str, float] | None = None  # orchestrator debt before selection, for rollback
+
+
+@dataclass
+class _Speculation:
+    """Next turn generated in the background while the current one is being read."""
+    planned: threading.Event
+    future: Future
+    plan: _TurnPlan | None = None
+
+
 # ---------------------------------------------------------------------------
 # ChatSession
 # ---------------------------------------------------------------------------
@@ -44,10 +81,19 @@ _HELP = """\
 class ChatSession:
     """Owns all runtime state for one chat session."""
 
-    def __init__(self, chat: ParsedChat, input_path: str):
+    def __init__(
+        self,
+        chat: ParsedChat,
+        input_path: str,
+        read_input: Callable[[str], str] | None = None,
+        output_dir: str | None = None,
+    ):
+        """read_input replaces the terminal prompt (headless drivers); output_dir
+        overrides where the transcript and run log are written."""
         self.chat        = chat
         self.config      = chat.config
         self.input_path  = input_path
+        self._read_input = read_input or _read_input
 
         # Env var overrides .md file value — lets you tune for local vs remote
         # without editing the scenario file.
@@ -60,9 +106,15 @@ class ChatSession:
             input_file=input_path,
             model_label=model_label(),
         )
-        self.history_summarizer = HistorySummarizer() if chat.config.history_summary_chars > 0 else None
+        # One model client + reusable agents shared by the GM and the summarizer
+        self.pool = SessionPool()
+        self.history_summarizer = HistorySummarizer(self.pool) if chat.config.history_summary_chars > 0 else None
         self.history_summary = ""
         self._summarized_turns = 0
+        # Background summary refresh (see _refresh_history_summary)
+        self._summary_lock = threading.Lock()
+        self._summary_job: Future | None = None
+        self._summary_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chat-summary")
         self.planner = ChatPlanner(chat.characters, chat.phases)
         self._llm_combined = chat.config.turn_selection == "llm"
         if chat.config.turn_selection == "llm":
@@ -76,6 +128,15 @@ class ChatSession:
             scenario=chat.scenario,
             characters=chat.characters,
             config=chat.config,
+            pool=self.pool,
+        )
+        # Everything in a turn prompt except history and summary, estimated once
+        card_chars = max(
+            (len(c.description or "") + len(c.personality or "") + len(c.speech_style or "") + len(c.backstory or ""))
+            for c in chat.characters
+        )
+        self._fixed_prompt_tokens = (
+            estimate_tokens(self.gm.system_prompt) + card_chars // 4 + _TURN_EXTRAS_TOKENS
         )
 
         # Mutable loop state
@@ -85,10 +146,27 @@ class ChatSession:
         self.pending_director: str | None = None
         self.end_reason       = "max turns reached"
 
+        # Speculative next turn (see _speculate) — discarded on any human steering
+        self._speculate_on = speculation_enabled()
+        self._speculation: _Speculation | None = None
+        self.speculation_hits = 0
+        self.speculation_misses = 0
+
+        # Wall time per stage, one entry per call (read by src/chat/simulate.py).
+        # "turn" is what the user waits for: from Enter to the printed line.
+        self.timings: dict[str, list[float]] = {
+            "turn": [], "orchestrator": [], "gm": [], "summarizer": [], "autosave": [],
+        }
+
         # Resolve output paths once at init so autosave doesn't recompute each turn
-        root = Path(input_path).parent.parent
-        self._transcript_path = str(root / chat.meta.output_transcript)
-        self._runlog_path     = str(root / chat.meta.output_runlog)
+        if output_dir:
+            root = Path(output_dir)
+            self._transcript_path = str(root / Path(chat.meta.output_transcript).name)
+            self._runlog_path     = str(root / Path(chat.meta.output_runlog).name)
+        else:
+            root = Path(input_path).parent.parent
+            self._transcript_path = str(root / chat.meta.output_transcript)
+            self._runlog_path     = str(root / chat.meta.output_runlog)
 
     # -----------------------------------------------------------------------
     # Main loop
@@ -130,115 +208,232 @@ class ChatSession:
     # GM turn
     # -----------------------------------------------------------------------
 
+    @contextmanager
+    def _timed(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage].append(time.perf_counter() - start)
+
     def _gm_turn(self) -> None:
+        with self._timed("turn"):
+            committed = self._gm_turn_inner()
+        if committed:
+            self._autosave()
+
+    def _gm_turn_inner(self) -> bool:
+        spec = self._take_speculation()
+        if spec is not None:
+            plan, future = spec.plan, spec.future
+        else:
+            plan, future = self._plan_turn(), None
+
+        try:
+            result = future.result() if future is not None else self._run_plan(plan)
+        except Exception as exc:
+            print(f"\n[GM error: {exc}]")
+            print("  Options: Enter = retry | /stop = quit")
+            raw = self._read_input("").strip()
+            if raw == "/stop":
+                self.stopped    = True
+                self.end_reason = "user /stop (after GM error)"
+            return False
+
+        speaker = plan.speaker or result.speaker
+        self.logger.append_turn(
+            speaker       = speaker,
+            text          = result.dialogue,
+            generator     = "gm",
+            rule          = plan.rule,
+            tokens        = result.tokens,
+            director_note = plan.director_note,
+        )
+
+        _print_turn(self.logger.turn_count(), speaker, result.dialogue)
+        self._speculate()
+        return True
+
+    def _plan_turn(self) -> _TurnPlan:
+        """Pick the speaker and build the GM prompt for the next turn.
+
+        Consumes force_speaker and pending_director.
+        """
+        with self._timed("orchestrator"):
+            return self._plan_turn_inner()
+
+    def _plan_turn_inner(self) -> _TurnPlan:
         turns   = self.logger.turns
         history = self._build_history_context(turns)
         phase_context = self._build_turn_guidance(turns)
         director_used      = self.pending_director
         self.pending_director = None
+        forced = self.force_speaker
+        self.force_speaker = None
 
         if self._llm_combined:
-            fixed_speaker = self.force_speaker or self._opening_speaker(turns)
-            self.force_speaker = None
-
-            try:
-                if fixed_speaker:
-                    prompt = self.gm.build_turn_prompt(
-                        history=history,
-                        speaker=fixed_speaker,
-                        director_note=director_used,
-                        phase_context=phase_context,
-                    )
-                    result = self.gm.generate(prompt, fixed_speaker)
-                    speaker = fixed_speaker
-                    rule = "forced" if turns and fixed_speaker == self.force_speaker else "opening_turn"
-                else:
-                    prompt = self.gm.build_selected_turn_prompt(
-                        history=history,
-                        available_speakers=[c.name for c in self.chat.characters],
-                        phase_context=phase_context,
-                        director_note=director_used,
-                    )
-                    result = self.gm.generate_selected_turn(
-                        prompt,
-                        [c.name for c in self.chat.characters],
-                    )
-                    speaker = result.speaker
-                    rule = "llm_combined_turn"
-            except Exception as exc:
-                print(f"\n[GM error: {exc}]")
-                print("  Options: Enter = retry | /stop = quit")
-                raw = _read_input().strip()
-                if raw == "/stop":
-                    self.stopped    = True
-                    self.end_reason = "user /stop (after GM error)"
-                return
-        else:
-            sel     = self.orc.select_next_speaker(turns, self.force_speaker)
-            self.force_speaker = None
-            tone    = self.orc.get_tone_hint(turns, sel.speaker)
-            prompt  = self.gm.build_turn_prompt(
-                history        = history,
-                speaker        = sel.speaker,
-                tone_hint      = tone,
-                director_note  = director_used,
-                phase_context  = phase_context,
+            fixed_speaker = forced or self._opening_speaker(turns)
+            if fixed_speaker:
+                prompt = self.gm.build_turn_prompt(
+                    history=history,
+                    speaker=fixed_speaker,
+                    director_note=director_used,
+                    phase_context=phase_context,
+                )
+                rule = "forced" if forced else "opening_turn"
+                return _TurnPlan(len(turns), fixed_speaker, rule, prompt, director_used)
+            prompt = self.gm.build_selected_turn_prompt(
+                history=history,
+                available_speakers=[c.name for c in self.chat.characters],
+                phase_context=phase_context,
+                director_note=director_used,
             )
+            return _TurnPlan(len(turns), None, "llm_combined_turn", prompt, director_used)
+
+        debt    = self.orc.debt_snapshot()
+        sel     = self.orc.select_next_speaker(turns, forced)
+        tone    = self.orc.get_tone_hint(turns, sel.speaker)
+        prompt  = self.gm.build_turn_prompt(
+            history        = history,
+            speaker        = sel.speaker,
+            tone_hint      = tone,
+            director_note  = director_used,
+            phase_context  = phase_context,
+        )
+        return _TurnPlan(len(turns), sel.speaker, sel.rule, prompt, director_used, debt)
+
+    def _run_plan(self, plan: _TurnPlan):
+        with self._timed("gm"):
+            return self._run_plan_inner(plan)
+
+    def _run_plan_inner(self, plan: _TurnPlan):
+        if plan.speaker is None:
+            return self.gm.generate_selected_turn(plan.prompt, [c.name for c in self.chat.characters])
+        return self.gm.generate(plan.prompt, plan.speaker)
+
+    # -----------------------------------------------------------------------
+    # Speculative next turn
+    # -----------------------------------------------------------------------
+    #
+    # As soon as a turn is displayed, the next one is planned and generated on a
+    # background thread while the human reads (or while autosave runs in
+    # unattended sessions). Speaker selection is deterministic, so if the human
+    # just presses Enter the speculative line is exactly what _gm_turn would have
+    # produced and is committed as-is. Any steering — [as Name], [director], /next —
+    # discards it first and rolls back the orchestrator's speaking debt.
+
+    def _speculate(self) -> None:
+        if not self._speculate_on or self.stopped or self._at_hard_turn_limit():
+            return
+        spec = _Speculation(planned=threading.Event(), future=Future())
 
+        def work() -> None:
             try:
-                result = self.gm.generate(prompt, sel.speaker)
-            except Exception as exc:
-                print(f"\n[GM error: {exc}]")
-                print("  Options: Enter = retry | /stop = quit")
-                raw = _read_input().strip()
-                if raw == "/stop":
-                    self.stopped    = True
-                    self.end_reason = "user /stop (after GM error)"
+                spec.plan = self._plan_turn()
+            except BaseException as exc:
+                spec.future.set_exception(exc)
                 return
+            finally:
+                spec.planned.set()
+            try:
+                spec.future.set_result(self._run_plan(spec.plan))
+            except BaseException as exc:
+                spec.future.set_exception(exc)
 
-            speaker = sel.speaker
-            rule = sel.rule
-
-        self.logger.append_turn(
-            speaker       = speaker,
-            text          = result.dialogue,
-            generator     = "gm",
-            rule          = rule,
-            tokens        = result.tokens,
-            director_note = director_used,
-        )
+        self._speculation = spec
+        threading.Thread(target=work, name="chat-speculate", daemon=True).start()
 
-        _print_turn(self.logger.turn_count(), speaker, result.dialogue)
-        self._autosave()
+    def _take_speculation(self) -> _Speculation | None:
+        """Return the in-flight speculation if it is still valid for the current state."""
+        spec = self._speculation
+        if spec is None:
+            return None
+        spec.planned.wait()
+        if (
+            spec.plan is None
+            or spec.plan.turn_index != self.logger.turn_count()
+            or self.force_speaker
+            or self.pending_director
+        ):
+            self._discard_speculation()
+            return None
+        self._speculation = None
+        self.speculation_hits += 1
+        return spec
+
+    def _discard_speculation(self) -> None:
+        """Drop the speculative turn. Waits only for planning, never for the GM call."""
+        spec = self._speculation
+        if spec is None:
+            return
+        self._speculation = None
+        spec.planned.wait()
+        if spec.plan is not None and spec.plan.debt is not None:
+            self.orc.restore_debt(spec.plan.debt)
+        self.speculation_misses += 1
 
     def _build_history_context(self, turns) -> str:
         self._refresh_history_summary(turns)
-        recent_history = self.logger.get_history(self.config.history_window)
-        return format_history_with_summary(self.history_summary, recent_history)
+        with self._summary_lock:
+            summary, summarized = self.history_summary, self._summarized_turns
+        window = self.config.history_window
+        if self.history_summarizer and window > 0:
+            # Raw tail = everything the summary doesn't cover yet, so turns aged out
+            # while a refresh is in flight stay visible verbatim (bounded at 2× window).
+            window = min(max(window, len(turns) - summarized), 2 * window)
+        elif window <= 0:
+            window = len(turns)
+        # With CHAT_ENGINE_CONTEXT_LIMIT set explicitly, never let raw history push the
+        # prompt past it — O(log n) on the logger's running token total, nothing is
+        # re-rendered. Unset, the limit only drives the startup warning.
+        limit = context_limit_override()
+        if limit is not None:
+            budget = limit - self._fixed_prompt_tokens - estimate_tokens(summary)
+            window = max(min(window, self.logger.turns_within(budget)), _MIN_HISTORY_TURNS)
+        recent_history = self.logger.get_history(window)
+        return format_history_with_summary(summary, recent_history)
+
+    # -----------------------------------------------------------------------
+    # Rolling history summary
+    # -----------------------------------------------------------------------
+    #
+    # Turns that age out of history_window are folded into the summary by the
+    # summarizer on a background thread, working on a snapshot of those turns and
+    # the summary it extends. Until it finishes, prompts use the previous summary
+    # plus the un-summarized turns verbatim; the result is swapped in (summary and
+    # covered-turn count together) as soon as it is ready. One refresh runs at a
+    # time; turns that age out meanwhile go into the next one.
 
     def _refresh_history_summary(self, turns) -> None:
         if not self.history_summarizer or self.config.history_window <= 0:
             return
 
         cutoff = max(0, len(turns) - self.config.history_window)
-        if cutoff <= self._summarized_turns:
-            return
-
-        turns_to_summarize = turns[self._summarized_turns:cutoff]
-        if not turns_to_summarize:
-            return
-
-        try:
-            update = self.history_summarizer.update_summary(
-                self.history_summary,
+        with self._summary_lock:
+            if self._summary_job is not None or cutoff <= self._summarized_turns:
+                return
+            start, previous = self._summarized_turns, self.history_summary
+            turns_to_summarize = list(turns[start:cutoff])
+            job = self._summary_pool.submit(
+                self._summarize,
+                previous,
                 turns_to_summarize,
                 self.config.history_summary_chars,
             )
-        except Exception:
-            return
+            self._summary_job = job
+        job.add_done_callback(lambda f: self._swap_summary(f, start, cutoff))
 
-        self.history_summary = update.text
-        self._summarized_turns = cutoff
+    def _summarize(self, previous: str, turns, max_chars: int):
+        with self._timed("summarizer"):
+            return self.history_summarizer.update_summary(previous, turns, max_chars)
+
+    def _swap_summary(self, job: Future, start: int, cutoff: int) -> None:
+        with self._summary_lock:
+            self._summary_job = None
+            if job.exception() is not None or self._summarized_turns != start:
+                return  # failed (retried on the next turn) or history was rewound meanwhile
+            self.history_summary = job.result().text
+            self._summarized_turns = cutoff
 
     def _opening_speaker(self, turns) -> str | None:
         if turns:
@@ -310,7 +505,7 @@ class ChatSession:
         print(_DIV)
 
         while True:
-            raw = _read_input("  Enter to continue, or type a command: ").strip()
+            raw = self._read_input("  Enter to continue, or type a command: ").strip()
 
             # ---- Enter: continue ----------------------------------------
             if not raw:
@@ -344,6 +539,7 @@ class ChatSession:
                 name = raw[6:].strip()
                 char = _find_character(name, self.chat.characters)
                 if char:
+                    self._discard_speculation()
                     self.force_speaker = char.name
                     print(f"  → {char.name} will speak next.")
                 else:
@@ -367,6 +563,7 @@ class ChatSession:
                 if not char.can_be_taken_over:
                     print(f"  {char.name} cannot be taken over (can_be_taken_over: false).")
                     continue
+                self._discard_speculation()
                 self.logger.append_turn(
                     speaker   = char.name,
                     text      = text,
@@ -375,6 +572,7 @@ class ChatSession:
                     cmd       = raw,
                 )
                 _print_turn(self.logger.turn_count(), char.name, text)
+                self._speculate()
                 self._autosave()
                 return
 
@@ -385,6 +583,7 @@ class ChatSession:
                 if not note:
                     print("  No director note text provided.")
                     continue
+                self._discard_speculation()
                 self.pending_director = note
                 print("  Director note saved — will be passed to GM on next turn.")
                 return
@@ -399,15 +598,21 @@ class ChatSession:
 
     def _autosave(self) -> None:
         """Write both output files after every turn so nothing is lost on crash."""
-        self.logger.save_transcript(self._transcript_path)
-        self.logger.save_runlog(self._runlog_path, end_reason="in progress")
+        with self._timed("autosave"):
+            self.logger.save_transcript(self._transcript_path)
+            self.logger.save_runlog(self._runlog_path, end_reason="in progress")
 
     def _end_session(self) -> None:
+        self._discard_speculation()
+        # Let an in-flight summary finish (and swap in) before the final saves
+        self._summary_pool.shutdown(wait=True)
+        self.pool.close()
         print(f"\n{_DIV}")
         print(f"Session ended — {self.end_reason}")
 
         self.logger.save_transcript(self._transcript_path)
         self.logger.save_runlog(self._runlog_path, end_reason=self.end_reason)
+        self.logger.close()
 
         print(f"Transcript  → {self._transcript_path}")
         print(f"Run log     → {self._runlog_path}")
@@ -416,6 +621,8 @@ class ChatSession:
         print(f"\nTotal turns : {self.logger.turn_count()}")
         for name, count in stats.items():
             print(f"  {name:<20} {count} turns")
+        if self.speculation_hits or self.speculation_misses:
+            print(f"Speculative turns: {self.speculation_hits} used, {self.speculation_misses} discarded")
         print(_DIV)
 
 
@@ -0,0 +1,124 @@
+"""Session pool — one model client and reusable Strands agents per chat session.
+
+GMAgent and HistorySummarizer used to build a new Agent (and, on first use, a
+new model) for every call, and OpenAIModel built from client_args opens and
+closes a fresh AsyncOpenAI client — new TCP/TLS connection — per request.
+
+SessionPool keeps, for the lifetime of one session:
+    - one model; for OpenAI-compatible providers it wraps a single AsyncOpenAI
+      client, so the GM and the summarizer share one keep-alive connection pool
+    - idle agents per role ("gm", "summarizer"), built once with their system
+      prompt and reset between calls: conversation cleared, fresh metrics
+
+Strands' Agent.__call__ runs each call on a throwaway event loop, which an
+httpx connection pool cannot survive. All pooled calls therefore go through
+SessionPool.invoke(), which runs agent.invoke_async on one persistent loop
+thread shared by every pool in the process.
+
+Agents reject concurrent calls, so each in-flight call leases its own agent —
+a speculative GM turn still running when the next one starts simply gets a
+second GM agent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from strands import Agent
+from strands.agent.conversation_manager import NullConversationManager
+from strands.telemetry.metrics import EventLoopMetrics
+
+from src.chat.models.provider import gen_params, get_model, openai_compat_config
+
+
+# ---------------------------------------------------------------------------
+# Persistent event loop
+# ---------------------------------------------------------------------------
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="chat-engine-llm-loop", daemon=True).start()
+        return _loop
+
+
+def _run(coro):
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+# ---------------------------------------------------------------------------
+# SessionPool
+# ---------------------------------------------------------------------------
+
+class SessionPool:
+    """Shared model plus per-role idle agents for one chat session."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._model = None
+        self._client = None
+        self._idle: dict[str, list[Agent]] = defaultdict(list)
+        self._prompts: dict[str, str] = {}
+
+    @property
+    def model(self):
+        """The session's model, built on first use (no credentials needed before that)."""
+        with self._lock:
+            if self._model is None:
+                compat = openai_compat_config()
+                if compat is None:
+                    self._model = get_model()
+                else:
+                    import openai
+                    from strands.models.openai import OpenAIModel
+
+                    self._client = openai.AsyncOpenAI(base_url=compat["base_url"], api_key=compat["api_key"])
+                    self._model = OpenAIModel(client=self._client, model_id=compat["model_id"], params=gen_params())
+            return self._model
+
+    def invoke(self, role: str, system_prompt: str, prompt: str):
+        """Run one stateless call on an idle agent for `role`; returns the AgentResult."""
+        with self._lease(role, system_prompt) as agent:
+            agent.messages.clear()
+            agent.event_loop_metrics = EventLoopMetrics()
+            return _run(agent.invoke_async(prompt))
+
+    def close(self) -> None:
+        """Close the shared HTTP client. The pool rebuilds it if used again."""
+        with self._lock:
+            client, self._client, self._model = self._client, None, None
+            self._idle.clear()
+        if client is not None:
+            _run(client.close())
+
+    @contextmanager
+    def _lease(self, role: str, system_prompt: str):
+        with self._lock:
+            if self._prompts.get(role) != system_prompt:
+                # A role's prompt only changes if a caller rebuilds it; drop stale agents
+                self._prompts[role] = system_prompt
+                self._idle[role].clear()
+            agent = self._idle[role].pop() if self._idle[role] else None
+        if agent is None:
+            agent = Agent(
+                system_prompt=system_prompt,
+                model=self.model,
+                tools=[],
+                callback_handler=None,
+                conversation_manager=NullConversationManager(),
+            )
+        try:
+            yield agent
+        finally:
+            with self._lock:
+                if self._prompts.get(role) == system_prompt and self._model is agent.model:
+                    self._idle[role].append(agent)
@@ -10,7 +10,9 @@ Env vars:
   CHAT_ENGINE_MAX_TOKENS      — max tokens the model may generate per turn (default: 200)
   CHAT_ENGINE_TEMPERATURE     — sampling temperature (default: 0.85)
   CHAT_ENGINE_HISTORY_WINDOW  — overrides history_window from the .md file (optional)
-  CHAT_ENGINE_CONTEXT_LIMIT   — warn at startup if estimated prompt exceeds this token count (default: 3500)
+  CHAT_ENGINE_CONTEXT_LIMIT   — warn at startup if estimated prompt exceeds this token count (default: 3500);
+                                when set explicitly, also trim the oldest raw history turns of any prompt that would
+  CHAT_ENGINE_SPECULATE       — generate the next turn in the background while the current one is read (default: true)
 """
 
 from __future__ import annotations
@@ -42,7 +44,20 @@ def context_limit() -> int:
     return int(os.environ.get("CHAT_ENGINE_CONTEXT_LIMIT", _DEFAULT_CONTEXT_LIMIT))
 
 
-def _gen_params() -> dict:
+def context_limit_override() -> int | None:
+    """Return CHAT_ENGINE_CONTEXT_LIMIT if set, else None (no history trimming)."""
+    val = os.environ.get("CHAT_ENGINE_CONTEXT_LIMIT")
+    if val:
+        return int(val)
+    return None
+
+
+def speculation_enabled() -> bool:
+    """Return False when CHAT_ENGINE_SPECULATE is set to a false-ish value."""
+    return os.environ.get("CHAT_ENGINE_SPECULATE", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def gen_params() -> dict:
     """Read generation parameters from env, applying defaults."""
     return {
         "max_tokens": int(os.environ.get("CHAT_ENGINE_MAX_TOKENS", _DEFAULT_MAX_TOKENS)),
@@ -50,26 +65,36 @@ def _gen_params() -> dict:
     }
 
 
+def openai_compat_config() -> dict | None:
+    """Resolve base_url / model_id / api_key when the provider is OpenAI-compatible.
+
+    Returns None for anthropic and bedrock. Shared by get_model() and the
+    session pool (models/pool.py), which injects one long-lived client.
+    """
+    provider = os.environ.get("CHAT_ENGINE_PROVIDER", "openrouter")
+    if provider == "local":
+        return {
+            "base_url": os.environ.get("CHAT_ENGINE_LOCAL_BASE_URL", "http://localhost:1234/v1"),
+            "model_id": os.environ.get("CHAT_ENGINE_MODEL", "default"),
+            "api_key": "not-needed",
+        }
+    if provider == "openrouter":
+        return {
+            "base_url": "https://openrouter.ai/api/v1",
+            "model_id": os.environ.get("CHAT_ENGINE_MODEL", _OPENROUTER_DEFAULT),
+            "api_key": os.environ["OPENROUTER_API_KEY"],
+        }
+    return None
+
+
 def get_model():
     """Return a Strands model instance for the GM agent."""
     provider = os.environ.get("CHAT_ENGINE_PROVIDER", "openrouter")
-    params = _gen_params()
+    params = gen_params()
 
-    if provider == "local":
-        return _openai_compat(
-            base_url=os.environ.get("CHAT_ENGINE_LOCAL_BASE_URL", "http://localhost:1234/v1"),
-            model_id=os.environ.get("CHAT_ENGINE_MODEL", "default"),
-            api_key="not-needed",
-            params=params,
-        )
-
-    if provider == "openrouter":
-        return _openai_compat(
-            base_url="https://openrouter.ai/api/v1",
-            model_id=os.environ.get("CHAT_ENGINE_MODEL", _OPENROUTER_DEFAULT),
-            api_key=os.environ["OPENROUTER_API_KEY"],
-            params=params,
-        )
+    compat = openai_compat_config()
+    if compat is not None:
+        return _openai_compat(params=params, **compat)
 
     if provider == "anthropic":
         from strands.models import AnthropicModel
@@ -6,6 +6,10 @@ Rules applied in order; first match wins:
   3. Conflict         — last exchange had tension; challenged party responds
   4. Round-Robin      — no clear trigger; rotate, skip last 2 speakers
   5. Fallback         — character with lowest weighted speaking debt speaks
+
+All character triggers are compiled once into a single longest-first
+alternation, so Rule 1 is one regex scan of the last line however many
+characters there are.
 """
 
 from __future__ import annotations
@@ -76,6 +80,9 @@ class ChatOrchestrator:
         for c in sorted(characters, key=lambda c: min(len(t) for t in c.triggers)):
             for trigger in c.triggers:
                 self._trigger_map[trigger.lower().strip()] = c.name
+        self._trigger_order = {t: i for i, t in enumerate(self._trigger_map)}
+        self._address_all = _address_pattern(self._trigger_map)
+        self._address_excluding: dict[str, re.Pattern | None] = {}  # built on demand
 
         # Weighted debt accumulator for round-robin (Rule 4 / Rule 5)
         # Each time a character speaks, their debt increases by 1/speaking_weight.
@@ -172,28 +179,43 @@ class ChatOrchestrator:
         """Rule 1 — last line names a character or contains a direct question."""
         text_lower = last.text.lower()
 
-        # Find all trigger matches, excluding self-reference
-        hits: dict[str, int] = {}  # char_name → longest matching trigger length
-        for trigger, char_name in self._trigger_map.items():
-            if char_name == last.speaker:
-                continue
-            if re.search(r"\b" + re.escape(trigger) + r"\b", text_lower):
-                if char_name not in hits or len(trigger) > hits[char_name]:
-                    hits[char_name] = len(trigger)
+        # Find all trigger matches, excluding self-reference:
+        # char_name → (longest matching trigger, its trigger_map position)
+        hits: dict[str, tuple[str, int]] = {}
+        if self._address_all is not None:
+            for m in self._address_all.finditer(text_lower):
+                trigger = m.group(1)
+                char_name = self._trigger_map[trigger]
+                if char_name == last.speaker:
+                    # Longest trigger here is the speaker's own — a shorter one
+                    # at the same position may still name someone else
+                    other = self._address_re_excluding(last.speaker)
+                    m = other.match(text_lower, m.start()) if other is not None else None
+                    if m is None:
+                        continue
+                    trigger = m.group(1)
+                    char_name = self._trigger_map[trigger]
+                order = self._trigger_order[trigger]
+                prev = hits.get(char_name)
+                if prev is None:
+                    hits[char_name] = (trigger, order)
+                else:
+                    longest = trigger if len(trigger) > len(prev[0]) else prev[0]
+                    hits[char_name] = (longest, min(order, prev[1]))
 
         if hits:
             # If only one character is addressed, use them
             if len(hits) == 1:
-                name = next(iter(hits))
-                trigger_word = _longest_trigger(self._trigger_map, name, text_lower)
+                name, (trigger_word, _) = next(iter(hits.items()))
                 return TurnSelection(
                     speaker=name,
                     rule="direct_address",
                     reason=f"Last line addressed '{name}' via trigger '{trigger_word}'",
                 )
             # Multiple candidates — prefer the one with the longest (most specific) trigger
-            # e.g. "Brother Aldric" beats "he" — reduces pronoun ambiguity
-            best = max(hits, key=lambda n: hits[n])
+            # e.g. "Brother Aldric" beats "he" — reduces pronoun ambiguity.
+            # Ties go to the character whose trigger comes first in the trigger map.
+            best = max(hits, key=lambda n: (len(hits[n][0]), -hits[n][1]))
             return TurnSelection(
                 speaker=best,
                 rule="direct_address",
@@ -203,7 +225,8 @@ class ChatOrchestrator:
         # No trigger match — check for a bare direct question (no name)
         # Infer the respondent from the most recent prior speaker who isn't the questioner
         if _has_direct_question(last.text) and turns:
-            for turn in reversed(turns[:-1]):
+            for i in range(len(turns) - 2, -1, -1):
+                turn = turns[i]
                 if turn.speaker != last.speaker and turn.speaker in self._char_by_name:
                     return TurnSelection(
                         speaker=turn.speaker,
@@ -307,6 +330,20 @@ class ChatOrchestrator:
                 return c.name
         return self._characters[0].name
 
+    def _address_re_excluding(self, speaker: str) -> re.Pattern | None:
+        if speaker not in self._address_excluding:
+            self._address_excluding[speaker] = _address_pattern(
+                {t: name for t, name in self._trigger_map.items() if name != speaker}
+            )
+        return self._address_excluding[speaker]
+
+    def debt_snapshot(self) -> dict[str, float]:
+        """Copy of the round-robin debt, for rolling back a discarded selection."""
+        return dict(self._debt)
+
+    def restore_debt(self, snapshot: dict[str, float]) -> None:
+        self._debt = dict(snapshot)
+
     def _charge_debt(self, name: str) -> None:
         """Increment weighted debt for the speaker who just took a turn."""
         c = self._char_by_name.get(name)
@@ -329,13 +366,17 @@ class ChatOrchestrator:
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _longest_trigger(trigger_map: dict[str, str], char_name: str, text_lower: str) -> str:
-    """Return the longest trigger that matched char_name in text_lower."""
-    best = ""
-    for trigger, name in trigger_map.items():
-        if name == char_name and trigger in text_lower and len(trigger) > len(best):
-            best = trigger
-    return best
+def _address_pattern(trigger_map: dict[str, str]) -> re.Pattern | None:
+    """One alternation of all triggers, longest first, as a whole-word lookahead.
+
+    The lookahead makes finditer try every position, so overlapping addresses
+    ("aldric" inside "brother aldric") are both seen; group 1 is the longest
+    trigger matching at that position.
+    """
+    triggers = sorted((t for t in trigger_map if t), key=len, reverse=True)
+    if not triggers:
+        return None
+    return re.compile(r"(?=\b(" + "|".join(map(re.escape, triggers)) + r")\b)")
 
 
 # ---------------------------------------------------------------------------
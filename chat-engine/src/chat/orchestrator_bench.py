@@ -0,0 +1,131 @@
+"""Orchestrator benchmark — speaker selection cost over a long, large-cast session.
+
+Builds a synthetic cast (default 50 characters, 3 triggers each: full name,
+first name, title) and a phase plan covering the session, then runs N turns
+(default 2,000) of rules-mode selection exactly as ChatSession does:
+select_next_speaker, get_tone_hint, phase_prompt, then append the turn.
+Turn lines are generated so every rule fires — named addresses (often several
+characters per line), bare questions, tension words, human injections.
+
+Prints the mean per-turn selection time per block of turns; flat numbers mean
+selection cost does not grow with session length. The sequence of selected
+speakers is summarised as a hash so runs can be compared across commits.
+
+Usage:
+    python -m src.chat.orchestrator_bench
+    python -m src.chat.orchestrator_bench --characters 100 --turns 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import random
+import time
+from collections import Counter
+
+from src.chat.chat_logger import ChatLogger
+from src.chat.orchestrator import ChatOrchestrator
+from src.chat.parser import CharacterCard, ChatConfig, ChatPhase
+from src.chat.planner import ChatPlanner
+
+_FIRST = ("Lyra Aldric Mira Corin Sable Tamsin Idris Wren Osric Vela Bram Ysolde Kael Nessa "
+          "Dorian Fenna Rook Elowen Garrick Isolde").split()
+_LAST = "Voss Thorne Ashby Crane Morrow Vance Hale Reyes Quill Dunmore".split()
+_TITLES = ("the scout", "the priest", "the smith", "the captain", "the healer", "the thief",
+           "the warden", "the scholar", "the bard", "the hunter")
+_FILLER = ("the ruins are quiet tonight and the wind carries ash from the east gate "
+           "we should move before the bell tolls again").split()
+_TENSION = ("you're wrong", "enough", "that's not", "i doubt it", "stay out of this")
+
+
+def build_cast(n: int) -> list[CharacterCard]:
+    cast = []
+    for i in range(n):
+        first, last = _FIRST[i % len(_FIRST)], _LAST[(i // len(_FIRST)) % len(_LAST)]
+        name = f"{first} {last}" if i < len(_FIRST) * len(_LAST) else f"{first} {last} {i}"
+        triggers = [name, f"{first} {last[0]}", f"{_TITLES[i % len(_TITLES)]} {i}"]
+        cast.append(CharacterCard(
+            name=name, role="player-character" if i == 0 else "npc", triggers=triggers,
+            description="", personality="", speaking_weight=1.0 if i % 3 else 0.6,
+        ))
+    return cast
+
+
+def build_phases(cast: list[CharacterCard], turns: int, count: int = 10) -> list[ChatPhase]:
+    span = max(1, turns // count)
+    names = [c.name for c in cast]
+    return [
+        ChatPhase(
+            name=f"phase-{i + 1}", start_turn=i * span + 1, end_turn=(i + 1) * span,
+            focus_characters=names[i * 3:(i * 3) + 3],
+            required_characters=names[(i * 5) % len(names):(i * 5) % len(names) + 2],
+            avoid_characters=names[-(i + 1):],
+            max_consecutive_turns=2,
+        )
+        for i in range(count)
+    ]
+
+
+def _line(rng: random.Random, cast: list[CharacterCard]) -> str:
+    words = [rng.choice(_FILLER) for _ in range(rng.randint(12, 30))]
+    for _ in range(rng.choice((0, 0, 1, 1, 2, 3))):
+        words.insert(rng.randrange(len(words)), rng.choice(rng.choice(cast).triggers).lower())
+    if rng.random() < 0.2:
+        words.append(rng.choice(_TENSION))
+    return " ".join(words) + ("?" if rng.random() < 0.25 else ".")
+
+
+def run(characters: int, turns: int, seed: int) -> tuple[list[float], str, Counter]:
+    rng = random.Random(seed)
+    cast = build_cast(characters)
+    config = ChatConfig(max_turns=turns)
+    planner = ChatPlanner(cast, build_phases(cast, turns))
+    orc = ChatOrchestrator(cast, config, planner=planner)
+    logger = ChatLogger("bench", "bench.md")
+
+    timings: list[float] = []
+    rules: Counter = Counter()
+    digest = hashlib.sha1()
+    for _ in range(turns):
+        history = logger.turns
+        start = time.perf_counter()
+        sel = orc.select_next_speaker(history)
+        orc.get_tone_hint(history, sel.speaker)
+        planner.phase_prompt(history)
+        timings.append(time.perf_counter() - start)
+
+        rules[sel.rule] += 1
+        digest.update(f"{sel.speaker}|{sel.rule}\n".encode("utf-8"))
+        if rng.random() < 0.06:
+            human = rng.choice(cast).name
+            logger.append_turn(human, _line(rng, cast), "human", "human_injection")
+        else:
+            logger.append_turn(sel.speaker, _line(rng, cast), "gm", sel.rule)
+    return timings, digest.hexdigest()[:12], rules
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Benchmark rules-mode speaker selection")
+    ap.add_argument("--characters", type=int, default=50)
+    ap.add_argument("--turns", type=int, default=2000)
+    ap.add_argument("--block", type=int, default=250, help="turns per reported block (default 250)")
+    ap.add_argument("--seed", type=int, default=11)
+    args = ap.parse_args(argv)
+
+    timings, digest, rules = run(args.characters, args.turns, args.seed)
+
+    print(f"{args.characters} characters, {args.turns} turns, 10 phases\n")
+    print(f"{'turns':>13} | per-turn selection")
+    print("-" * 36)
+    for i in range(0, len(timings), args.block):
+        block = timings[i:i + args.block]
+        print(f"{i + 1:>5}–{min(i + args.block, args.turns):<7} | {sum(block) / len(block) * 1e6:>9.1f} µs")
+    print("-" * 36)
+    print(f"{'total':>13} | {sum(timings) * 1e3:>9.1f} ms")
+    print("\nRules fired: " + ", ".join(f"{rule} {n}" for rule, n in rules.most_common()))
+    print(f"Selection sequence hash: {digest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 Splits on [section-name] markers, parses each section into its typed structure.
 See CHAT_SCHEMA.md for the full input format specification.
+Tokenizing (and its path + mtime cache) lives in src/chat/scene_format.py.
 """
 
 from __future__ import annotations
@@ -10,6 +11,11 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    from src.chat import scene_format
+except ImportError:  # run as a script: python src/chat/parser.py
+    import scene_format
+
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -90,77 +96,6 @@ class ParseError(Exception):
         super().__init__(f"[{section}]: {message}")
 
 
-# ---------------------------------------------------------------------------
-# Section splitter
-# ---------------------------------------------------------------------------
-
-_SECTION_RE = re.compile(r"^\[([a-z][a-z0-9_-]*)\]\s*$", re.MULTILINE)
-
-
-def _strip_comments(text: str) -> str:
-    """Remove lines whose stripped content starts with '#'."""
-    lines = []
-    for line in text.splitlines():
-        if line.strip().startswith("#"):
-            lines.append("")           # preserve line count for debugging
-        else:
-            lines.append(line)
-    return "\n".join(lines)
-
-
-def _split_sections(text: str) -> dict[str, str]:
-    """Split raw file text into {section_name: body} pairs."""
-    matches = list(_SECTION_RE.finditer(text))
-    if not matches:
-        raise ParseError("file", "No [section] markers found")
-
-    sections: dict[str, str] = {}
-    for i, m in enumerate(matches):
-        name = m.group(1)
-        start = m.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        sections[name] = text[start:end].strip()
-    return sections
-
-
-# ---------------------------------------------------------------------------
-# Key-value parser
-# ---------------------------------------------------------------------------
-
-def _parse_kv(text: str) -> dict[str, str]:
-    """Parse key: value lines with multi-line continuation and YAML '>' folding."""
-    result: dict[str, str] = {}
-    current_key: str | None = None
-    current_lines: list[str] = []
-
-    for line in text.splitlines():
-        if line.strip().startswith("#"):
-            continue
-        kv_match = re.match(r"^([a-z_]+)\s*:\s*(.*)", line)
-        if kv_match:
-            if current_key is not None:
-                result[current_key] = _join_lines(current_lines)
-            current_key = kv_match.group(1)
-            value = kv_match.group(2).strip()
-            current_lines = [] if value == ">" else [value]
-        elif current_key is not None:
-            if line.strip():
-                current_lines.append(line.strip())
-            elif current_lines and current_lines[-1] != "":
-                current_lines.append("")   # paragraph break
-
-    if current_key is not None:
-        result[current_key] = _join_lines(current_lines)
-
-    return result
-
-
-def _join_lines(lines: list[str]) -> str:
-    while lines and lines[-1] == "":
-        lines.pop()
-    return " ".join(l for l in lines if l).strip()
-
-
 # ---------------------------------------------------------------------------
 # Section parsers
 # ---------------------------------------------------------------------------
@@ -297,38 +232,33 @@ def parse_chat_file(file_path: str) -> ParsedChat:
     if not path.exists():
         raise FileNotFoundError(f"Chat input file not found: {file_path}")
 
-    raw = path.read_text(encoding="utf-8")
-    cleaned = _strip_comments(raw)
-    sections = _split_sections(cleaned)
+    tokens = scene_format.load(path, strip_comments=True)
+    sections = tokens.sections
+    if not sections:
+        raise ParseError("file", "No [section] markers found")
 
     for name in ("meta", "chat-config", "world-info", "gm-prompt", "writing-style", "scenario"):
         if name not in sections:
             raise ParseError(name, "Required section missing")
 
-    char_sections = sorted(
-        [(n, c) for n, c in sections.items() if re.match(r"^character-\d+$", n)],
-        key=lambda x: int(x[0].split("-")[1]),
-    )
+    char_sections = tokens.numbered("character")
     if len(char_sections) < 2:
         raise ParseError("character-*", "At least 2 character cards are required")
 
-    phase_sections = sorted(
-        [(n, c) for n, c in sections.items() if re.match(r"^phase-\d+$", n)],
-        key=lambda x: int(x[0].split("-")[1]),
-    )
+    phase_sections = tokens.numbered("phase")
 
-    config = _parse_config(_parse_kv(sections["chat-config"]))
-    phases = [_parse_phase(n, _parse_kv(c)) for n, c in phase_sections]
+    config = _parse_config(tokens.kv("chat-config"))
+    phases = [_parse_phase(n, tokens.kv(n)) for n, _ in phase_sections]
     _validate_phases(phases, config)
 
     return ParsedChat(
-        meta=_parse_meta(_parse_kv(sections["meta"])),
+        meta=_parse_meta(tokens.kv("meta")),
         config=config,
         world_info=sections["world-info"],
         gm_prompt=sections["gm-prompt"],
         writing_style=sections["writing-style"],
         scenario=sections["scenario"],
-        characters=[_parse_character(n, _parse_kv(c)) for n, c in char_sections],
+        characters=[_parse_character(n, tokens.kv(n)) for n, _ in char_sections],
         phases=phases,
     )
 
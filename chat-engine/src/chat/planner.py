@@ -2,10 +2,16 @@
 
 Keeps the current architecture intact by adding soft planning pressure on top of
 speaker selection and by exposing phase context for the GM prompt.
+
+Per-phase speaker counts and the current speaker streak are kept incrementally:
+each call folds in only the turns appended since the previous call, so the cost
+of a selection does not grow with session length. Phase lookup is a bisect over
+precomputed turn-range segments.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 
 from src.chat.chat_logger import TurnRecord
@@ -52,23 +58,31 @@ class ChatPlanner:
         self._characters = characters
         self._char_by_name = {c.name: c for c in characters}
         self._phases = sorted(phases, key=lambda phase: phase.start_turn)
+        self._snapshots = [_snapshot(phase) for phase in self._phases]
+        self._snapshot_index = {id(snap): i for i, snap in enumerate(self._snapshots)}
+
+        # Turn-range segments: within [bounds[i], bounds[i+1]) the set of phases
+        # containing a turn is fixed. _segment_phase is the phase reported for the
+        # turn (first by start_turn, as before); _segment_members all phases whose
+        # counts the turn adds to (phases may overlap).
+        bounds = sorted({p.start_turn for p in self._phases} | {p.end_turn + 1 for p in self._phases})
+        self._bounds = bounds
+        self._segment_members: list[tuple[int, ...]] = []
+        for lo in bounds:
+            self._segment_members.append(tuple(
+                i for i, p in enumerate(self._phases) if p.start_turn <= lo <= p.end_turn
+            ))
+
+        # Incremental turn statistics (see _sync)
+        self._phase_speaker_counts: list[dict[str, int]] = [{} for _ in self._phases]
+        self._synced = 0
+        self._synced_last: TurnRecord | None = None
+        self._streak_speaker: str | None = None
+        self._streak = 0
 
     def phase_for_turn(self, turn_number: int) -> PhaseSnapshot | None:
-        for phase in self._phases:
-            if phase.start_turn <= turn_number <= phase.end_turn:
-                return PhaseSnapshot(
-                    name=phase.name,
-                    start_turn=phase.start_turn,
-                    end_turn=phase.end_turn,
-                    goal=phase.goal,
-                    pace=phase.pace,
-                    focus_characters=tuple(phase.focus_characters),
-                    required_characters=tuple(phase.required_characters),
-                    avoid_characters=tuple(phase.avoid_characters),
-                    guidance=phase.guidance,
-                    max_consecutive_turns=phase.max_consecutive_turns,
-                )
-        return None
+        index = self._phase_index(turn_number)
+        return self._snapshots[index] if index is not None else None
 
     def current_phase(self, turns: list[TurnRecord]) -> PhaseSnapshot | None:
         return self.phase_for_turn(len(turns) + 1)
@@ -134,24 +148,73 @@ class ChatPlanner:
             return f"phase '{phase.name}' focuses on {speaker}"
         return f"phase '{phase.name}' pacing bias applied"
 
+    # -----------------------------------------------------------------------
+    # Incremental statistics
+    # -----------------------------------------------------------------------
+
+    def _phase_index(self, turn_number: int) -> int | None:
+        seg = bisect_right(self._bounds, turn_number) - 1
+        if seg < 0:
+            return None
+        members = self._segment_members[seg]
+        return members[0] if members else None
+
+    def _sync(self, turns: list[TurnRecord]) -> None:
+        """Fold turns appended since the last call into the counters.
+
+        Recounts from scratch if the list is not an extension of what was seen
+        (shorter, or a different record at the last seen position).
+        """
+        seen = self._synced
+        if seen > len(turns) or (seen and turns[seen - 1] is not self._synced_last):
+            self._phase_speaker_counts = [{} for _ in self._phases]
+            self._streak_speaker, self._streak = None, 0
+            seen = 0
+        for turn in turns[seen:] if seen < len(turns) else ():
+            seg = bisect_right(self._bounds, turn.turn_number) - 1
+            if seg >= 0:
+                for i in self._segment_members[seg]:
+                    counts = self._phase_speaker_counts[i]
+                    counts[turn.speaker] = counts.get(turn.speaker, 0) + 1
+            if turn.speaker == self._streak_speaker:
+                self._streak += 1
+            else:
+                self._streak_speaker, self._streak = turn.speaker, 1
+        self._synced = len(turns)
+        self._synced_last = turns[-1] if turns else None
+
     def _phase_counts(
         self,
         turns: list[TurnRecord],
         phase: PhaseSnapshot,
     ) -> dict[str, int]:
-        counts: dict[str, int] = {}
-        for turn in turns:
-            if phase.start_turn <= turn.turn_number <= phase.end_turn:
-                counts[turn.speaker] = counts.get(turn.speaker, 0) + 1
-        return counts
+        index = self._snapshot_index.get(id(phase))
+        if index is None:  # a snapshot this planner didn't build — count directly
+            counts: dict[str, int] = {}
+            for turn in turns:
+                if phase.start_turn <= turn.turn_number <= phase.end_turn:
+                    counts[turn.speaker] = counts.get(turn.speaker, 0) + 1
+            return counts
+        self._sync(turns)
+        return self._phase_speaker_counts[index]
 
     def _speaker_streak(self, turns: list[TurnRecord], speaker: str | None) -> int:
         if not turns or not speaker:
             return 0
-
-        streak = 0
-        for turn in reversed(turns):
-            if turn.speaker != speaker:
-                break
-            streak += 1
-        return streak
\ No newline at end of file
+        self._sync(turns)
+        return self._streak if speaker == self._streak_speaker else 0
+
+
+def _snapshot(phase: ChatPhase) -> PhaseSnapshot:
+    return PhaseSnapshot(
+        name=phase.name,
+        start_turn=phase.start_turn,
+        end_turn=phase.end_turn,
+        goal=phase.goal,
+        pace=phase.pace,
+        focus_characters=tuple(phase.focus_characters),
+        required_characters=tuple(phase.required_characters),
+        avoid_characters=tuple(phase.avoid_characters),
+        guidance=phase.guidance,
+        max_consecutive_turns=phase.max_consecutive_turns,
+    )
@@ -0,0 +1,104 @@
+"""Agent pool benchmark — per-call overhead of fresh agents vs the session pool.
+
+Starts a stub OpenAI-compatible server on localhost (no latency, so wall time is
+all client-side overhead) and makes the same sequence of GM and summarizer
+calls two ways:
+
+    fresh   — the old GMAgent._call / HistorySummarizer._call: one model per
+              role, a new Strands Agent per call, agent(prompt) (new event loop
+              and new AsyncOpenAI client, i.e. new TCP connection, per request)
+    pooled  — SessionPool.invoke(): reused agents, one shared client
+
+Prints mean / p50 / p95 per-call time and the number of TCP connections the
+server saw.
+
+Usage:
+    python -m src.chat.pool_bench
+    python -m src.chat.pool_bench --calls 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+
+from strands import Agent
+
+from src.chat.models.pool import SessionPool
+from src.chat.models.provider import get_model
+from src.chat.stub_server import StubServer
+
+_SYSTEM = {
+    "gm": "You are the Game Master. You voice every character in this scene. " * 20,
+    "summarizer": "You compress older multi-character dialogue into a continuity brief. " * 6,
+}
+
+
+def _prompt(i: int) -> tuple[str, str]:
+    if i % 5 == 4:
+        return "summarizer", f"EXISTING SUMMARY:\n(none yet)\n\nNEWLY AGED-OUT TURNS:\nLyra: \"turn {i}\""
+    return "gm", f"CHAT HISTORY SO FAR:\nLyra: \"turn {i}\"\n\nNEXT SPEAKER: Mira\n\nWrite Mira's next dialogue turn."
+
+
+def _fresh(calls: int) -> list[float]:
+    models = {role: get_model() for role in _SYSTEM}
+    timings = []
+    for i in range(calls):
+        role, prompt = _prompt(i)
+        start = time.perf_counter()
+        agent = Agent(system_prompt=_SYSTEM[role], model=models[role], tools=[], callback_handler=None)
+        str(agent(prompt))
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _pooled(calls: int) -> list[float]:
+    pool = SessionPool()
+    timings = []
+    try:
+        for i in range(calls):
+            role, prompt = _prompt(i)
+            start = time.perf_counter()
+            str(pool.invoke(role, _SYSTEM[role], prompt))
+            timings.append(time.perf_counter() - start)
+    finally:
+        pool.close()
+    return timings
+
+
+def _row(label: str, timings: list[float], connections: int) -> str:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (f"{label:<8} | {statistics.mean(timings) * 1e3:>8.2f} ms | {statistics.median(timings) * 1e3:>8.2f} ms"
+            f" | {p95 * 1e3:>8.2f} ms | {connections:>5}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Benchmark per-call agent overhead against a stub server")
+    ap.add_argument("--calls", type=int, default=200, help="calls per mode (default 200)")
+    args = ap.parse_args(argv)
+
+    with StubServer() as server:
+        os.environ["CHAT_ENGINE_PROVIDER"] = "local"
+        os.environ["CHAT_ENGINE_LOCAL_BASE_URL"] = server.base_url
+
+        _pooled(5)  # warm imports and the loop thread before timing anything
+        results = []
+        for label, run in (("fresh", _fresh), ("pooled", _pooled)):
+            before = server.stats.connections
+            timings = run(args.calls)
+            results.append((label, timings, server.stats.connections - before))
+
+    print(f"{args.calls} calls per mode (4 GM : 1 summarizer), stub server with no latency\n")
+    print(f"{'mode':<8} | {'mean':>11} | {'p50':>11} | {'p95':>11} | conns")
+    print("-" * 60)
+    for label, timings, conns in results:
+        print(_row(label, timings, conns))
+    saved = statistics.mean(results[0][1]) - statistics.mean(results[1][1])
+    print(f"\nOverhead removed per call: {saved * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
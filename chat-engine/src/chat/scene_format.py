@@ -0,0 +1,241 @@
+"""Scene file tokenizer — single-pass [section] / key: value splitting with a parse cache.
+
+Every project in this repo reads the same markdown layout:
+
+    [section-name]
+    key: value
+    key: >
+      folded multi-line value
+
+This module owns that layer. Each project's parser builds its own dataclasses on
+top of load() (story-engine ParsedScene, game-master AdventureScene, chat-engine
+ParsedChat); the tokenizer knows nothing about required sections or field types.
+
+load() caches the tokenized form per file, keyed by absolute path and validated
+against the file's mtime and size:
+    - in-process: repeated loads of an unchanged file skip the disk entirely
+    - on disk   : a pickle per file, so batch runs and restarted servers don't
+                  re-split hundreds of unchanged scenes
+
+Config:
+    SCENE_PARSE_CACHE_DIR   on-disk cache directory
+                            (default $XDG_CACHE_HOME/scene_format or ~/.cache/scene_format;
+                            "off" keeps the in-process cache only)
+
+Copied verbatim from story-engine/my_code/scene_format.py.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import re
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump when the tokenized form changes so stale on-disk entries are ignored.
+_FORMAT_VERSION = 1
+
+
+def _default_cache_dir() -> str:
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "scene_format")
+
+
+CACHE_DIR: str = os.getenv("SCENE_PARSE_CACHE_DIR", _default_cache_dir())
+
+# ---------------------------------------------------------------------------
+# Tokenizer
+# ---------------------------------------------------------------------------
+
+SECTION_RE = re.compile(r"^\[([a-z][a-z0-9_-]*)\]\s*$")
+_KV_RE = re.compile(r"^([a-z_]+)\s*:\s*(.*)")
+_NUMBERED_RE = re.compile(r"^(\d+)\.\s+", re.MULTILINE)
+
+
+def split_sections(text: str, strip_comments: bool = False) -> dict[str, str]:
+    """Split raw file text into {section_name: stripped body} in one pass over the lines.
+
+    Text before the first marker is ignored; a repeated section name keeps the
+    last body. strip_comments blanks lines whose stripped content starts with '#'.
+    Returns {} when there are no markers — callers raise their own error type.
+    """
+    sections: dict[str, str] = {}
+    name: str | None = None
+    body: list[str] = []
+    for line in text.split("\n"):
+        if line[:1] == "[":
+            m = SECTION_RE.match(line)
+            if m:
+                if name is not None:
+                    sections[name] = "\n".join(body).strip()
+                name, body = m.group(1), []
+                continue
+        if name is None:
+            continue
+        if strip_comments and line.lstrip().startswith("#"):
+            line = ""
+        body.append(line)
+    if name is not None:
+        sections[name] = "\n".join(body).strip()
+    return sections
+
+
+def parse_kv(text: str) -> dict[str, str]:
+    """Parse key: value lines with indented continuation and YAML '>' folding.
+
+    Continuation lines are joined with single spaces; lines starting with '#'
+    are skipped. Lines before the first key are ignored.
+    """
+    result: dict[str, str] = {}
+    key: str | None = None
+    parts: list[str] = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            continue
+        m = _KV_RE.match(line)
+        if m:
+            if key is not None:
+                result[key] = " ".join(parts).strip()
+            key = m.group(1)
+            value = m.group(2).strip()
+            parts = [] if value in (">", "") else [value]
+        elif key is not None and stripped:
+            parts.append(stripped)
+    if key is not None:
+        result[key] = " ".join(parts).strip()
+    return result
+
+
+def split_numbered(text: str) -> list[tuple[int, str]]:
+    """Split a numbered list ("1. ...", "2. ...") into [(number, stripped item text)]."""
+    matches = list(_NUMBERED_RE.finditer(text))
+    items: list[tuple[int, str]] = []
+    for i, m in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        items.append((int(m.group(1)), text[m.end():end].strip()))
+    return items
+
+
+def numbered_sections(sections: dict[str, str], prefix: str) -> list[tuple[str, str]]:
+    """Return [(name, body)] for sections named '<prefix>-N', sorted by N."""
+    pattern = re.compile(rf"^{re.escape(prefix)}-(\d+)$")
+    found = []
+    for name, body in sections.items():
+        m = pattern.match(name)
+        if m:
+            found.append((int(m.group(1)), name, body))
+    return [(name, body) for _, name, body in sorted(found)]
+
+
+# ---------------------------------------------------------------------------
+# Tokenized file + cache
+# ---------------------------------------------------------------------------
+
+class SceneTokens:
+    """Tokenized scene file: raw section bodies plus each section parsed as key: value.
+
+    kv() returns a fresh dict so callers can't corrupt the cached entry.
+    """
+
+    __slots__ = ("path", "sections", "_kv")
+
+    def __init__(self, path: str, sections: dict[str, str], kv: dict[str, dict[str, str]]):
+        self.path = path
+        self.sections = sections
+        self._kv = kv
+
+    def kv(self, name: str) -> dict[str, str]:
+        """Key: value pairs of a section ({} if the section is absent)."""
+        return dict(self._kv.get(name, {}))
+
+    def numbered(self, prefix: str) -> list[tuple[str, str]]:
+        """[(name, body)] for '<prefix>-N' sections, sorted by N."""
+        return numbered_sections(self.sections, prefix)
+
+
+_memo: dict[tuple[str, bool], tuple[int, int, SceneTokens]] = {}
+_memo_lock = threading.Lock()
+
+
+def _tokenize(path: str, text: str, strip_comments: bool) -> SceneTokens:
+    sections = split_sections(text, strip_comments)
+    return SceneTokens(path, sections, {name: parse_kv(body) for name, body in sections.items()})
+
+
+def _disk_path(key: tuple[str, bool]) -> Path | None:
+    if not CACHE_DIR or CACHE_DIR.lower() == "off":
+        return None
+    digest = hashlib.sha1(f"{key[0]}\0{int(key[1])}".encode("utf-8")).hexdigest()
+    return Path(CACHE_DIR) / f"{digest}.pickle"
+
+
+def _read_disk(key: tuple[str, bool], mtime_ns: int, size: int) -> SceneTokens | None:
+    cache_file = _disk_path(key)
+    if cache_file is None or not cache_file.exists():
+        return None
+    try:
+        with cache_file.open("rb") as f:
+            entry = pickle.load(f)
+        if (entry["version"], entry["mtime_ns"], entry["size"]) != (_FORMAT_VERSION, mtime_ns, size):
+            return None
+        return SceneTokens(key[0], entry["sections"], entry["kv"])
+    except Exception as exc:  # corrupt / foreign file — just re-parse
+        logger.debug("scene parse cache: ignoring %s (%s)", cache_file, exc)
+        return None
+
+
+def _write_disk(key: tuple[str, bool], mtime_ns: int, size: int, tokens: SceneTokens) -> None:
+    cache_file = _disk_path(key)
+    if cache_file is None:
+        return
+    entry = {
+        "version": _FORMAT_VERSION, "mtime_ns": mtime_ns, "size": size,
+        "sections": tokens.sections, "kv": tokens._kv,
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError as exc:  # read-only home, full disk — caching is best-effort
+        logger.debug("scene parse cache: could not write %s (%s)", cache_file, exc)
+
+
+def load(file_path: str | Path, strip_comments: bool = False) -> SceneTokens:
+    """Tokenize a scene file, reusing the cached result while the file is unchanged.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    path = os.path.abspath(file_path)
+    st = os.stat(path)
+    key = (path, strip_comments)
+
+    with _memo_lock:
+        hit = _memo.get(key)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+
+    tokens = _read_disk(key, st.st_mtime_ns, st.st_size)
+    if tokens is None:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        tokens = _tokenize(path, text, strip_comments)
+        _write_disk(key, st.st_mtime_ns, st.st_size, tokens)
+
+    with _memo_lock:
+        _memo[key] = (st.st_mtime_ns, st.st_size, tokens)
+    return tokens
+
+
+def clear_cache() -> None:
+    """Drop the in-process cache (the on-disk cache revalidates itself by mtime)."""
+    with _memo_lock:
+        _memo.clear()
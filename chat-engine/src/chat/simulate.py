@@ -0,0 +1,189 @@
+"""Headless simulator — N concurrent ChatSessions against the stub server.
+
+Runs whole sessions the way main_chat does — same ChatSession, same turn loop,
+same autosave — with no terminal and no real model:
+
+    - a StubServer (src/chat/stub_server.py) answers every GM and summarizer call
+      deterministically, with optional fixed latency
+    - each session runs on its own thread, pausing after every turn; the pause
+      prompt is answered from a script of human commands instead of stdin
+    - session output (turn lines, pause dividers) is discarded; transcripts and
+      run logs go to a scratch directory, one subdirectory per session
+
+Reported: turns/s across all sessions, latency percentiles per stage (the turn
+the user waits for, orchestrator/prompt planning, GM call, background summarizer,
+autosave), and memory retained per session (tracemalloc, measured in a second
+identical pass so tracing doesn't slow the timed one).
+
+Script format — one command per line, applied at the first pause at or after
+that turn number, in file order. Any command the pause prompt accepts works:
+
+    # turn: command
+    3: [as Lyra] I'm here because of you.
+    5: [director] Mira should hint that she has been inside before
+    8: /next Mira
+
+A GM error answers the retry prompt with /stop, so a broken server ends the
+session instead of hanging the run.
+
+Usage:
+    python -m src.chat.simulate examples/ashenveil_chat1_short_rules.md
+    python -m src.chat.simulate examples/ashenveil_chat1.md --sessions 8 --turns 100 \\
+        --script examples/simulate_script.txt --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import os
+import re
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.chat.parser import parse_chat_file
+from src.chat.stub_server import StubServer
+
+_STAGES = ("turn", "orchestrator", "gm", "summarizer", "autosave")
+_SCRIPT_LINE_RE = re.compile(r"^\s*(\d+)\s*:\s*(.+?)\s*$")
+
+
+def load_script(path: str | None) -> list[tuple[int, str]]:
+    """Parse a script file into [(turn, command)] in file order."""
+    if not path:
+        return []
+    script = []
+    for n, line in enumerate(Path(path).read_text(encoding="utf-8").splitlines(), 1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        m = _SCRIPT_LINE_RE.match(line)
+        if not m:
+            raise ValueError(f"{path}:{n}: expected '<turn>: <command>', got {line!r}")
+        script.append((int(m.group(1)), m.group(2)))
+    return script
+
+
+class _ScriptedInput:
+    """read_input for one session: the next due script command, else Enter."""
+
+    def __init__(self, session_ref: list, script: list[tuple[int, str]]):
+        self._session_ref = session_ref
+        self._script = script
+        self._next = 0
+        self.errors = 0
+
+    def __call__(self, prompt: str = "") -> str:
+        if not prompt:  # GM error retry prompt
+            self.errors += 1
+            return "/stop"
+        turn = self._session_ref[0].logger.turn_count()
+        if self._next < len(self._script) and self._script[self._next][0] <= turn:
+            cmd = self._script[self._next][1]
+            self._next += 1
+            return cmd
+        return ""
+
+
+def _build_sessions(input_path: str, n: int, turns: int, script, out_root: Path):
+    from src.chat.main_chat import ChatSession
+
+    sessions, inputs = [], []
+    for i in range(n):
+        chat = parse_chat_file(input_path)
+        if turns:
+            chat.config.max_turns = turns
+        ref: list = []
+        reader = _ScriptedInput(ref, script)
+        session = ChatSession(chat, input_path, read_input=reader, output_dir=str(out_root / f"session-{i + 1}"))
+        session.pause_mode = True  # pause after every turn so the script can interject anywhere
+        ref.append(session)
+        sessions.append(session)
+        inputs.append(reader)
+    return sessions, inputs
+
+
+def _run_all(sessions) -> float:
+    threads = [threading.Thread(target=s.run, name=f"sim-session-{i + 1}") for i, s in enumerate(sessions)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Run concurrent headless chat sessions against a stub model server")
+    ap.add_argument("input", help="chat .md file")
+    ap.add_argument("--sessions", type=int, default=4, help="concurrent sessions (default 4)")
+    ap.add_argument("--turns", type=int, default=60, help="max_turns per session, 0 = keep the file's value (default 60)")
+    ap.add_argument("--script", help="scripted human commands, '<turn>: <command>' per line")
+    ap.add_argument("--latency", type=float, default=0.02, help="stub server seconds per request (default 0.02)")
+    ap.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    ap.add_argument("--keep-output", help="write transcripts here instead of a temp directory")
+    args = ap.parse_args(argv)
+
+    script = load_script(args.script)
+
+    with StubServer(latency=args.latency) as server, tempfile.TemporaryDirectory() as tmp:
+        os.environ["CHAT_ENGINE_PROVIDER"] = "local"
+        os.environ["CHAT_ENGINE_LOCAL_BASE_URL"] = server.base_url
+        out_root = Path(args.keep_output or tmp)
+
+        # ---- timed pass ------------------------------------------------------
+        sessions, inputs = _build_sessions(args.input, args.sessions, args.turns, script, out_root)
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            wall = _run_all(sessions)
+        requests = server.stats.requests
+        connections = server.stats.connections
+        timings = {stage: [v for s in sessions for v in s.timings[stage]] for stage in _STAGES}
+        total_turns = sum(s.logger.turn_count() for s in sessions)
+        end_reasons = sorted({s.end_reason for s in sessions})
+        errors = sum(r.errors for r in inputs)
+        del sessions, inputs
+
+        # ---- memory pass -----------------------------------------------------
+        retained = peak = None
+        if not args.no_memory:
+            gc.collect()
+            tracemalloc.start()
+            base = tracemalloc.get_traced_memory()[0]
+            mem_sessions, _ = _build_sessions(args.input, args.sessions, args.turns, script, Path(tmp) / "mem")
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                _run_all(mem_sessions)
+            gc.collect()
+            current, peak_total = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            retained = (current - base) / args.sessions
+            peak = (peak_total - base) / args.sessions
+
+    print(f"{args.sessions} sessions × {args.turns or 'file'} turns — {Path(args.input).name}, "
+          f"stub latency {args.latency * 1e3:.0f} ms, {len(script)} scripted commands")
+    print(f"\nWall time      : {wall:.2f} s")
+    print(f"Turns          : {total_turns}  ({total_turns / wall:.1f} turns/s)")
+    print(f"Model requests : {requests} over {connections} connections")
+    print(f"Ended          : {', '.join(end_reasons)}" + (f"  ({errors} GM errors)" if errors else ""))
+    print(f"\n{'stage':<13} | {'calls':>6} | {'p50':>9} | {'p95':>9} | {'max':>9}")
+    print("-" * 57)
+    for stage in _STAGES:
+        values = timings[stage]
+        if not values:
+            print(f"{stage:<13} | {0:>6} | {'—':>9} | {'—':>9} | {'—':>9}")
+            continue
+        print(f"{stage:<13} | {len(values):>6} | {_percentile(values, .5) * 1e3:>6.2f} ms"
+              f" | {_percentile(values, .95) * 1e3:>6.2f} ms | {max(values) * 1e3:>6.2f} ms")
+    if retained is not None:
+        print(f"\nMemory per session: {retained / 1024:.0f} KiB retained, {peak / 1024:.0f} KiB peak")
+
+
+if __name__ == "__main__":
+    main()
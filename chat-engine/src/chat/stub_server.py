@@ -0,0 +1,183 @@
+"""Stub OpenAI-compatible server — deterministic answers for benchmarks and dry runs.
+
+Serves /v1/chat/completions (streaming and non-streaming) on localhost and
+answers from the prompt shape chat-engine sends, with no model behind it:
+
+    - GM turn          (NEXT SPEAKER: X)        →  X: "..."
+    - GM selected turn (AVAILABLE SPEAKERS: …)  →  SPEAKER: … / DIALOGUE: "…"
+    - anything else (history summarizer)        →  a short summary paragraph
+
+Answers are a pure function of the request body, so two runs against the stub
+produce identical transcripts. A fixed per-request latency can be added.
+The server counts requests and TCP connections so callers can check keep-alive
+reuse.
+
+Usage (standalone):
+    python -m src.chat.stub_server --port 8091 --latency 0.05
+    CHAT_ENGINE_PROVIDER=local CHAT_ENGINE_LOCAL_BASE_URL=http://127.0.0.1:8091/v1 \\
+        python -m src.chat.main_chat examples/ashenveil_chat1.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_WORDS = (
+    "ash ember vault oath stone lantern ruin whisper blade shadow gate conclave "
+    "memory river iron doubt promise silence bell crown"
+).split()
+
+
+def _content_text(content) -> str:
+    if isinstance(content, list):
+        return "".join(c.get("text", "") for c in content if isinstance(c, dict))
+    return str(content or "")
+
+
+def answer_for(body: dict) -> str:
+    """Deterministic reply text for a chat-completions request body."""
+    prompt = _content_text((body.get("messages") or [{}])[-1].get("content"))
+    seed = hashlib.sha1(prompt.encode("utf-8")).digest()
+    line = " ".join(_WORDS[b % len(_WORDS)] for b in seed[:12]).capitalize() + "."
+
+    m = re.search(r"^NEXT SPEAKER: (.+)$", prompt, re.MULTILINE)
+    if m:
+        return f'{m.group(1).strip()}: "{line}"'
+    m = re.search(r"^AVAILABLE SPEAKERS: (.+)$", prompt, re.MULTILINE)
+    if m:
+        speakers = [s.strip() for s in m.group(1).split(",") if s.strip()]
+        return f'SPEAKER: {speakers[seed[12] % len(speakers)]}\nDIALOGUE: "{line}"'
+    return f"The party stands among the {line.lower()}"
+
+
+class StubStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+
+
+def _make_handler(stats: StubStats, latency: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like a real server
+
+        def setup(self):
+            super().setup()
+            # Many small SSE writes on a kept-alive socket would otherwise hit
+            # Nagle + delayed ACK (~40 ms per request); real servers disable it too
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with stats.lock:
+                stats.connections += 1
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.rstrip("/").endswith("/models"):
+                self._json({"object": "list", "data": [{"id": "stub", "object": "model"}]})
+            else:
+                self.send_error(404)
+
+        def do_POST(self):
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self.send_error(404)
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            with stats.lock:
+                stats.requests += 1
+            if latency > 0:
+                time.sleep(latency)
+            content = answer_for(body)
+            prompt_chars = sum(len(_content_text(m.get("content"))) for m in body.get("messages", []))
+            usage = {"prompt_tokens": prompt_chars // 4, "completion_tokens": len(content) // 4,
+                     "total_tokens": (prompt_chars + len(content)) // 4}
+            if body.get("stream"):
+                self._stream(body, content, usage)
+            else:
+                self._json({
+                    "id": "stub", "object": "chat.completion", "created": int(time.time()),
+                    "model": body.get("model", "stub"),
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                                 "finish_reason": "stop"}],
+                    "usage": usage,
+                })
+
+        def _json(self, obj: dict) -> None:
+            data = json.dumps(obj).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _chunk(self, data: bytes) -> None:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+        def _stream(self, body: dict, content: str, usage: dict) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            base = {"id": "stub", "object": "chat.completion.chunk",
+                    "created": int(time.time()), "model": body.get("model", "stub")}
+
+            def event(delta: dict | None, finish_reason=None, extra: dict | None = None):
+                choices = [] if delta is None else [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+                self._chunk(f"data: {json.dumps({**base, 'choices': choices, **(extra or {})})}\n\n".encode("utf-8"))
+
+            event({"role": "assistant", "content": ""})
+            for i in range(0, len(content), 64):
+                event({"content": content[i:i + 64]})
+            event({}, "stop")
+            event(None, extra={"usage": usage})
+            self._chunk(b"data: [DONE]\n\n")
+            self._chunk(b"")
+
+    return Handler
+
+
+class StubServer:
+    """Threaded stub server on localhost; use as a context manager."""
+
+    def __init__(self, port: int = 0, latency: float = 0.0):
+        self.stats = StubStats()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), _make_handler(self.stats, latency))
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deterministic OpenAI-compatible stub server.")
+    parser.add_argument("--port", type=int, default=8091)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    args = parser.parse_args()
+    with StubServer(args.port, args.latency) as server:
+        print(f"Stub server on {server.base_url} (latency {args.latency:.3f}s) — Ctrl-C to stop")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
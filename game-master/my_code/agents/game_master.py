@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import re
+from functools import lru_cache
 from typing import Any
 
 from my_code.models.data_models import AdventureScene, CharacterCard, GameState, WorldInfoEntry
 from my_code.models.provider import system_prompt_suffix
+from my_code.models.world_info import KeywordMatcher
 
 
 # ---------------------------------------------------------------------------
@@ -180,14 +181,15 @@ def build_system_prompt(scene: AdventureScene, visual_context: str = "") -> str:
 # Lore injection (pure Python — no LLM call)
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=32)
+def _trigger_matcher(triggers: tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(triggers)
+
+
 def _match_character_triggers(scan_text: str, characters: list[CharacterCard]) -> list[CharacterCard]:
-    matched = []
-    for char in characters:
-        for trigger in char.triggers:
-            if re.search(r"\b" + re.escape(trigger) + r"\b", scan_text, re.IGNORECASE):
-                matched.append(char)
-                break
-    return matched
+    triggers = [[t.lower() for t in char.triggers] for char in characters]
+    found = _trigger_matcher(tuple(t for ts in triggers for t in ts)).match(scan_text)
+    return [char for char, ts in zip(characters, triggers) if any(t in found for t in ts)]
 
 
 def _build_world_context(player_input: str, last_response: str, state: GameState) -> str:
@@ -207,11 +209,9 @@ def _build_world_context(player_input: str, last_response: str, state: GameState
 
     char_block = ("## Characters in Scene\n\n" + "\n\n".join(char_parts)) if char_parts else ""
 
-    wi_parts: list[str] = []
-    for entry in state.world_info_entries:
-        if re.search(r"\b" + re.escape(entry.keyword) + r"\b", scan_text, re.IGNORECASE):
-            wi_parts.append(f"[{entry.keyword}] {entry.content}")
-    wi_block = "\n".join(wi_parts)
+    wi_block = "\n".join(
+        f"[{entry.keyword}] {entry.content}" for entry in state.world_info_entries.activated(scan_text)
+    )
 
     combined = [p for p in (char_block, wi_block) if p]
     return ("[WORLD CONTEXT]\n" + "\n\n".join(combined)) if combined else ""
@@ -0,0 +1,200 @@
+"""Checkpoint journal — per-turn autosave that writes only what the turn changed.
+
+The turn loop used to rewrite the whole save (every message, the full story log)
+as indented JSON after every turn, so autosave cost grew with the adventure.
+
+A checkpoint is now two files in saves/:
+
+    _checkpoint.json      a full snapshot, same shape as a /save file, plus an id
+    _checkpoint.journal   one JSON line per turn: the delta since the line before
+
+A delta holds the changed scalar fields (memory, author's note, turn count, input
+mode, story summary) and, for messages, story_log and world info entries, a splice:
+
+    {"drop": d, "keep": k, "append": [...]}   →   new = old[d:][:k] + append
+
+which covers every way the loop changes them: appends (player turns, GM replies,
+tool calls and their dice results), a replaced tail (/regen, /edit), a shortened
+tail (undo) and a dropped head (context-window eviction). Messages are compared by
+identity, so a turn is diffed without re-serialising the history.
+
+Every `compact_every` lines, or once the journal outgrows the snapshot, a new
+snapshot is written and the journal restarts.
+
+Torn writes: the snapshot is written to a temp file and renamed into place. Journal
+lines carry the snapshot id and a sequence number, and replay stops at the first
+line that is incomplete, unparsable, out of sequence or from another snapshot, so
+a crash mid-write loses at most that turn. After a failed append the next record
+writes a fresh snapshot rather than appending after a partial line.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+from my_code.models.data_models import GameState
+
+_FIELDS = ("memory", "author_note", "turn_count", "input_mode", "story_summary")
+
+
+def _is(a: Any, b: Any) -> bool:
+    return a is b
+
+
+def _eq(a: Any, b: Any) -> bool:
+    return a is b or a == b
+
+
+def _splice(old: list, new: list, same: Callable[[Any, Any], bool]) -> dict | None:
+    """Smallest {"drop", "keep", "append"} turning `old` into `new`, or None if equal."""
+    drop = 0
+    if old and new and not same(old[0], new[0]):
+        drop = next((i for i, o in enumerate(old) if same(o, new[0])), len(old))
+    limit = min(len(old) - drop, len(new))
+    keep = 0
+    while keep < limit and same(old[drop + keep], new[keep]):
+        keep += 1
+    if drop == 0 and keep == len(old) == len(new):
+        return None
+    return {"drop": drop, "keep": keep, "append": new[keep:]}
+
+
+def _apply_splice(old: list, splice: dict) -> list:
+    return old[splice["drop"]:][:splice["keep"]] + splice["append"]
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _world_info(state: GameState) -> list[dict]:
+    return [{"keyword": e.keyword, "content": e.content} for e in state.world_info_entries]
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+class CheckpointJournal:
+    """Append-only autosave for one running session."""
+
+    def __init__(self, snapshot_path: Path, compact_every: int = 50):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_suffix(".journal")
+        self.compact_every = compact_every
+        self._id: str | None = None      # None → next record() writes a snapshot
+        self._seq = 0
+        self._snapshot_bytes = 0
+        self._journal_bytes = 0
+        self._messages: list[dict] = []
+        self._story_log: list[str] = []
+        self._world_info: list[dict] = []
+        self._world_info_ref: dict | None = None
+        self._fields: dict[str, Any] = {}
+
+    def reset(self) -> None:
+        """Force a full snapshot on the next record (e.g. after a load)."""
+        self._id = None
+
+    def record(self, state: GameState, messages: list[dict]) -> None:
+        """Checkpoint the current state: one journal line, or a snapshot when due."""
+        if (
+            self._id is None
+            or self._seq >= self.compact_every
+            or self._journal_bytes > self._snapshot_bytes
+        ):
+            self._write_snapshot(state, messages)
+            return
+
+        delta: dict[str, Any] = {"id": self._id, "seq": self._seq + 1}
+        for name in _FIELDS:
+            value = getattr(state, name)
+            if value != self._fields.get(name):
+                delta[name] = value
+        for key, old, new, same in (
+            ("messages", self._messages, messages, _is),
+            ("story_log", self._story_log, state.story_log, _eq),
+        ):
+            splice = _splice(old, new, same)
+            if splice is not None:
+                delta[key] = splice
+        # The store hands out the same dict until it is written, so an unchanged
+        # world info costs one identity check rather than a walk over every entry
+        entries = state.world_info_entries.shared()
+        world_info = self._world_info
+        if entries is not self._world_info_ref:
+            world_info = _world_info(state)
+            splice = _splice(self._world_info, world_info, _eq)
+            if splice is not None:
+                delta["world_info_entries"] = splice
+
+        line = (_dumps(delta) + "\n").encode("utf-8")
+        try:
+            with open(self.journal_path, "ab") as f:
+                f.write(line)
+        except OSError:
+            self._id = None  # never append after a possibly partial line
+            raise
+        self._seq += 1
+        self._journal_bytes += len(line)
+        self._remember(state, messages, world_info)
+
+    def _write_snapshot(self, state: GameState, messages: list[dict]) -> None:
+        snap_id = uuid.uuid4().hex[:12]
+        data = (_dumps({**state.snapshot(), "messages": messages, "checkpoint_id": snap_id})).encode("utf-8")
+        tmp = self.snapshot_path.with_suffix(".json.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, self.snapshot_path)
+        # Lines left from the previous snapshot carry its id and are ignored on load
+        self.journal_path.write_bytes(b"")
+        self._id = snap_id
+        self._seq = 0
+        self._snapshot_bytes = len(data)
+        self._journal_bytes = 0
+        self._remember(state, messages, _world_info(state))
+
+    def _remember(self, state: GameState, messages: list[dict], world_info: list[dict]) -> None:
+        self._messages = list(messages)
+        self._story_log = list(state.story_log)
+        self._world_info = world_info
+        self._world_info_ref = state.world_info_entries.shared()
+        self._fields = {name: getattr(state, name) for name in _FIELDS}
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+def load_save(path: Path) -> dict:
+    """Read a save file; for a checkpoint, replay its journal on top of the snapshot.
+
+    Returns the same dict shape as a /save file (state.snapshot() plus "messages").
+    """
+    path = Path(path)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    snap_id = data.pop("checkpoint_id", None)
+    journal = path.with_suffix(".journal")
+    if snap_id is None or not journal.exists():
+        return data
+
+    data.setdefault("messages", [])
+    seq = 0
+    for raw in journal.read_bytes().split(b"\n")[:-1]:  # the last piece has no newline: empty or torn
+        try:
+            delta = json.loads(raw)
+        except ValueError:
+            break
+        if delta.get("id") != snap_id or delta.get("seq") != seq + 1:
+            break
+        seq += 1
+        for name in _FIELDS:
+            if name in delta:
+                data[name] = delta[name]
+        for key in ("messages", "story_log", "world_info_entries"):
+            if key in delta:
+                data[key] = _apply_splice(data.get(key, []), delta[key])
+    return data
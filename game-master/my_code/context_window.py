@@ -0,0 +1,198 @@
+"""Context window — keeps the GM prompt inside a token budget.
+
+run_adventure appends every player turn, GM reply and tool round to `messages`.
+Left alone, the prompt grows every turn until the server's context overflows.
+
+Every request is laid out as:
+
+    system     the system prompt (world, scenario, characters) — pinned, never trimmed
+               + "## Story So Far" from state.story_summary, once anything was evicted
+    messages   the recent window — whole turns only
+
+A turn is a user message plus every assistant, tool-call and tool-result message
+that follows it. Turns are evicted oldest-first and whole, so a tool call is never
+separated from its result. The newest turns are always kept; the current one
+carries [MEMORY] and [WORLD CONTEXT].
+
+Eviction is hysteretic. Nothing happens until the estimated prompt passes the
+budget; then the window is cut to about half of it in one step. Between evictions
+the request prefix is byte-identical from turn to turn, so llama.cpp / LM Studio
+keep reusing their prompt cache; each eviction invalidates it once.
+
+Evicted turns are folded into state.story_summary by one non-streaming call. If
+that call fails, the tail of the evicted text is kept instead. The evicted
+messages are also handed to the turn history, so /undo and /regen can still
+roll back across an eviction.
+
+Token counts are estimated at 4 characters per token; no tokenizer is loaded.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from openai import AsyncOpenAI
+
+from my_code.agents.game_master import TOOL_SCHEMAS
+from my_code.models.data_models import GameState
+from my_code.models.provider import context_budget
+from my_code.turn_history import TurnHistory
+
+logger = logging.getLogger("game_master.context")
+
+_LOW_WATER = 0.5           # after an eviction the prompt is cut to this fraction of the budget
+_KEEP_TURNS = 2            # newest turns that are never evicted
+_SUMMARY_CHARS = 2400      # hard cap on state.story_summary
+_SUMMARY_MAX_TOKENS = 500
+_MESSAGE_OVERHEAD = 4      # role / separator tokens per message
+
+_SUMMARY_PROMPT = (
+    "You keep the running summary of a text adventure. Merge the EXISTING SUMMARY "
+    "and the NEW EVENTS into one updated summary of under 300 words. Keep what "
+    "still matters: where the player is, who they met and how those characters "
+    "feel about them, items gained or lost, injuries, promises, open threads, "
+    "secrets revealed. Drop moment-to-moment description. Write plain past-tense "
+    "prose in the second person. Reply with the summary only.\n\n"
+    "EXISTING SUMMARY:\n{previous}\n\n"
+    "NEW EVENTS:\n{events}"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + 3) // 4
+
+
+_TOOLS_TOKENS = estimate_tokens(json.dumps(TOOL_SCHEMAS))
+
+
+def _message_tokens(msg: dict[str, Any]) -> int:
+    tokens = _MESSAGE_OVERHEAD + estimate_tokens(msg.get("content") or "")
+    for tc in msg.get("tool_calls") or ():
+        fn = tc.get("function", {})
+        tokens += estimate_tokens(fn.get("name", "") + fn.get("arguments", "")) + _MESSAGE_OVERHEAD
+    return tokens
+
+
+def system_with_summary(system: str, state: GameState) -> str:
+    """The system prompt as sent: pinned prompt plus the rolling story summary."""
+    if not state.story_summary:
+        return system
+    return f"{system}\n\n## Story So Far\n{state.story_summary}"
+
+
+def prompt_tokens(system: str, messages: list[dict], state: GameState) -> int:
+    """Estimated prompt size of the next request, tool schemas included."""
+    return (
+        estimate_tokens(system_with_summary(system, state))
+        + _TOOLS_TOKENS
+        + sum(_message_tokens(m) for m in messages)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Eviction
+# ---------------------------------------------------------------------------
+
+def _plan_cut(system: str, messages: list[dict], budget: int) -> int:
+    """Number of leading messages to evict (0 = nothing evictable)."""
+    starts = [i for i, m in enumerate(messages) if m.get("role") == "user" and i > 0]
+    if len(starts) < _KEEP_TURNS:
+        return 0
+    limit = starts[-_KEEP_TURNS]
+
+    # Plan as if the summary were already at its cap, so folding cannot push the
+    # prompt straight back over the budget
+    fixed = estimate_tokens(system) + _TOOLS_TOKENS + _SUMMARY_CHARS // 4
+    sizes = [_message_tokens(m) for m in messages]
+    remaining = fixed + sum(sizes)
+    target = int(budget * _LOW_WATER)
+
+    evicted_to = 0
+    for cut in starts:
+        if cut > limit:
+            break
+        remaining -= sum(sizes[evicted_to:cut])
+        evicted_to = cut
+        if remaining <= target:
+            break
+    return evicted_to
+
+
+def _player_action(content: str) -> str:
+    # build_turn_message puts the action after the last '---' line
+    return content.rpartition("---\n")[2].strip()
+
+
+def _events_text(evicted: list[dict]) -> str:
+    lines: list[str] = []
+    for m in evicted:
+        role = m.get("role")
+        content = (m.get("content") or "").strip()
+        if role == "user":
+            lines.append(f"Player: {_player_action(content)}")
+        elif role == "tool":
+            lines.append(f"(result: {content})")
+        elif role == "assistant":
+            for tc in m.get("tool_calls") or ():
+                fn = tc.get("function", {})
+                lines.append(f"(GM used {fn.get('name', '')} {fn.get('arguments', '')})")
+            if content:
+                lines.append(f"GM: {content}")
+    return "\n".join(lines)
+
+
+def _clip(text: str) -> str:
+    if len(text) <= _SUMMARY_CHARS:
+        return text
+    tail = text[-_SUMMARY_CHARS:]
+    return tail.partition("\n")[2] or tail
+
+
+async def _fold(client: AsyncOpenAI, model: str, previous: str, events: str) -> str:
+    try:
+        resp = await client.chat.completions.create(
+            model=model,
+            messages=[{
+                "role": "user",
+                "content": _SUMMARY_PROMPT.format(previous=previous or "(none yet)", events=events),
+            }],
+            max_tokens=_SUMMARY_MAX_TOKENS,
+            temperature=0.3,
+            stream=False,
+        )
+        summary = (resp.choices[0].message.content or "").strip()
+        if summary:
+            return _clip(summary)
+    except Exception as exc:
+        logger.warning("Story summary failed (keeping raw tail): %s", exc)
+    return _clip(f"{previous}\n{events}".strip())
+
+
+async def compact(
+    client: AsyncOpenAI,
+    model: str,
+    system: str,
+    messages: list[dict],
+    state: GameState,
+    budget: int | None = None,
+    history: TurnHistory | None = None,
+) -> int:
+    """Evict old turns into state.story_summary if the prompt is over budget.
+
+    Mutates `messages` and `state` in place. Returns the number of turns evicted.
+    """
+    budget = context_budget() if budget is None else budget
+    if budget <= 0 or prompt_tokens(system, messages, state) <= budget:
+        return 0
+    cut = _plan_cut(system, messages, budget)
+    if cut == 0:
+        return 0
+
+    evicted = messages[:cut]
+    state.story_summary = await _fold(client, model, state.story_summary, _events_text(evicted))
+    if history is not None:
+        history.note_evicted(evicted)
+    del messages[:cut]
+    return sum(1 for m in evicted if m.get("role") == "user") or 1
@@ -8,18 +8,25 @@ future GUI integration.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+import logging
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from openai import AsyncOpenAI
 
 from my_code.agents.game_master import TOOL_SCHEMAS, build_system_prompt, build_turn_message
-from my_code.models.data_models import AdventureScene, GameState, WorldInfoEntry
+from my_code.checkpoint import CheckpointJournal, load_save
+from my_code.context_window import compact, system_with_summary
+from my_code.models.data_models import AdventureScene, GameState
 from my_code.models.provider import get_client, get_vision_client_args
 from my_code.tools.dice_tools import roll_dice
+from my_code.turn_history import TurnHistory
 from my_code.ui.terminal import Terminal
-from my_code.vision.describer import describe_image
+from my_code.vision.describer import describe_image, describe_images
 from my_code.vision.probe import probe_vision
 
 
@@ -32,6 +39,8 @@ Messages = list[dict[str, Any]]
 
 _MAX_TOOL_ROUNDS = 8  # safety cap on consecutive tool calls before forcing a text response
 
+logger = logging.getLogger("game_master.turn")
+
 
 # ---------------------------------------------------------------------------
 # Tool dispatch
@@ -58,11 +67,8 @@ def _dispatch_tool(name: str, args_json: str, state: GameState) -> str:
     if name == "add_world_info_entry":
         keyword = args.get("keyword", "").strip()
         content = args.get("content", "").strip()
-        for entry in state.world_info_entries:
-            if entry.keyword.lower() == keyword.lower():
-                entry.content = content
-                return f"World info updated: {keyword!r}."
-        state.world_info_entries.append(WorldInfoEntry(keyword=keyword, content=content))
+        if not state.world_info_entries.upsert(keyword, content):
+            return f"World info updated: {keyword!r}."
         return f"World info added: {keyword!r}."
 
     return f"Unknown tool: {name!r}"
@@ -72,6 +78,27 @@ def _dispatch_tool(name: str, args_json: str, state: GameState) -> str:
 # Streaming GM call
 # ---------------------------------------------------------------------------
 
+@dataclass
+class TurnStats:
+    """Model calls made by one GM turn. The first call is the turn itself; each
+    further call is a tool round."""
+    tool_rounds: int = 0
+    tool_calls: int = 0
+    call_seconds: list[float] = field(default_factory=list)
+
+
+def _tool_call_id(turn: int, round_: int, index: int) -> str:
+    # Nine alphanumeric characters: what Mistral-style templates accept
+    return hashlib.sha1(f"{turn}:{round_}:{index}".encode("ascii")).hexdigest()[:9]
+
+
+def _canonical_arguments(raw: str) -> str:
+    try:
+        return json.dumps(json.loads(raw) if raw.strip() else {}, ensure_ascii=False)
+    except json.JSONDecodeError:
+        return raw  # passed through as sent; _dispatch_tool reports the parse error
+
+
 async def _stream_gm(
     client: AsyncOpenAI,
     model: str,
@@ -79,17 +106,29 @@ async def _stream_gm(
     messages: Messages,
     state: GameState,
     ui: Terminal,
+    stats: TurnStats | None = None,
 ) -> str:
     """Run one full GM turn: stream response, handle tool calls, return final text.
 
     Appends assistant message(s) and tool results to `messages` in place.
     May call the model multiple times if it uses tools before generating prose.
+
+    A tool round re-sends the whole prompt, so it is only cheap if the server can
+    reuse its prefix cache up to the new messages. Everything before them is sent
+    byte for byte as in the previous call: the system prompt is built once per
+    turn, stored messages are never rewritten, and tool calls are stored with
+    ids derived from (turn, round, index) and re-serialised arguments rather than
+    whatever id and spacing the server streamed. `stats`, if given, receives the
+    number of tool rounds and the time of each model call.
     """
+    stats = stats if stats is not None else TurnStats()
+    system = system_with_summary(system, state)
     for _round in range(_MAX_TOOL_ROUNDS + 1):
         text_parts: list[str] = []
         tc_acc: dict[int, dict] = {}
         finish_reason: str | None = None
         streaming_text = False
+        started = time.perf_counter()
 
         try:
             stream = await client.chat.completions.create(
@@ -116,9 +155,7 @@ async def _stream_gm(
                     for tc_d in delta.tool_calls:
                         idx = tc_d.index
                         if idx not in tc_acc:
-                            tc_acc[idx] = {"id": tc_d.id or "", "name": "", "args": ""}
-                        if tc_d.id:
-                            tc_acc[idx]["id"] = tc_d.id
+                            tc_acc[idx] = {"name": "", "args": ""}  # server ids are replaced, see below
                         if tc_d.function:
                             if tc_d.function.name:
                                 tc_acc[idx]["name"] += tc_d.function.name
@@ -129,6 +166,7 @@ async def _stream_gm(
                     finish_reason = choice.finish_reason
 
         except Exception as exc:
+            stats.call_seconds.append(time.perf_counter() - started)
             if streaming_text:
                 ui.gm_end()
             ui.system(f"[red]GM error: {exc}[/red]")
@@ -137,6 +175,7 @@ async def _stream_gm(
                 messages.append({"role": "assistant", "content": full_text})
             return full_text
 
+        stats.call_seconds.append(time.perf_counter() - started)
         if streaming_text:
             ui.gm_end()
 
@@ -145,11 +184,11 @@ async def _stream_gm(
         if tc_acc and _round < _MAX_TOOL_ROUNDS:
             tc_list = [
                 {
-                    "id": tc["id"],
+                    "id": _tool_call_id(state.turn_count, _round, i),
                     "type": "function",
-                    "function": {"name": tc["name"], "arguments": tc["args"]},
+                    "function": {"name": tc["name"], "arguments": _canonical_arguments(tc["args"])},
                 }
-                for _, tc in sorted(tc_acc.items())
+                for i, (_, tc) in enumerate(sorted(tc_acc.items()))
             ]
             asst_msg: dict[str, Any] = {"role": "assistant", "tool_calls": tc_list}
             if full_text:
@@ -161,14 +200,32 @@ async def _stream_gm(
                     tc["function"]["name"], tc["function"]["arguments"], state
                 )
                 messages.append({"role": "tool", "tool_call_id": tc["id"], "content": result})
+            stats.tool_rounds += 1
+            stats.tool_calls += len(tc_list)
             # Loop: model will see tool results and generate a response
         else:
             messages.append({"role": "assistant", "content": full_text})
+            if stats.tool_rounds:
+                logger.info(
+                    "turn %d: %d tool round(s), %d call(s); model calls %s s",
+                    state.turn_count, stats.tool_rounds, stats.tool_calls,
+                    " + ".join(f"{t:.2f}" for t in stats.call_seconds),
+                )
             return full_text
 
     return ""  # unreachable
 
 
+async def _trim_context(
+    client: AsyncOpenAI, model: str, system: str, messages: Messages, state: GameState,
+    history: TurnHistory, ui: Terminal,
+) -> None:
+    """Fold the oldest turns into the story summary once the prompt is over budget."""
+    evicted = await compact(client, model, system, messages, state, history=history)
+    if evicted:
+        ui.system(f"[dim]Context trimmed — {evicted} older turns folded into the story summary.[/dim]")
+
+
 # ---------------------------------------------------------------------------
 # Command handlers
 # ---------------------------------------------------------------------------
@@ -199,7 +256,7 @@ def _cmd_load(args: str, state: GameState, messages: Messages, ui: Terminal) ->
         ui.system(f"Save not found: {name!r}")
         return
 
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_save(path)
     state.restore(data)
     messages[:] = data.get("messages", [])
     ui.system(
@@ -311,6 +368,7 @@ def _cmd_help(ui: Terminal, vision_capable: bool = False) -> None:
         "[bold]/load [name][/bold]    — load game (no name = list saves)\n"
         "[bold]/export [name][/bold]  — export story as plain text\n"
         "[bold]/regen[/bold]          — regenerate the last GM response\n"
+        "[bold]/undo[/bold]           — take back the last turn (repeat to go further)\n"
         "[bold]/edit[/bold]           — edit the last GM response inline\n"
         "[bold]/memory[/bold]         — show current memory block\n"
         "[bold]/note [text][/bold]    — show or update author's note\n"
@@ -354,28 +412,26 @@ async def _setup_vision(
     ui.system("Vision: [green]enabled[/green]")
     descs: list[str] = []
 
+    # (image, label, prompt prefix, panel title, failure message), described concurrently
+    jobs: list[tuple[str, str, str, str, str]] = []
     if scene.scene_image and Path(scene.scene_image).exists():
-        ui.system(f"Describing scene image: {scene.scene_image}")
-        try:
-            desc = await asyncio.to_thread(
-                describe_image, scene.scene_image, "the game scene and environment", *client_args
-            )
-            descs.append(f"Scene environment: {desc}")
-            ui.panel(desc, title="Scene")
-        except Exception as exc:
-            ui.system(f"[yellow]Could not describe scene image: {exc}[/yellow]")
-
+        jobs.append((scene.scene_image, "the game scene and environment", "Scene environment",
+                     "Scene", "Could not describe scene image"))
     for char in scene.characters:
         if char.portrait and Path(char.portrait).exists():
-            ui.system(f"Describing portrait: {char.name}")
-            try:
-                desc = await asyncio.to_thread(
-                    describe_image, char.portrait, f"the character {char.name}", *client_args
-                )
-                descs.append(f"{char.name}: {desc}")
-                ui.panel(desc, title=f"Portrait — {char.name}")
-            except Exception as exc:
-                ui.system(f"[yellow]Could not describe portrait for {char.name}: {exc}[/yellow]")
+            jobs.append((char.portrait, f"the character {char.name}", char.name,
+                         f"Portrait — {char.name}", f"Could not describe portrait for {char.name}"))
+    if not jobs:
+        return True, "", client_args
+
+    ui.system(f"Describing {len(jobs)} image(s)…")
+    results = await describe_images([(path, label) for path, label, *_ in jobs], client_args)
+    for (_, _, prefix, title, failure), result in zip(jobs, results):
+        if isinstance(result, BaseException):
+            ui.system(f"[yellow]{failure}: {result}[/yellow]")
+            continue
+        descs.append(f"{prefix}: {result}")
+        ui.panel(result, title=title)
 
     return True, "\n\n".join(descs), client_args
 
@@ -398,8 +454,11 @@ async def run_adventure(scene: AdventureScene, ui: Terminal) -> None:
     messages: Messages = []
     last_response: str = ""
 
-    # Snapshot of messages+state taken just before each GM call — enables /regen
-    _turn_snapshot: dict | None = None
+    # Checkpoint taken just before each GM call — enables /regen and multi-level /undo
+    history = TurnHistory()
+
+    # Per-turn autosave — appends only what each turn changed
+    journal = CheckpointJournal(_SAVES_DIR / "_checkpoint.json")
 
     ui.banner(scene.meta.title)
 
@@ -439,7 +498,8 @@ async def run_adventure(scene: AdventureScene, ui: Terminal) -> None:
                     _cmd_save(args, state, messages, ui)
                 elif cmd == "load":
                     _cmd_load(args, state, messages, ui)
-                    _turn_snapshot = None  # snapshot is invalid after load
+                    history.clear()  # checkpoints are invalid after load
+                    journal.reset()
                 elif cmd == "export":
                     _cmd_export(args, state, ui)
                 elif cmd == "memory":
@@ -449,21 +509,29 @@ async def run_adventure(scene: AdventureScene, ui: Terminal) -> None:
                 elif cmd == "mode":
                     _cmd_mode(state, ui)
                 elif cmd == "regen":
-                    if _turn_snapshot is None:
+                    cp = history.regen(state, messages)
+                    if cp is None:
                         ui.system("Nothing to regenerate — no turn played yet.")
                     else:
                         ui.system("Regenerating…")
-                        messages[:] = _turn_snapshot["messages"]
-                        state.restore(_turn_snapshot["state"])
-                        last_response = _turn_snapshot["last_response"]
-                        turn_msg = _turn_snapshot["turn_message"]
-                        messages.append({"role": "user", "content": turn_msg})
+                        messages.append({"role": "user", "content": cp.turn_message})
                         last_response = await _stream_gm(
                             client, model, system, messages, state, ui
                         )
                         if last_response:
                             state.story_log.append(last_response)
-                        _cmd_save("_checkpoint", state, messages, Terminal._null())
+                        await _trim_context(client, model, system, messages, state, history, ui)
+                        journal.record(state, messages)
+                elif cmd == "undo":
+                    cp = history.undo(state, messages)
+                    if cp is None:
+                        ui.system("Nothing to undo.")
+                    else:
+                        last_response = cp.last_response
+                        ui.refresh_sidebar(state)
+                        journal.record(state, messages)
+                        ui.system(f"Undone — back to turn {state.turn_count} "
+                                  f"({len(history)} more undo step(s) available).")
                 elif cmd == "edit":
                     new_text = await _cmd_edit(state, messages, ui)
                     if new_text is not None:
@@ -494,13 +562,8 @@ async def run_adventure(scene: AdventureScene, ui: Terminal) -> None:
             )
             state.pending_image_context = ""
 
-            # Snapshot before this turn so /regen can roll back
-            _turn_snapshot = {
-                "messages": list(messages),  # shallow copy; items are immutable (we only append)
-                "state": state.snapshot(),
-                "last_response": last_response,
-                "turn_message": turn_message,
-            }
+            # Checkpoint before this turn so /regen and /undo can roll back
+            history.checkpoint(state, messages, last_response, turn_message)
 
             messages.append({"role": "user", "content": turn_message})
             last_response = await _stream_gm(client, model, system, messages, state, ui)
@@ -509,7 +572,8 @@ async def run_adventure(scene: AdventureScene, ui: Terminal) -> None:
                 state.story_log.append(last_response)
 
             ui.refresh_sidebar(state)
-            _cmd_save("_checkpoint", state, messages, Terminal._null())
+            await _trim_context(client, model, system, messages, state, history, ui)
+            journal.record(state, messages)
 
     except (KeyboardInterrupt, asyncio.CancelledError):
         ui.system("\nInterrupted.")
@@ -0,0 +1,162 @@
+"""Web load test — many simulated players against one web server and a stub LLM.
+
+Starts the stub LLM (my_code/stub_server.py) and the FastAPI app under uvicorn in
+this process, then runs N players concurrently. Each player has its own HTTP
+client, and so its own gm_session cookie. A player starts the default scenario
+and plays T turns, pausing a random think time between them. With --image every
+action attaches a small PNG and a label, so the vision description and the NSFW
+check run too.
+
+Reported:
+    - turn latency (POST /api/action → done): overall p50 / p95, and per-player
+      means with their spread and Jain's fairness index (1.0 = perfectly even)
+    - time to first streamed chunk, next to the stub's own time to first byte
+    - peak concurrent GM streams seen by the stub — must not exceed the cap
+    - sessions resident at the end, sessions evicted to disk and restored
+    - tracemalloc current / peak for the whole process
+
+Usage:
+    python -m my_code.loadtest
+    python -m my_code.loadtest --players 32 --turns 6 --generations 2 --max-sessions 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+import uvicorn
+
+from my_code.stub_server import StubServer
+from my_code.vision.probe import _red_png
+
+_SCENARIO = Path(__file__).parent.parent / "scenarios" / "ashenveil.md"
+
+
+async def _read_stream(resp: httpx.Response) -> float | None:
+    """Consume an SSE response; return the time the first chunk event arrived."""
+    first = None
+    async for line in resp.aiter_lines():
+        if first is None and line.startswith('data: {"type": "chunk"'):
+            first = time.perf_counter()
+    return first
+
+
+async def _player(base: str, turns: int, think: float, image: bytes | None, results: dict, idx: int) -> None:
+    rng = random.Random(idx)
+    lat, ttfc = [], []
+    async with httpx.AsyncClient(base_url=base, timeout=300) as http:
+        await asyncio.sleep(rng.uniform(0, think))
+        start_body = {"scenario": str(_SCENARIO), "vision": image is not None}
+        async with http.stream("POST", "/api/start", json=start_body) as resp:
+            resp.raise_for_status()
+            await _read_stream(resp)
+        for turn in range(turns):
+            await asyncio.sleep(rng.uniform(0, think))
+            start = time.perf_counter()
+            data = {"text": f"search the ruins ({idx}.{turn})"}
+            files = None
+            if image is not None:
+                data["image_label"] = "a rusted key found in the rubble"
+                files = {"image": ("key.png", image, "image/png")}
+            async with http.stream("POST", "/api/action", data=data, files=files) as resp:
+                if resp.status_code != 200:
+                    raise RuntimeError(f"player {idx} turn {turn}: HTTP {resp.status_code} {(await resp.aread())[:200]!r}")
+                first = await _read_stream(resp)
+            lat.append(time.perf_counter() - start)
+            if first is not None:
+                ttfc.append(first - start)
+    results[idx] = (lat, ttfc)
+
+
+def _serve(app) -> tuple[uvicorn.Server, threading.Thread, str]:
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, thread, f"http://127.0.0.1:{port}"
+
+
+def _pct(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Load-test the web UI with simulated players and a stub LLM")
+    ap.add_argument("--players", type=int, default=24)
+    ap.add_argument("--turns", type=int, default=5, help="actions per player (default 5)")
+    ap.add_argument("--generations", type=int, default=2, help="STORY_ENGINE_WEB_MAX_GENERATIONS (default 2)")
+    ap.add_argument("--max-sessions", type=int, default=8, help="STORY_ENGINE_WEB_MAX_SESSIONS (default 8)")
+    ap.add_argument("--ttft", type=float, default=0.05, help="stub seconds before the first byte")
+    ap.add_argument("--chunk-delay", type=float, default=0.005, help="stub seconds between chunks")
+    ap.add_argument("--think", type=float, default=0.5, help="max random pause between a player's turns")
+    ap.add_argument("--image", action="store_true", help="attach an image and label to every action")
+    args = ap.parse_args(argv)
+
+    tracemalloc.start()
+    with StubServer(ttft=args.ttft, chunk_delay=args.chunk_delay) as stub, tempfile.TemporaryDirectory() as tmp:
+        os.environ["STORY_ENGINE_PROVIDER"] = "local"
+        os.environ["STORY_ENGINE_LOCAL_BASE_URL"] = stub.base_url
+        os.environ.pop("STORY_ENGINE_GAME_MASTER_BASE_URL", None)
+        os.environ["STORY_ENGINE_WEB_MAX_GENERATIONS"] = str(args.generations)
+        os.environ["STORY_ENGINE_WEB_MAX_SESSIONS"] = str(args.max_sessions)
+
+        from my_code.ui.web import create_app
+
+        app = create_app(str(_SCENARIO), sessions_dir=Path(tmp))
+        server, thread, base = _serve(app)
+        results: dict[int, tuple[list[float], list[float]]] = {}
+        image = base64.b64decode(_red_png()) if args.image else None
+
+        async def run_all():
+            await asyncio.gather(*(
+                _player(base, args.turns, args.think, image, results, i) for i in range(args.players)
+            ))
+
+        wall = time.perf_counter()
+        asyncio.run(run_all())
+        wall = time.perf_counter() - wall
+        store = app.state.sessions
+        resident, evicted, restored = len(store), store.evicted, store.restored
+        on_disk = len(list(Path(tmp).glob("*.session.json")))
+        current, peak = tracemalloc.get_traced_memory()
+        server.should_exit = True
+        thread.join()  # shutdown persists live sessions into tmp
+        max_streams = stub.stats.max_streams_in_flight
+        requests = stub.stats.requests
+
+    lat = [v for lat_, _ in results.values() for v in lat_]
+    ttfc = [v for _, t in results.values() for v in t]
+    means = [statistics.mean(lat_) for lat_, _ in results.values()]
+    jain = sum(means) ** 2 / (len(means) * sum(m * m for m in means))
+
+    print(f"{args.players} players × {args.turns} turns, generation cap {args.generations}, "
+          f"max {args.max_sessions} resident sessions, stub ttft {args.ttft * 1e3:.0f} ms\n")
+    print(f"Wall time          : {wall:.2f} s  ({len(lat) / wall:.1f} turns/s, {requests} LLM requests)")
+    print(f"Turn latency       : p50 {_pct(lat, .5) * 1e3:.0f} ms   p95 {_pct(lat, .95) * 1e3:.0f} ms"
+          f"   max {max(lat) * 1e3:.0f} ms")
+    print(f"First chunk        : p50 {_pct(ttfc, .5) * 1e3:.0f} ms   p95 {_pct(ttfc, .95) * 1e3:.0f} ms"
+          f"   (stub time to first byte {args.ttft * 1e3:.0f} ms)")
+    print(f"Per-player mean    : min {min(means) * 1e3:.0f} ms   max {max(means) * 1e3:.0f} ms"
+          f"   Jain fairness {jain:.3f}")
+    print(f"Peak GM streams    : {max_streams} (cap {args.generations})")
+    print(f"Sessions           : {resident} resident, {on_disk} on disk, "
+          f"{evicted} evictions, {restored} restores")
+    print(f"Memory (tracemalloc): {current / 2**20:.1f} MiB current, {peak / 2**20:.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
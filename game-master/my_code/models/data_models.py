@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from my_code.models.world_info import WorldInfo, WorldInfoEntry
+
 
 # ---------------------------------------------------------------------------
 # Scene file models (parsed from .md scenario files)
@@ -53,25 +55,20 @@ class AdventureScene:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
-class WorldInfoEntry:
-    keyword: str                     # Trigger keyword (case-insensitive)
-    content: str                     # Prose injected when keyword matches
-
-
 @dataclass
 class GameState:
     """Mutable runtime state for a running adventure session."""
     scene: AdventureScene
     memory: str                      # Current memory block (may be updated by GM tools)
     author_note: str                 # Current author's note (may be updated by GM tools)
-    world_info_entries: list[WorldInfoEntry] = field(default_factory=list)
+    world_info_entries: WorldInfo = field(default_factory=WorldInfo)
     story_log: list[str] = field(default_factory=list)  # GM narration only, one entry per turn
     turn_count: int = 0
     input_mode: str = "action"       # "action" | "story"
     save_name: str | None = None
     vision_capable: bool = False     # set at startup by vision probe
     pending_image_context: str = ""  # /img description for the next turn only; cleared after use
+    story_summary: str = ""          # rolling summary of turns evicted from the context window
 
     @classmethod
     def from_scene(cls, scene: AdventureScene) -> "GameState":
@@ -93,16 +90,18 @@ class GameState:
             "story_log": list(self.story_log),
             "turn_count": self.turn_count,
             "input_mode": self.input_mode,
+            "story_summary": self.story_summary,
         }
 
     def restore(self, snap: dict) -> None:
         """Restore mutable state from a snapshot produced by snapshot()."""
         self.memory = snap["memory"]
         self.author_note = snap["author_note"]
-        self.world_info_entries = [
+        self.world_info_entries = WorldInfo(
             WorldInfoEntry(keyword=e["keyword"], content=e["content"])
             for e in snap["world_info_entries"]
-        ]
+        )
         self.story_log = list(snap["story_log"])
         self.turn_count = snap["turn_count"]
         self.input_mode = snap.get("input_mode", self.input_mode)
+        self.story_summary = snap.get("story_summary", "")
@@ -22,49 +22,77 @@ def system_prompt_suffix(prompt: str) -> str:
     return f"{prompt}\n{suffix}" if suffix else prompt
 
 
-def get_client() -> tuple[AsyncOpenAI, str]:
-    """Return (AsyncOpenAI client, model_id) for the game_master role."""
+def _endpoint(base_url: str | None = None, model_id: str | None = None) -> tuple[str, str, str] | None:
+    """(base_url, model_id, api_key) for the game_master role, or None for an unknown provider.
+
+    base_url / model_id override the environment (the web UI's per-session server
+    settings); base_url only applies to the local provider.
+    """
     provider = os.environ.get("STORY_ENGINE_PROVIDER", "local")
     role = "game_master"
 
     if provider == "local":
-        base_url = os.environ.get(
+        base_url = base_url or os.environ.get(
             f"STORY_ENGINE_{role.upper()}_BASE_URL",
             os.environ.get("STORY_ENGINE_LOCAL_BASE_URL", "http://localhost:1234/v1"),
         )
-        model_id = os.environ.get(f"STORY_ENGINE_{role.upper()}_MODEL", _DEFAULT_LOCAL_MODEL)
-        return AsyncOpenAI(base_url=base_url, api_key="not-needed"), model_id
+        model_id = model_id or os.environ.get(f"STORY_ENGINE_{role.upper()}_MODEL", _DEFAULT_LOCAL_MODEL)
+        return base_url, model_id, "not-needed"
 
     if provider == "openrouter":
-        model_id = os.environ.get(f"STORY_ENGINE_{role.upper()}_MODEL", "deepseek/deepseek-v3.2")
-        return (
-            AsyncOpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=os.environ["OPENROUTER_API_KEY"],
-            ),
-            model_id,
-        )
+        model_id = model_id or os.environ.get(f"STORY_ENGINE_{role.upper()}_MODEL", "deepseek/deepseek-v3.2")
+        return "https://openrouter.ai/api/v1", model_id, os.environ["OPENROUTER_API_KEY"]
 
-    raise ValueError(
-        f"Provider {provider!r} is not supported. Set STORY_ENGINE_PROVIDER to 'local' or 'openrouter'."
-    )
+    return None
 
 
-def get_vision_client_args() -> tuple[str, str, str] | None:
+def get_client(base_url: str | None = None, model_id: str | None = None) -> tuple[AsyncOpenAI, str]:
+    """Return (AsyncOpenAI client, model_id) for the game_master role."""
+    endpoint = _endpoint(base_url, model_id)
+    if endpoint is None:
+        provider = os.environ.get("STORY_ENGINE_PROVIDER", "local")
+        raise ValueError(
+            f"Provider {provider!r} is not supported. Set STORY_ENGINE_PROVIDER to 'local' or 'openrouter'."
+        )
+    base_url, model_id, api_key = endpoint
+    return AsyncOpenAI(base_url=base_url, api_key=api_key), model_id
+
+
+def get_vision_client_args(
+    base_url: str | None = None, model_id: str | None = None
+) -> tuple[str, str, str] | None:
     """Return (base_url, model_id, api_key) for direct OpenAI-compat vision calls."""
-    provider = os.environ.get("STORY_ENGINE_PROVIDER", "local")
-    role = "game_master"
+    return _endpoint(base_url, model_id)
 
-    if provider == "local":
-        base_url = os.environ.get(
-            f"STORY_ENGINE_{role.upper()}_BASE_URL",
-            os.environ.get("STORY_ENGINE_LOCAL_BASE_URL", "http://localhost:1234/v1"),
-        )
-        model_id = os.environ.get(f"STORY_ENGINE_{role.upper()}_MODEL", _DEFAULT_LOCAL_MODEL)
-        return base_url, model_id, "not-needed"
 
-    if provider == "openrouter":
-        model_id = os.environ.get(f"STORY_ENGINE_{role.upper()}_MODEL", "deepseek/deepseek-v3.2")
-        return "https://openrouter.ai/api/v1", model_id, os.environ["OPENROUTER_API_KEY"]
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    try:
+        return max(0, int(raw)) if raw else default
+    except ValueError:
+        return default
 
-    return None
+
+def context_budget() -> int:
+    """Prompt token budget for the GM context window (STORY_ENGINE_CONTEXT_TOKENS, 0 = unlimited)."""
+    return _env_int("STORY_ENGINE_CONTEXT_TOKENS", 6144)
+
+
+def web_generation_limit() -> int:
+    """GM generations the web server runs at once (STORY_ENGINE_WEB_MAX_GENERATIONS, default 1)."""
+    return max(1, _env_int("STORY_ENGINE_WEB_MAX_GENERATIONS", 1))
+
+
+def web_idle_seconds() -> int:
+    """Idle time before a web session is moved to disk (STORY_ENGINE_WEB_IDLE_SECONDS, 0 = never)."""
+    return _env_int("STORY_ENGINE_WEB_IDLE_SECONDS", 1800)
+
+
+def web_max_sessions() -> int:
+    """Web sessions kept in memory at once (STORY_ENGINE_WEB_MAX_SESSIONS, 0 = no cap)."""
+    return _env_int("STORY_ENGINE_WEB_MAX_SESSIONS", 64)
+
+
+def vision_concurrency() -> int:
+    """Image descriptions requested at once at startup (STORY_ENGINE_VISION_CONCURRENCY, default 4)."""
+    return max(1, _env_int("STORY_ENGINE_VISION_CONCURRENCY", 4))
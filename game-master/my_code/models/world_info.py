@@ -0,0 +1,165 @@
+"""World info store — keyword-indexed lore entries with a one-pass activation matcher.
+
+Entries are keyed by their lowercased keyword, so add_world_info_entry upserts with
+one dict lookup instead of scanning every entry. activated(text) returns the
+entries whose keyword appears in the text as a whole word or phrase (the same
+rule as the old per-keyword r"\\b<keyword>\\b" search, case-insensitive) in one
+pass over the text:
+
+    - the text is split into \\w+ runs. A keyword that starts and ends with a
+      word character can only match whole runs, so for each run the spans of
+      1, 2, … runs (as many as the longest keyword has) are looked up in a set.
+      The cost depends on the text, not on how many entries there are, and
+      "dragon" and "red dragon" can both fire.
+    - keywords that start or end with punctuation ("Mr.", "'s") are found from
+      their first run and checked with explicit word boundaries
+    - keywords with no word character at all keep a compiled regex each
+
+The index is built on first use and rebuilt only when a keyword is added —
+changing an entry's content keeps it.
+
+Copy-on-write: shared() hands out the current entry dict for a turn checkpoint
+(turn_history.py) or the checkpoint journal, and the next write copies it first,
+so a checkpoint is never changed after it was taken. restore_shared() puts such
+a dict back. Both are O(1); the copy happens at most once per turn that edits lore.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass
+class WorldInfoEntry:
+    keyword: str                     # Trigger keyword (case-insensitive)
+    content: str                     # Prose injected when keyword matches
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _at_boundary(text: str, i: int) -> bool:
+    """True where re's \\b would match between text[i - 1] and text[i]."""
+    before = i > 0 and _is_word(text[i - 1])
+    after = i < len(text) and _is_word(text[i])
+    return before != after
+
+
+class KeywordMatcher:
+    """Index over a fixed set of lowercased keywords, matched in one pass over a text.
+
+    Also used for character trigger keywords (agents/game_master.py).
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        self.position: dict[str, int] = {}
+        self.spans: set[str] = set()            # keys that start and end with a word character
+        self.run_counts: list[int] = []         # distinct \w+ run counts among those keys
+        self.irregular: dict[str, list[tuple[str, int]]] = {}  # first run → (key, offset of that run)
+        self.patterns: list[tuple[str, re.Pattern]] = []       # keys without a word character
+        counts: set[int] = set()
+        for pos, key in enumerate(keys):
+            self.position[key] = pos
+            runs = _WORD_RE.findall(key)
+            if not runs:
+                self.patterns.append((key, re.compile(r"\b" + re.escape(key) + r"\b", re.IGNORECASE)))
+            elif _is_word(key[0]) and _is_word(key[-1]):
+                self.spans.add(key)
+                counts.add(len(runs))
+            else:
+                first = _WORD_RE.search(key)
+                self.irregular.setdefault(first.group(), []).append((key, first.start()))
+        self.run_counts = sorted(counts)
+
+    def match(self, text: str) -> set[str]:
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing changed the length (e.g. "İ"), so offsets no longer line up
+            return {key for key in self.position
+                    if re.search(r"\b" + re.escape(key) + r"\b", text, re.IGNORECASE)}
+
+        found: set[str] = set()
+        spans, run_counts, irregular = self.spans, self.run_counts, self.irregular
+        runs = [m.span() for m in _WORD_RE.finditer(lowered)]
+        n_runs = len(runs)
+        for i, (start, end) in enumerate(runs):
+            # A word-bounded key covers whole runs, so try the spans of runs i..i+n-1
+            for n in run_counts:
+                last = i + n - 1
+                if last >= n_runs:
+                    break
+                span = lowered[start:runs[last][1]]
+                if span in spans:
+                    found.add(span)
+            if irregular:
+                for key, offset in irregular.get(lowered[start:end], ()):
+                    at = start - offset
+                    if (
+                        at >= 0 and lowered.startswith(key, at)
+                        and _at_boundary(lowered, at) and _at_boundary(lowered, at + len(key))
+                    ):
+                        found.add(key)
+        for key, pattern in self.patterns:
+            if pattern.search(text):
+                found.add(key)
+        return found
+
+
+class WorldInfo:
+    """World info entries in insertion order, indexed by lowercased keyword."""
+
+    def __init__(self, entries: Iterable[WorldInfoEntry] = ()):
+        self._entries: dict[str, WorldInfoEntry] = {}
+        self._shared = False
+        self._matcher: KeywordMatcher | None = None
+        for entry in entries:
+            self.upsert(entry.keyword, entry.content)
+
+    def __iter__(self) -> Iterator[WorldInfoEntry]:
+        return iter(self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, keyword: str) -> WorldInfoEntry | None:
+        return self._entries.get(keyword.lower())
+
+    def upsert(self, keyword: str, content: str) -> bool:
+        """Add an entry, or replace the content of the one with this keyword. True if added."""
+        key = keyword.lower()
+        if self._shared:
+            self._entries = dict(self._entries)
+            self._shared = False
+        old = self._entries.get(key)
+        # Entries are replaced, never edited, so a shared dict keeps its values too
+        self._entries[key] = WorldInfoEntry(keyword=old.keyword if old else keyword, content=content)
+        if old is None:
+            self._matcher = None
+        return old is None
+
+    def activated(self, text: str) -> list[WorldInfoEntry]:
+        """Entries whose keyword occurs in `text`, in insertion order."""
+        if not self._entries:
+            return []
+        if self._matcher is None:
+            self._matcher = KeywordMatcher(self._entries)
+        found = self._matcher.match(text)
+        position = self._matcher.position
+        return [self._entries[key] for key in sorted(found, key=position.__getitem__)]
+
+    def shared(self) -> dict[str, WorldInfoEntry]:
+        """The current entries as a dict that will not change; the next write copies."""
+        self._shared = True
+        return self._entries
+
+    def restore_shared(self, entries: dict[str, WorldInfoEntry]) -> None:
+        """Put back a dict returned by shared()."""
+        if len(entries) != len(self._entries):  # keywords are never removed, so same length = same keys
+            self._matcher = None
+        self._entries = entries
+        self._shared = True
@@ -1,13 +1,14 @@
 """Adventure scenario file parser — reads .md files into AdventureScene objects.
 
 Same [section-name] format as story-engine. Drops [scene-beats]; adds [memory] and [opening].
+Tokenizing (and its path + mtime cache) lives in my_code/scene_format.py.
 """
 
 from __future__ import annotations
 
-import re
 from pathlib import Path
 
+from my_code import scene_format
 from my_code.models.data_models import AdventureScene, CharacterCard, Meta
 
 
@@ -17,60 +18,6 @@ class ParseError(Exception):
         super().__init__(f"[{section}]: {message}")
 
 
-# ---------------------------------------------------------------------------
-# Section splitter
-# ---------------------------------------------------------------------------
-
-_SECTION_RE = re.compile(r"^\[([a-z][a-z0-9_-]*)\]\s*$", re.MULTILINE)
-
-
-def _split_sections(text: str) -> dict[str, str]:
-    matches = list(_SECTION_RE.finditer(text))
-    if not matches:
-        raise ParseError("file", "No [section] markers found")
-    sections: dict[str, str] = {}
-    for i, m in enumerate(matches):
-        name = m.group(1)
-        start = m.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        sections[name] = text[start:end].strip()
-    return sections
-
-
-# ---------------------------------------------------------------------------
-# Key-value parser
-# ---------------------------------------------------------------------------
-
-def _parse_kv(text: str) -> dict[str, str]:
-    result: dict[str, str] = {}
-    current_key: str | None = None
-    current_lines: list[str] = []
-
-    for line in text.splitlines():
-        kv_match = re.match(r"^([a-z_]+)\s*:\s*(.*)", line)
-        if kv_match:
-            if current_key is not None:
-                result[current_key] = _join_lines(current_lines)
-            current_key = kv_match.group(1)
-            value = kv_match.group(2).strip()
-            current_lines = [] if value == ">" else [value]
-        elif current_key is not None and line.strip():
-            current_lines.append(line.strip())
-        elif current_key is not None and not line.strip():
-            if current_lines and current_lines[-1] != "":
-                current_lines.append("")
-
-    if current_key is not None:
-        result[current_key] = _join_lines(current_lines)
-    return result
-
-
-def _join_lines(lines: list[str]) -> str:
-    while lines and lines[-1] == "":
-        lines.pop()
-    return " ".join(l for l in lines if l).strip()
-
-
 # ---------------------------------------------------------------------------
 # Section parsers
 # ---------------------------------------------------------------------------
@@ -147,34 +94,33 @@ def parse_scene_file(file_path: str) -> AdventureScene:
     if not path.exists():
         raise FileNotFoundError(f"Scenario file not found: {file_path}")
 
-    raw = path.read_text(encoding="utf-8")
-    sections = _split_sections(raw)
+    tokens = scene_format.load(path)
+    sections = tokens.sections
+    if not sections:
+        raise ParseError("file", "No [section] markers found")
 
     for name in _REQUIRED:
         if name not in sections:
             raise ParseError(name, "Required section missing")
 
-    meta, scene_image = _parse_meta(_parse_kv(sections["meta"]))
+    meta, scene_image = _parse_meta(tokens.kv("meta"))
 
     # Characters
-    char_sections = sorted(
-        [(n, c) for n, c in sections.items() if n.startswith("character-")],
-        key=lambda x: int(x[0].split("-")[1]),
-    )
+    char_sections = tokens.numbered("character")
     if not char_sections:
         raise ParseError("character-*", "At least one character card is required")
-    characters = [_parse_character(n, _parse_kv(c)) for n, c in char_sections]
+    characters = [_parse_character(n, tokens.kv(n)) for n, _ in char_sections]
 
     # Scene setup
     scene_setup = ""
     if "scene-setup" in sections:
-        scene_setup = _parse_scene_setup(_parse_kv(sections["scene-setup"]))
+        scene_setup = _parse_scene_setup(tokens.kv("scene-setup"))
 
     # Author note
     author_note = ""
     author_note_depth = 4
     if "author-note" in sections:
-        author_note, author_note_depth = _parse_author_note(_parse_kv(sections["author-note"]))
+        author_note, author_note_depth = _parse_author_note(tokens.kv("author-note"))
 
     return AdventureScene(
         meta=meta,
@@ -0,0 +1,268 @@
+"""Stub LLM server — a deterministic OpenAI-compatible endpoint for load tests.
+
+Serves /v1/chat/completions on localhost with no model behind it:
+
+    - streaming requests (GM turns)      → a narration paragraph, streamed in
+                                           `chunks` pieces, `chunk_delay` apart
+    - with tool_calls=True, a player turn
+      that mentions a risky action        → roll_dice + update_memory tool calls,
+                                           streamed without ids; the tool round
+                                           that follows gets the narration
+    - "Reply YES or NO" (NSFW check)     → NO
+    - anything else non-streaming        → a one-line summary
+
+Every request waits `ttft` seconds before its first byte. Answers depend only on
+the request, so runs are repeatable. The server counts requests and tracks how
+many streams were in flight at once, so a caller can check the web server's
+generation cap.
+
+Prefix-cache accounting: each request is flattened the way a chat template would
+(tool schemas, then every message with its tool calls and ids) and compared with
+the prompts held in `slots` cache slots, as llama.cpp does with cache_prompt. The
+longest common prefix counts as reused, the rest as prefill. stats.prefill has
+one (prompt_chars, reused_chars, is_tool_round) entry per GM request.
+
+Usage (standalone):
+    python -m my_code.stub_server --port 8092 --ttft 0.2
+    STORY_ENGINE_LOCAL_BASE_URL=http://127.0.0.1:8092/v1 python -m my_code --ui web
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_WORDS = (
+    "fog ash lantern ruin stone vault bell whisper ember blade gate shadow "
+    "moss iron river oath crown silence dust candle"
+).split()
+
+
+def _prompt_text(body: dict) -> str:
+    content = (body.get("messages") or [{}])[-1].get("content") or ""
+    if isinstance(content, list):
+        return "".join(c.get("text", "") for c in content if isinstance(c, dict))
+    return str(content)
+
+
+_TOOL_WORDS = ("attack", "climb", "sneak", "persuade", "pick the lock")
+
+
+def render_prompt(body: dict) -> str:
+    """Flatten a chat request the way a chat template would, for prefix accounting."""
+    parts = [json.dumps(body.get("tools") or [], ensure_ascii=False)]
+    for m in body.get("messages") or ():
+        parts.append(f"<|{m.get('role')}|>")
+        content = m.get("content")
+        if isinstance(content, list):
+            content = "".join(c.get("text", "") for c in content if isinstance(c, dict))
+        parts.append(content or "")
+        for tc in m.get("tool_calls") or ():
+            fn = tc.get("function") or {}
+            parts.append(f"<tool_call id={tc.get('id')}>{fn.get('name')}{fn.get('arguments')}</tool_call>")
+        if m.get("tool_call_id") is not None:
+            parts.append(f"<tool_result id={m['tool_call_id']}>")
+        parts.append("<|end|>")
+    return "".join(parts)
+
+
+def _common_prefix(a: str, b: str) -> int:
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:  # binary search on slice equality — the comparisons run in C
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _wants_tools(body: dict) -> bool:
+    last = (body.get("messages") or [{}])[-1]
+    return bool(body.get("tools")) and last.get("role") == "user" and any(
+        w in _prompt_text(body).rpartition("---")[2].lower() for w in _TOOL_WORDS
+    )
+
+
+def narration_for(body: dict) -> str:
+    """Deterministic GM narration for a chat-completions request body."""
+    seed = hashlib.sha1(_prompt_text(body).encode("utf-8")).digest()
+    sentences = []
+    for i in range(0, 18, 6):
+        words = " ".join(_WORDS[b % len(_WORDS)] for b in seed[i:i + 6])
+        sentences.append(f"The {words} shifts around you.")
+    return " ".join(sentences)
+
+
+class StubStats:
+    def __init__(self, slots: int = 4):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.streams_in_flight = 0
+        self.max_streams_in_flight = 0
+        self.slots: list[str] = [""] * slots          # cached prompts, least recently used first
+        self.prefill: list[tuple[int, int, bool]] = []
+
+    def account(self, body: dict) -> None:
+        prompt = render_prompt(body)
+        is_tool_round = ((body.get("messages") or [{}])[-1]).get("role") == "tool"
+        with self.lock:
+            best = max(range(len(self.slots)), key=lambda i: _common_prefix(self.slots[i], prompt))
+            reused = _common_prefix(self.slots[best], prompt)
+            if reused == 0:
+                best = 0  # nothing shared: take the least recently used slot
+            del self.slots[best]
+            self.slots.append(prompt)
+            self.prefill.append((len(prompt), reused, is_tool_round))
+
+
+def _make_handler(stats: StubStats, ttft: float, chunk_delay: float, chunks: int, tool_calls: bool):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self.send_error(404)
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            with stats.lock:
+                stats.requests += 1
+            if body.get("stream"):
+                stats.account(body)
+                with stats.lock:
+                    stats.streams_in_flight += 1
+                    stats.max_streams_in_flight = max(stats.max_streams_in_flight, stats.streams_in_flight)
+                try:
+                    time.sleep(ttft)
+                    if tool_calls and _wants_tools(body):
+                        self._stream_tool_calls(body)
+                    else:
+                        self._stream(body, narration_for(body))
+                finally:
+                    with stats.lock:
+                        stats.streams_in_flight -= 1
+                return
+
+            time.sleep(ttft)
+            prompt = _prompt_text(body)
+            content = "NO" if "Reply YES or NO" in prompt else "You pressed on through the ruins."
+            data = json.dumps({
+                "id": "stub", "object": "chat.completion", "created": int(time.time()),
+                "model": body.get("model", "stub"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                             "finish_reason": "stop"}],
+            }).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _chunk(self, data: bytes) -> None:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+        def _begin_stream(self, body: dict):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            base = {"id": "stub", "object": "chat.completion.chunk",
+                    "created": int(time.time()), "model": body.get("model", "stub")}
+
+            def event(delta: dict, finish_reason=None):
+                payload = {**base, "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+                self._chunk(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+
+            return event
+
+        def _end_stream(self) -> None:
+            self._chunk(b"data: [DONE]\n\n")
+            self._chunk(b"")
+
+        def _stream_tool_calls(self, body: dict) -> None:
+            # Compact JSON split mid-token and no ids, as some local servers send them
+            event = self._begin_stream(body)
+            seed = hashlib.sha1(_prompt_text(body).encode("utf-8")).digest()
+            calls = (
+                ("roll_dice", f'{{"notation":"1d20+{seed[0] % 5}"}}'),
+                ("update_memory", f'{{"content":"The player tried something risky ({_WORDS[seed[1] % len(_WORDS)]})."}}'),
+            )
+            for index, (name, args) in enumerate(calls):
+                event({"tool_calls": [{"index": index, "type": "function",
+                                       "function": {"name": name, "arguments": ""}}]})
+                for i in range(0, len(args), 8):
+                    time.sleep(chunk_delay)
+                    event({"tool_calls": [{"index": index, "function": {"arguments": args[i:i + 8]}}]})
+            event({}, "tool_calls")
+            self._end_stream()
+
+        def _stream(self, body: dict, content: str) -> None:
+            event = self._begin_stream(body)
+            step = max(1, -(-len(content) // chunks))
+            for i in range(0, len(content), step):
+                if i:
+                    time.sleep(chunk_delay)
+                event({"content": content[i:i + step]})
+            event({}, "stop")
+            self._end_stream()
+
+    return Handler
+
+
+class StubServer:
+    """Threaded stub LLM on localhost; use as a context manager."""
+
+    def __init__(
+        self, port: int = 0, ttft: float = 0.1, chunk_delay: float = 0.01, chunks: int = 20,
+        tool_calls: bool = False, slots: int = 4,
+    ):
+        self.stats = StubStats(slots)
+        self.httpd = ThreadingHTTPServer(
+            ("127.0.0.1", port), _make_handler(self.stats, ttft, chunk_delay, chunks, tool_calls)
+        )
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deterministic OpenAI-compatible stub LLM.")
+    parser.add_argument("--port", type=int, default=8092)
+    parser.add_argument("--ttft", type=float, default=0.1, help="seconds before the first byte")
+    parser.add_argument("--chunk-delay", type=float, default=0.01, help="seconds between stream chunks")
+    parser.add_argument("--tool-calls", action="store_true", help="answer risky player actions with tool calls")
+    args = parser.parse_args()
+    with StubServer(args.port, args.ttft, args.chunk_delay, tool_calls=args.tool_calls) as server:
+        print(f"Stub LLM on {server.base_url} — Ctrl-C to stop")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Tool-round replay — how much of each GM request a prefix-caching server can reuse.
+
+Plays a scripted adventure through _stream_gm against the stub LLM
+(my_code/stub_server.py) with tool calls enabled. Every other action is a risky
+one ("attack", "climb", …), which the stub answers with roll_dice and
+update_memory calls, so that turn makes a second request: the tool round.
+
+For every request the stub reports the prompt size and the longest prefix it
+shares with a cached earlier prompt (see StubStats.account). A tool round is
+cheap only if everything before the new assistant tool-call message and tool
+results is reused — its prefill should equal its delta, the size of those new
+messages.
+
+Reported, per turn: tool rounds and calls, the time of each model call
+(TurnStats), and per request the prompt size, reused prefix and prefill; then
+totals against a server without a prefix cache.
+
+Usage:
+    python -m my_code.tool_replay
+    python -m my_code.tool_replay --turns 20 --ttft 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+from pathlib import Path
+
+from my_code.stub_server import StubServer
+
+_SCENARIO = Path(__file__).parent.parent / "scenarios" / "ashenveil.md"
+
+_ACTIONS = (
+    "look around the courtyard",
+    "attack the ghoul by the well",
+    "ask the scout what she saw",
+    "climb the broken tower",
+    "search the altar for markings",
+    "sneak past the sleeping hound",
+    "rest by the fire",
+    "persuade the monk to open the gate",
+)
+
+
+class _QuietUI:
+    def gm_start(self) -> None:
+        pass
+
+    def gm_chunk(self, _: str) -> None:
+        pass
+
+    def gm_end(self) -> None:
+        pass
+
+    def system(self, _: str) -> None:
+        pass
+
+
+def _tok(chars: int) -> str:
+    return f"{chars / 4 / 1000:.1f}k" if chars >= 4000 else str(chars // 4)
+
+
+async def _play(turns: int, stub: StubServer) -> list[tuple]:
+    from my_code.agents.game_master import build_system_prompt, build_turn_message
+    from my_code.game_loop import TurnStats, _stream_gm
+    from my_code.models.data_models import GameState
+    from my_code.models.provider import get_client
+    from my_code.parser import parse_scene_file
+
+    scene = parse_scene_file(str(_SCENARIO))
+    state = GameState.from_scene(scene)
+    client, model = get_client()
+    system = build_system_prompt(scene)
+    last_response = scene.opening.strip()
+    messages = [{"role": "assistant", "content": last_response}]
+    ui = _QuietUI()
+
+    rows = []
+    for turn in range(turns):
+        action = _ACTIONS[turn % len(_ACTIONS)]
+        state.turn_count += 1
+        messages.append({"role": "user", "content": build_turn_message(f"You {action}", last_response, state)})
+        stats = TurnStats()
+        first = len(stub.stats.prefill)
+        last_response = await _stream_gm(client, model, system, messages, state, ui, stats)
+        state.story_log.append(last_response)
+        rows.append((state.turn_count, action, stats, stub.stats.prefill[first:]))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Replay tool-calling turns against the stub LLM and report prefix reuse")
+    ap.add_argument("--turns", type=int, default=12)
+    ap.add_argument("--ttft", type=float, default=0.05, help="stub seconds before the first byte")
+    ap.add_argument("--chunk-delay", type=float, default=0.002, help="stub seconds between chunks")
+    args = ap.parse_args(argv)
+
+    random.seed(0)  # dice results
+    with StubServer(ttft=args.ttft, chunk_delay=args.chunk_delay, tool_calls=True) as stub:
+        os.environ["STORY_ENGINE_PROVIDER"] = "local"
+        os.environ["STORY_ENGINE_LOCAL_BASE_URL"] = stub.base_url
+        os.environ.pop("STORY_ENGINE_GAME_MASTER_BASE_URL", None)
+        rows = asyncio.run(_play(args.turns, stub))
+
+    print(f"{args.turns} turns, stub ttft {args.ttft * 1e3:.0f} ms — sizes in estimated tokens (chars / 4)\n")
+    print(f"{'turn':>4}  {'action':<36} {'tools':>5}  {'model calls (s)':<16} requests: prompt / reused / prefill")
+    total = reused = 0
+    tool_prefill = tool_delta = tool_requests = 0
+    for turn, action, stats, records in rows:
+        calls = " + ".join(f"{t:.2f}" for t in stats.call_seconds)
+        cells = []
+        prev_chars = None
+        for chars, hit, is_tool_round in records:
+            total += chars
+            reused += hit
+            cells.append(f"{_tok(chars)}/{_tok(hit)}/{_tok(chars - hit)}")
+            if is_tool_round and prev_chars is not None:
+                tool_requests += 1
+                tool_prefill += chars - hit
+                tool_delta += chars - prev_chars
+            prev_chars = chars
+        print(f"{turn:>4}  {action:<36} {stats.tool_calls:>5}  {calls:<16} {'  →  '.join(cells)}")
+
+    print()
+    print(f"Prompt processed   : {_tok(total)} tokens sent, {_tok(total - reused)} prefilled "
+          f"({100 * reused / max(total, 1):.1f}% served from the prefix cache)")
+    if tool_requests:
+        print(f"Tool rounds        : {tool_requests}, prefill {_tok(tool_prefill)} tokens for a delta of "
+              f"{_tok(tool_delta)} (ratio {tool_prefill / max(tool_delta, 1):.2f}; 1.00 = only the new messages)")
+    print(f"Without a cache    : every request would prefill its whole prompt — {_tok(total)} tokens")
+
+
+if __name__ == "__main__":
+    main()
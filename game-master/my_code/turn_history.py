@@ -0,0 +1,141 @@
+"""Turn history — constant-time checkpoints for /regen and /undo.
+
+Before every GM turn the loops used to copy the whole message list and call
+state.snapshot(), which copies the story log and world info, so each turn paid
+O(history) for a rollback that is rarely used. Only one level was kept.
+
+A checkpoint now holds positions and references, never copies:
+
+    messages        end position in the message log
+    story_log       length
+    world info      the store's entry dict, shared copy-on-write (see
+                    models/world_info.py)
+    scalar fields   memory, author's note, turn count, input mode, story summary
+    turn            last response and turn message, for /regen
+
+This works because between checkpoints the loops only append to `messages` and
+story_log, or change the newest entry (/edit). The one exception is
+context-window eviction, which drops messages from the head; compact() hands
+them to note_evicted() and they are kept until no checkpoint can need them.
+Message positions count every message since the last clear(), evicted or not, so
+they stay valid across evictions.
+
+Restoring truncates the live lists back to the checkpoint and re-prepends any
+messages evicted since. The cost is proportional to what is undone, not to the
+length of the adventure. Checkpoints form a stack, so /undo can step back up to
+`max_levels` turns.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+
+from my_code.models.data_models import GameState, WorldInfoEntry
+
+_FIELDS = ("memory", "author_note", "turn_count", "input_mode", "story_summary")
+
+
+@dataclass(frozen=True)
+class TurnCheckpoint:
+    evicted_at: int                     # messages evicted before this checkpoint
+    messages_end: int                   # evicted_at + len(messages)
+    log_len: int
+    world_info: dict[str, WorldInfoEntry]   # from WorldInfo.shared(), never mutated
+    fields: tuple
+    last_response: str
+    turn_message: str
+
+
+class TurnHistory:
+    """Stack of turn checkpoints over the live messages list and GameState."""
+
+    def __init__(self, max_levels: int = 50):
+        self.max_levels = max_levels
+        self._checkpoints: deque[TurnCheckpoint] = deque()
+        self._evicted: list[dict] = []   # evicted messages still reachable from a checkpoint
+        self._evicted_base = 0           # position of _evicted[0]
+        self._evicted_total = 0          # messages evicted since clear()
+
+    def __len__(self) -> int:
+        return len(self._checkpoints)
+
+    def clear(self) -> None:
+        """Forget every checkpoint (after a load, or when the message list is replaced)."""
+        self._checkpoints.clear()
+        self._evicted.clear()
+        self._evicted_base = self._evicted_total = 0
+
+    @property
+    def latest(self) -> TurnCheckpoint | None:
+        return self._checkpoints[-1] if self._checkpoints else None
+
+    def checkpoint(self, state: GameState, messages: list[dict], last_response: str, turn_message: str) -> None:
+        """Record the state before a turn. O(1)."""
+        self._checkpoints.append(TurnCheckpoint(
+            evicted_at=self._evicted_total,
+            messages_end=self._evicted_total + len(messages),
+            log_len=len(state.story_log),
+            world_info=state.world_info_entries.shared(),
+            fields=tuple(getattr(state, name) for name in _FIELDS),
+            last_response=last_response,
+            turn_message=turn_message,
+        ))
+        if len(self._checkpoints) > self.max_levels:
+            self._checkpoints.popleft()
+            self._release_evicted()
+
+    def note_evicted(self, evicted: list[dict]) -> None:
+        """Called by compact() with the messages it is about to drop from the head."""
+        self._evicted_total += len(evicted)
+        if self._checkpoints:
+            self._evicted.extend(evicted)
+        else:
+            self._evicted_base = self._evicted_total
+
+    def regen(self, state: GameState, messages: list[dict]) -> TurnCheckpoint | None:
+        """Roll back to just before the newest turn's GM call, keeping the checkpoint.
+
+        The caller re-appends checkpoint.turn_message and generates again.
+        Returns None if there is no checkpoint.
+        """
+        if not self._checkpoints:
+            return None
+        cp = self._checkpoints[-1]
+        self._restore(cp, state, messages)
+        return cp
+
+    def undo(self, state: GameState, messages: list[dict]) -> TurnCheckpoint | None:
+        """Drop the newest turn entirely. Returns its checkpoint, or None if there is none."""
+        if not self._checkpoints:
+            return None
+        cp = self._checkpoints.pop()
+        self._restore(cp, state, messages)
+        # Checkpoints are taken after the turn is counted (the turn message depends on it)
+        state.turn_count = max(0, state.turn_count - 1)
+        self._release_evicted()
+        return cp
+
+    def _restore(self, cp: TurnCheckpoint, state: GameState, messages: list[dict]) -> None:
+        keep = cp.messages_end - self._evicted_total
+        if cp.evicted_at == self._evicted_total:
+            del messages[keep:]
+        else:
+            # Evicted since the checkpoint: put those messages back in front
+            start = cp.evicted_at - self._evicted_base
+            stop = min(cp.messages_end, self._evicted_total) - self._evicted_base
+            messages[:] = self._evicted[start:stop] + messages[:max(0, keep)]
+            del self._evicted[start:]
+            self._evicted_total = cp.evicted_at
+
+        del state.story_log[cp.log_len:]
+        state.world_info_entries.restore_shared(cp.world_info)
+        for name, value in zip(_FIELDS, cp.fields):
+            setattr(state, name, value)
+
+    def _release_evicted(self) -> None:
+        oldest = self._checkpoints[0].evicted_at if self._checkpoints else self._evicted_total
+        drop = oldest - self._evicted_base
+        if drop > 0:
+            del self._evicted[:drop]
+            self._evicted_base = oldest
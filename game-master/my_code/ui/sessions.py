@@ -0,0 +1,273 @@
+"""Web sessions — per-player game state, a fair generation gate, idle eviction to disk.
+
+The web UI used to keep one game in a module-level dict, so two players (or two
+tabs) shared one GameState. Each player now has a WebSession, found by the
+X-Game-Session header (one per browser tab) or the gm_session cookie:
+
+    SessionStore       live sessions in LRU order; sessions idle longer than
+                       STORY_ENGINE_WEB_IDLE_SECONDS, or least recently used past
+                       STORY_ENGINE_WEB_MAX_SESSIONS, are written to
+                       saves/sessions/ and dropped from memory. The next request
+                       with that id restores them.
+    GenerationGate     at most STORY_ENGINE_WEB_MAX_GENERATIONS GM generations run
+                       at once against the shared endpoint; the rest wait in
+                       arrival order. A session runs one turn at a time, so FIFO
+                       is round-robin across players.
+
+On disk a session is its checkpoint journal (<id>.json + <id>.journal, see
+checkpoint.py) plus <id>.session.json, which holds what the journal does not: the
+scenario path, the built system prompt (with any image descriptions), the
+per-session server settings and the last response. The player's manual saves go
+in <id>/, so /api/saves and /api/load only ever see that session's own saves. The turn history is not
+kept — after a restore /regen is unavailable until the next turn, as after /load,
+and /undo falls back to removing the last player turn.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+import secrets
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from openai import AsyncOpenAI
+
+from my_code.checkpoint import CheckpointJournal, load_save
+from my_code.models.data_models import AdventureScene, GameState
+from my_code.models.provider import get_client, get_vision_client_args
+from my_code.parser import parse_scene_file
+from my_code.turn_history import TurnHistory
+
+_ID_RE = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+
+
+# ---------------------------------------------------------------------------
+# Shared clients
+# ---------------------------------------------------------------------------
+
+_clients: dict[tuple[str, str], tuple[AsyncOpenAI, str]] = {}
+
+
+def shared_client(server_url: str = "", model_override: str = "") -> tuple[AsyncOpenAI, str]:
+    """One (client, model) per server setting, shared by every session that uses it."""
+    key = (server_url, model_override)
+    if key not in _clients:
+        _clients[key] = get_client(server_url or None, model_override or None)
+    return _clients[key]
+
+
+# ---------------------------------------------------------------------------
+# Session
+# ---------------------------------------------------------------------------
+
+@dataclass
+class WebSession:
+    sid: str
+    scenario: str                    # scene file path, re-parsed on restore
+    server_url: str                  # setup-screen overrides; "" = environment
+    model_override: str
+    scene: AdventureScene
+    state: GameState
+    system: str
+    client: AsyncOpenAI
+    model: str
+    vision_capable: bool
+    vision_client_args: tuple | None
+    journal: CheckpointJournal
+    messages: list[dict] = field(default_factory=list)
+    last_response: str = ""
+    history: TurnHistory = field(default_factory=TurnHistory)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_seen: float = field(default_factory=time.monotonic)
+
+    def meta(self) -> dict:
+        return {
+            "scenario": self.scenario,
+            "server_url": self.server_url,
+            "model_override": self.model_override,
+            "system": self.system,
+            "vision_capable": self.vision_capable,
+            "last_response": self.last_response,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class SessionStore:
+    """Live sessions in LRU order, with idle and over-cap sessions moved to disk."""
+
+    def __init__(self, directory: Path, idle_seconds: int, max_sessions: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.idle_seconds = idle_seconds
+        self.max_sessions = max_sessions
+        self._live: OrderedDict[str, WebSession] = OrderedDict()
+        self.evicted = 0
+        self.restored = 0
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    @staticmethod
+    def new_id() -> str:
+        return secrets.token_urlsafe(18)
+
+    @staticmethod
+    def valid_id(sid: str | None) -> bool:
+        # Ids become file names — nothing outside this alphabet is accepted
+        return bool(sid) and bool(_ID_RE.match(sid))
+
+    def journal_for(self, sid: str) -> CheckpointJournal:
+        return CheckpointJournal(self.directory / f"{sid}.json")
+
+    def saves_dir(self, sid: str) -> Path:
+        """Where this session's manual saves go — other players never see them."""
+        return self.directory / sid
+
+    def live(self, sid: str) -> WebSession | None:
+        return self._live.get(sid)
+
+    def get(self, sid: str | None) -> WebSession | None:
+        """The session for `sid`, restored from disk if it was evicted."""
+        if not self.valid_id(sid):
+            return None
+        sess = self._live.get(sid)
+        if sess is None:
+            sess = self._restore(sid)
+            if sess is None:
+                return None
+            self.restored += 1
+            self._live[sid] = sess
+            self._enforce_cap(keep=sid)
+        self._live.move_to_end(sid)
+        sess.last_seen = time.monotonic()
+        return sess
+
+    def add(self, sess: WebSession) -> None:
+        self._live[sess.sid] = sess
+        self._live.move_to_end(sess.sid)
+        self._write_meta(sess)
+        self._enforce_cap(keep=sess.sid)
+
+    def trim(self) -> None:
+        """Re-apply max_sessions once a turn ends; sessions busy earlier may now be evicted."""
+        self._enforce_cap(keep=None)
+
+    def sweep(self) -> int:
+        """Evict sessions idle longer than idle_seconds. Returns how many were evicted."""
+        if self.idle_seconds <= 0:
+            return 0
+        cutoff = time.monotonic() - self.idle_seconds
+        idle = [s for s in self._live.values() if s.last_seen < cutoff and not s.lock.locked()]
+        for sess in idle:
+            self._evict(sess)
+        return len(idle)
+
+    def persist_all(self) -> None:
+        for sess in list(self._live.values()):
+            if not sess.lock.locked():
+                self._evict(sess)
+
+    def _enforce_cap(self, keep: str | None) -> None:
+        """Evict least recently used idle sessions past max_sessions (busy ones stay)."""
+        if self.max_sessions <= 0:
+            return
+        for sess in list(self._live.values()):  # oldest first
+            if len(self._live) <= self.max_sessions:
+                break
+            if sess.sid != keep and not sess.lock.locked():
+                self._evict(sess)
+
+    def _evict(self, sess: WebSession) -> None:
+        sess.journal.record(sess.state, sess.messages)
+        self._write_meta(sess)
+        del self._live[sess.sid]
+        self.evicted += 1
+
+    def _write_meta(self, sess: WebSession) -> None:
+        path = self.directory / f"{sess.sid}.session.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(sess.meta(), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _restore(self, sid: str) -> WebSession | None:
+        meta_path = self.directory / f"{sid}.session.json"
+        save_path = self.directory / f"{sid}.json"
+        if not meta_path.exists() or not save_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        data = load_save(save_path)
+        scene = parse_scene_file(meta["scenario"])
+        state = GameState.from_scene(scene)
+        state.restore(data)
+        state.vision_capable = meta["vision_capable"]
+        client, model = shared_client(meta["server_url"], meta["model_override"])
+        return WebSession(
+            sid=sid,
+            scenario=meta["scenario"],
+            server_url=meta["server_url"],
+            model_override=meta["model_override"],
+            scene=scene,
+            state=state,
+            system=meta["system"],
+            client=client,
+            model=model,
+            vision_capable=meta["vision_capable"],
+            vision_client_args=get_vision_client_args(meta["server_url"] or None, meta["model_override"] or None),
+            journal=self.journal_for(sid),
+            messages=data.get("messages", []),
+            last_response=meta["last_response"],
+        )
+
+
+# ---------------------------------------------------------------------------
+# Generation gate
+# ---------------------------------------------------------------------------
+
+class GenerationGate:
+    """FIFO slots for GM generations against the shared LLM endpoint."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def slot(self):
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+        else:
+            fut = asyncio.get_running_loop().create_future()
+            self._waiters.append(fut)
+            try:
+                await fut  # _release() hands the slot over without decrementing
+            except asyncio.CancelledError:
+                if fut.done() and not fut.cancelled():
+                    self._release()  # slot arrived as we were cancelled — pass it on
+                elif fut in self._waiters:
+                    self._waiters.remove(fut)
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        while self._waiters:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self.active -= 1
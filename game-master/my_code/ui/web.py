@@ -1,6 +1,7 @@
 """FastAPI web UI for the game-master adventure engine.
 
-Single-user local app. One session lives in module-level state.
+Multi-player: each browser tab gets its own session (ui/sessions.py), keyed by
+the X-Game-Session header or the gm_session cookie.
 Run with: python -m my_code --ui web
 Connect from any browser on the LAN: http://<host-ip>:7860
 """
@@ -10,26 +11,35 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import os
 import tempfile
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Optional
 
-from fastapi import FastAPI, File, Form, UploadFile
+from fastapi import FastAPI, File, Form, Request, UploadFile
 from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, StreamingResponse
 
+from my_code import scene_format
 from my_code.agents.game_master import build_system_prompt, build_turn_message
+from my_code.checkpoint import load_save
+from my_code.context_window import compact
 from my_code.game_loop import _EXPORTS_DIR, _SAVES_DIR, _stream_gm
 from my_code.models.data_models import GameState, WorldInfoEntry
-from my_code.models.provider import get_client, get_vision_client_args
+from my_code.models.provider import (
+    get_vision_client_args,
+    web_generation_limit,
+    web_idle_seconds,
+    web_max_sessions,
+)
 from my_code.parser import ParseError, parse_scene_file
-from my_code.vision.describer import describe_image
+from my_code.ui.sessions import GenerationGate, SessionStore, WebSession, shared_client
+from my_code.vision.describer import describe_image, describe_images
 from my_code.vision.probe import probe_vision
 
 logger = logging.getLogger("game_master.web")
 
 
-# ── NSFW CLASSIFIER BEGIN (revert by removing this function) ────────────────
+# ── NSFW CLASSIFIER BEGIN (revert by removing these functions) ──────────────
 async def _classify_nsfw(text: str, client, model: str) -> bool:
     """Returns True if the text contains explicit sexual content, False otherwise.
     Uses a single non-streaming LLM call with max_tokens=1 for minimal latency."""
@@ -55,40 +65,37 @@ async def _classify_nsfw(text: str, client, model: str) -> bool:
     except Exception as exc:
         logger.warning("NSFW classifier error (skipping check): %s", exc)
         return False
+
+
+_background: set[asyncio.Task] = set()  # keeps fire-and-forget tasks referenced until done
+
+
+def _log_nsfw_verdict(task: asyncio.Task, turn: int, title: str, text: str) -> None:
+    """Log a flagged action once its classifier task finishes."""
+    def report(t: asyncio.Task) -> None:
+        _background.discard(t)
+        if not t.cancelled() and t.result():
+            logger.warning("NSFW bypass attempt (turn %d, scenario: %s) — %r", turn, title, text)
+
+    _background.add(task)
+    task.add_done_callback(report)
 # ── NSFW CLASSIFIER END ──────────────────────────────────────────────────────
 
 _STATIC = Path(__file__).parent / "static"
+_SESSIONS_DIR = _SAVES_DIR / "sessions"
+_COOKIE = "gm_session"
+_HEADER = "x-game-session"
+_SWEEP_INTERVAL = 60.0
 
 
-# ---------------------------------------------------------------------------
-# Global session (single user)
-# ---------------------------------------------------------------------------
+def _session_id(request: Request) -> str | None:
+    return request.headers.get(_HEADER) or request.cookies.get(_COOKIE)
 
-_sess: dict[str, Any] = {
-    "scene": None,
-    "state": None,
-    "messages": [],
-    "system": "",
-    "last_response": "",
-    "turn_snapshot": None,
-    "client": None,
-    "model": "",
-    "vision_capable": False,
-    "vision_client_args": None,
-    "lock": None,
-}
-
-
-def _lock() -> asyncio.Lock:
-    if _sess["lock"] is None:
-        _sess["lock"] = asyncio.Lock()
-    return _sess["lock"]
-
-
-def _state_payload() -> dict:
-    state: GameState | None = _sess["state"]
-    if state is None:
+
+def _state_payload(sess: WebSession | None) -> dict:
+    if sess is None:
         return {}
+    state = sess.state
     return {
         "memory": state.memory,
         "author_note": state.author_note,
@@ -97,6 +104,10 @@ def _state_payload() -> dict:
     }
 
 
+_NO_GAME = {"error": "No game in progress."}
+_BUSY = {"error": "A turn is already in progress."}
+
+
 # ---------------------------------------------------------------------------
 # Minimal UI adapter: feeds stream chunks into an asyncio queue
 # ---------------------------------------------------------------------------
@@ -125,8 +136,14 @@ def _sse(data: dict) -> str:
     return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
 
 
-def _do_save(name: str, state: GameState, messages: list) -> None:
-    path = _SAVES_DIR / f"{name}.json"
+def _valid_save_name(name: str) -> bool:
+    # Names become file names inside the session's save directory — no escaping it
+    return bool(name) and name not in (".", "..") and "/" not in name and "\\" not in name
+
+
+def _do_save(directory: Path, name: str, state: GameState, messages: list) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.json"
     path.write_text(json.dumps({**state.snapshot(), "messages": messages}, indent=2), encoding="utf-8")
 
 
@@ -134,25 +151,74 @@ def _do_save(name: str, state: GameState, messages: list) -> None:
 # Streaming helper
 # ---------------------------------------------------------------------------
 
-async def _run_and_drain(ui: _WebUI, client, model, system, messages, state) -> str:
-    """Run _stream_gm and put a None sentinel on the queue when done."""
-    try:
-        result = await _stream_gm(client, model, system, messages, state, ui)
-    except Exception as exc:
-        ui.queue.put_nowait(f"\n\n[Error: {exc}]")
-        result = ""
-    finally:
-        ui.queue.put_nowait(None)
+async def _run_and_drain(ui: _WebUI, gate: GenerationGate, sess: WebSession) -> str:
+    """Run _stream_gm in a generation slot and put a None sentinel on the queue when done.
+
+    Context trimming runs in the same slot, after the sentinel, so the player sees
+    the full text before any summary call and the summary call is still gated.
+    """
+    async with gate.slot():
+        try:
+            result = await _stream_gm(sess.client, sess.model, sess.system, sess.messages, sess.state, ui)
+        except Exception as exc:
+            ui.queue.put_nowait(f"\n\n[Error: {exc}]")
+            result = ""
+        finally:
+            ui.queue.put_nowait(None)
+        await compact(sess.client, sess.model, sess.system, sess.messages, sess.state, history=sess.history)
     return result
 
 
+async def _describe_startup_images(scene, vision_client_args) -> str:
+    # Same labels as the terminal's _setup_vision, so both share cached descriptions
+    jobs: list[tuple[str, str, str]] = []
+    if scene.scene_image and Path(scene.scene_image).exists():
+        jobs.append((scene.scene_image, "the game scene and environment", "Scene"))
+    for char in scene.characters:
+        if char.portrait and Path(char.portrait).exists():
+            jobs.append((char.portrait, f"the character {char.name}", char.name))
+    if not jobs:
+        return ""
+    results = await describe_images([(path, label) for path, label, _ in jobs], vision_client_args)
+    return "\n\n".join(
+        f"{prefix}: {desc}" for (_, _, prefix), desc in zip(jobs, results)
+        if not isinstance(desc, BaseException)
+    )
+
+
 # ---------------------------------------------------------------------------
 # App factory
 # ---------------------------------------------------------------------------
 
-def create_app(default_scenario: str | None = None) -> FastAPI:
-    app = FastAPI(title="Game Master")
+def create_app(default_scenario: str | None = None, sessions_dir: Path | None = None) -> FastAPI:
+    store = SessionStore(sessions_dir or _SESSIONS_DIR, web_idle_seconds(), web_max_sessions())
+    gate = GenerationGate(web_generation_limit())
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        async def sweeper():
+            while True:
+                await asyncio.sleep(_SWEEP_INTERVAL)
+                try:
+                    store.sweep()
+                except Exception as exc:
+                    logger.warning("Session sweep failed: %s", exc)
+
+        task = asyncio.create_task(sweeper())
+        try:
+            yield
+        finally:
+            task.cancel()
+            store.persist_all()
+
+    app = FastAPI(title="Game Master", lifespan=lifespan)
     app.state.default_scenario = default_scenario
+    app.state.sessions = store
+    app.state.gate = gate
+
+    def _stream(gen) -> StreamingResponse:
+        return StreamingResponse(gen, media_type="text/event-stream",
+                                 headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
     # ------------------------------------------------------------------
     # Static
@@ -170,25 +236,35 @@ def create_app(default_scenario: str | None = None) -> FastAPI:
     async def list_scenarios():
         d = Path(__file__).parent.parent.parent / "scenarios"
         files = sorted(d.glob("*.md")) if d.exists() else []
+        scenarios = []
+        for f in files:
+            # Cached by path + mtime — unchanged scenario files are not re-read per listing.
+            try:
+                title = scene_format.load(f).kv("meta").get("title", "")
+            except (OSError, UnicodeDecodeError):
+                title = ""
+            scenarios.append({"name": f.stem, "path": str(f), "title": title})
         return JSONResponse({
-            "scenarios": [{"name": f.stem, "path": str(f)} for f in files],
+            "scenarios": scenarios,
             "default": app.state.default_scenario,
         })
 
     @app.post("/api/start")
-    async def start_game(body: dict):
+    async def start_game(body: dict, request: Request):
         scenario_path = body.get("scenario") or app.state.default_scenario
         if not scenario_path:
             return JSONResponse({"error": "No scenario specified."}, status_code=400)
 
-        # Allow browser to override connection settings
+        sid = _session_id(request)
+        if not store.valid_id(sid):
+            sid = store.new_id()
+        current = store.live(sid)
+        if current is not None and current.lock.locked():
+            return JSONResponse(_BUSY, status_code=429)
+
+        # Browser connection settings apply to this session only
         server_url = body.get("server_url", "").strip()
         model_override = body.get("model", "").strip()
-        if server_url:
-            os.environ["STORY_ENGINE_LOCAL_BASE_URL"] = server_url
-            os.environ["STORY_ENGINE_GAME_MASTER_BASE_URL"] = server_url
-        if model_override:
-            os.environ["STORY_ENGINE_GAME_MASTER_MODEL"] = model_override
 
         try:
             scene = parse_scene_file(scenario_path)
@@ -196,13 +272,13 @@ def create_app(default_scenario: str | None = None) -> FastAPI:
             return JSONResponse({"error": str(exc)}, status_code=400)
 
         try:
-            client, model = get_client()
+            client, model = shared_client(server_url, model_override)
         except Exception as exc:
             return JSONResponse({"error": f"Provider error: {exc}"}, status_code=500)
 
         # Optional vision probe (skipped if body.vision is false/absent)
         vision_capable = False
-        vision_client_args = get_vision_client_args()
+        vision_client_args = get_vision_client_args(server_url or None, model_override or None)
         if vision_client_args and body.get("vision", False):
             try:
                 vision_capable = await asyncio.to_thread(probe_vision, *vision_client_args)
@@ -211,80 +287,62 @@ def create_app(default_scenario: str | None = None) -> FastAPI:
 
         visual_context = ""
         if vision_capable and vision_client_args:
-            descs: list[str] = []
-            if scene.scene_image and Path(scene.scene_image).exists():
-                try:
-                    desc = await asyncio.to_thread(
-                        describe_image, scene.scene_image, "the game scene and environment",
-                        *vision_client_args,
-                    )
-                    descs.append(f"Scene: {desc}")
-                except Exception:
-                    pass
-            for char in scene.characters:
-                if char.portrait and Path(char.portrait).exists():
-                    try:
-                        desc = await asyncio.to_thread(
-                            describe_image, char.portrait, f"character {char.name}",
-                            *vision_client_args,
-                        )
-                        descs.append(f"{char.name}: {desc}")
-                    except Exception:
-                        pass
-            visual_context = "\n\n".join(descs)
-
-        system = build_system_prompt(scene, visual_context=visual_context)
+            visual_context = await _describe_startup_images(scene, vision_client_args)
+
         state = GameState.from_scene(scene)
         state.vision_capable = vision_capable
-        messages: list[dict] = []
-
-        _sess.update({
-            "scene": scene,
-            "state": state,
-            "messages": messages,
-            "system": system,
-            "last_response": "",
-            "turn_snapshot": None,
-            "client": client,
-            "model": model,
-            "vision_capable": vision_capable,
-            "vision_client_args": vision_client_args,
-            "lock": asyncio.Lock(),
-        })
+        sess = WebSession(
+            sid=sid,
+            scenario=str(scenario_path),
+            server_url=server_url,
+            model_override=model_override,
+            scene=scene,
+            state=state,
+            system=build_system_prompt(scene, visual_context=visual_context),
+            client=client,
+            model=model,
+            vision_capable=vision_capable,
+            vision_client_args=vision_client_args,
+            journal=store.journal_for(sid),
+        )
+        store.add(sess)
+        messages = sess.messages
 
         async def generate():
-            if scene.opening.strip():
-                opening = scene.opening.strip()
-                messages.append({"role": "assistant", "content": opening})
-                state.story_log.append(opening)
-                _sess["last_response"] = opening
-                yield _sse({"type": "chunk", "text": opening})
-            else:
-                opening_prompt = (
-                    f"[MEMORY]\n{state.memory}\n\n---\n"
-                    "Begin the adventure. Narrate the opening scene vividly. "
-                    "Place the player in the world. Do not ask questions yet."
-                )
-                messages.append({"role": "user", "content": opening_prompt})
-                ui = _WebUI()
-                task = asyncio.create_task(_run_and_drain(ui, client, model, system, messages, state))
-                while True:
-                    chunk = await asyncio.wait_for(ui.queue.get(), timeout=120)
-                    if chunk is None:
-                        break
-                    yield _sse({"type": "chunk", "text": chunk})
-                opening = await task
-                if opening:
+            async with sess.lock:
+                if scene.opening.strip():
+                    opening = scene.opening.strip()
+                    messages.append({"role": "assistant", "content": opening})
                     state.story_log.append(opening)
-                    _sess["last_response"] = opening
+                    sess.last_response = opening
+                    yield _sse({"type": "chunk", "text": opening})
+                else:
+                    opening_prompt = (
+                        f"[MEMORY]\n{state.memory}\n\n---\n"
+                        "Begin the adventure. Narrate the opening scene vividly. "
+                        "Place the player in the world. Do not ask questions yet."
+                    )
+                    messages.append({"role": "user", "content": opening_prompt})
+                    ui = _WebUI()
+                    task = asyncio.create_task(_run_and_drain(ui, gate, sess))
+                    while True:
+                        chunk = await asyncio.wait_for(ui.queue.get(), timeout=120)
+                        if chunk is None:
+                            break
+                        yield _sse({"type": "chunk", "text": chunk})
+                    opening = await task
+                    if opening:
+                        state.story_log.append(opening)
+                        sess.last_response = opening
 
-            yield _sse({"type": "state", **_state_payload()})
-            yield _sse({"type": "done", "title": scene.meta.title,
-                        "vision_capable": vision_capable,
-                        "nsfw": scene.meta.nsfw})
+                yield _sse({"type": "state", **_state_payload(sess)})
+                yield _sse({"type": "done", "title": scene.meta.title,
+                            "vision_capable": vision_capable,
+                            "nsfw": scene.meta.nsfw})
 
-        return StreamingResponse(generate(), media_type="text/event-stream",
-                                 headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+        response = _stream(generate())
+        response.set_cookie(_COOKIE, sid, httponly=True, samesite="lax")
+        return response
 
     # ------------------------------------------------------------------
     # Player action
@@ -292,29 +350,46 @@ def create_app(default_scenario: str | None = None) -> FastAPI:
 
     @app.post("/api/action")
     async def player_action(
+        request: Request,
         text: str = Form(""),
         image: Optional[UploadFile] = File(None),
         image_label: str = Form(""),
     ):
-        if _sess["state"] is None:
-            return JSONResponse({"error": "No game in progress."}, status_code=400)
+        sess = store.get(_session_id(request))
+        if sess is None:
+            return JSONResponse(_NO_GAME, status_code=400)
 
-        lk = _lock()
+        lk = sess.lock
         if lk.locked():
-            return JSONResponse({"error": "A turn is already in progress."}, status_code=429)
+            return JSONResponse(_BUSY, status_code=429)
 
         await lk.acquire()
 
         try:
-            state: GameState = _sess["state"]
-            messages: list = _sess["messages"]
-            client = _sess["client"]
-            model: str = _sess["model"]
-            system: str = _sess["system"]
+            state = sess.state
+            messages = sess.messages
+            client = sess.client
+            model = sess.model
+
+            raw = text.strip()
+            if not raw:
+                lk.release()
+                return JSONResponse({"error": "Empty input."}, status_code=400)
 
-            # Handle attached image
+            # ── NSFW CLASSIFIER BEGIN (revert by removing this block) ──────────
+            # One call for the text and the image label, run in the background:
+            # the verdict only feeds the log, so the narrator never waits on it.
+            if not state.scene.meta.nsfw:
+                checked = raw + (f"\n\nImage label: {image_label.strip()}" if image_label.strip() else "")
+                _log_nsfw_verdict(
+                    asyncio.create_task(_classify_nsfw(checked, client, model)),
+                    state.turn_count, state.scene.meta.title, raw,
+                )
+            # ── NSFW CLASSIFIER END ─────────────────────────────────────────
+
+            # Handle attached image (runs while the classifier call is in flight)
             image_desc = ""
-            if image and _sess["vision_client_args"]:
+            if image and sess.vision_client_args:
                 try:
                     label = image_label.strip() or "the scene"
                     suffix = Path(image.filename or "img.jpg").suffix or ".jpg"
@@ -323,29 +398,12 @@ def create_app(default_scenario: str | None = None) -> FastAPI:
                         tmp_path = tmp.name
                     image_desc = await asyncio.to_thread(
                         describe_image, tmp_path, label,
-                        *_sess["vision_client_args"],
+                        *sess.vision_client_args,
                     )
                     Path(tmp_path).unlink(missing_ok=True)
                 except Exception as exc:
                     image_desc = f"[image error: {exc}]"
 
-            raw = text.strip()
-            if not raw:
-                lk.release()
-                return JSONResponse({"error": "Empty input."}, status_code=400)
-
-            # ── NSFW CLASSIFIER BEGIN (revert by removing this block) ──────────
-            if not state.scene.meta.nsfw:
-                flagged = await _classify_nsfw(raw, client, model)
-                if not flagged and image_label:
-                    flagged = await _classify_nsfw(image_label, client, model)
-                if flagged:
-                    logger.warning(
-                        "NSFW bypass attempt (turn %d, scenario: %s) — %r",
-                        state.turn_count, state.scene.meta.title, raw,
-                    )
-            # ── NSFW CLASSIFIER END ─────────────────────────────────────────
-
             if state.input_mode == "action" and not raw.lower().startswith("you "):
                 player_input = "You " + raw
             else:
@@ -353,22 +411,16 @@ def create_app(default_scenario: str | None = None) -> FastAPI:
 
             state.turn_count += 1
             turn_message = build_turn_message(
-                player_input, _sess["last_response"], state,
+                player_input, sess.last_response, state,
                 image_context=image_desc,
             )
 
-            _sess["turn_snapshot"] = {
-                "messages": list(messages),
-                "state": state.snapshot(),
-                "last_response": _sess["last_response"],
-                "turn_message": turn_message,
-                "player_input": player_input,
-            }
+            sess.history.checkpoint(state, messages, sess.last_response, turn_message)
 
             messages.append({"role": "user", "content": turn_message})
 
             ui = _WebUI()
-            task = asyncio.create_task(_run_and_drain(ui, client, model, system, messages, state))
+            task = asyncio.create_task(_run_and_drain(ui, gate, sess))
 
             async def generate():
                 try:
@@ -383,17 +435,17 @@ def create_app(default_scenario: str | None = None) -> FastAPI:
                     response = await task
                     if response:
                         state.story_log.append(response)
-                        _sess["last_response"] = response
-                    _do_save("_checkpoint", state, messages)
-                    yield _sse({"type": "state", **_state_payload()})
+                        sess.last_response = response
+                    sess.journal.record(state, messages)
+                    yield _sse({"type": "state", **_state_payload(sess)})
                     yield _sse({"type": "done"})
                 except Exception as exc:
                     yield _sse({"type": "error", "message": str(exc)})
                 finally:
                     lk.release()
+                    store.trim()
 
-            return StreamingResponse(generate(), media_type="text/event-stream",
-                                     headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+            return _stream(generate())
 
         except Exception as exc:
             lk.release()
@@ -404,30 +456,27 @@ def create_app(default_scenario: str | None = None) -> FastAPI:
     # ------------------------------------------------------------------
 
     @app.post("/api/regen")
-    async def regen():
-        if _sess["turn_snapshot"] is None:
+    async def regen(request: Request):
+        sess = store.get(_session_id(request))
+        if sess is None or sess.history.latest is None:
             return JSONResponse({"error": "Nothing to regenerate."}, status_code=400)
 
-        lk = _lock()
+        lk = sess.lock
         if lk.locked():
-            return JSONResponse({"error": "A turn is already in progress."}, status_code=429)
+            return JSONResponse(_BUSY, status_code=429)
 
         await lk.acquire()
 
         try:
-            snap = _sess["turn_snapshot"]
-            state: GameState = _sess["state"]
-            messages: list = _sess["messages"]
+            state = sess.state
+            messages = sess.messages
 
-            messages[:] = snap["messages"]
-            state.restore(snap["state"])
-            _sess["last_response"] = snap["last_response"]
-            messages.append({"role": "user", "content": snap["turn_message"]})
+            cp = sess.history.regen(state, messages)
+            sess.last_response = cp.last_response
+            messages.append({"role": "user", "content": cp.turn_message})
 
             ui = _WebUI()
-            task = asyncio.create_task(
-                _run_and_drain(ui, _sess["client"], _sess["model"], _sess["system"], messages, state)
-            )
+            task = asyncio.create_task(_run_and_drain(ui, gate, sess))
 
             async def generate():
                 try:
@@ -440,17 +489,17 @@ def create_app(default_scenario: str | None = None) -> FastAPI:
                     response = await task
                     if response:
                         state.story_log.append(response)
-                        _sess["last_response"] = response
-                    _do_save("_checkpoint", state, messages)
-                    yield _sse({"type": "state", **_state_payload()})
+                        sess.last_response = response
+                    sess.journal.record(state, messages)
+                    yield _sse({"type": "state", **_state_payload(sess)})
                     yield _sse({"type": "done"})
                 except Exception as exc:
                     yield _sse({"type": "error", "message": str(exc)})
                 finally:
                     lk.release()
+                    store.trim()
 
-            return StreamingResponse(generate(), media_type="text/event-stream",
-                                     headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+            return _stream(generate())
 
         except Exception as exc:
             lk.release()
@@ -461,59 +510,77 @@ def create_app(default_scenario: str | None = None) -> FastAPI:
     # ------------------------------------------------------------------
 
     @app.get("/api/state")
-    async def get_state():
-        return JSONResponse(_state_payload())
+    async def get_state(request: Request):
+        return JSONResponse(_state_payload(store.get(_session_id(request))))
 
     @app.get("/api/saves")
-    async def list_saves():
-        saves = [{"name": s.stem} for s in sorted(_SAVES_DIR.glob("*.json"))
-                 if s.stem != "_checkpoint"]
+    async def list_saves(request: Request):
+        sid = _session_id(request)
+        if not store.valid_id(sid):
+            return JSONResponse({"saves": []})
+        saves = [{"name": s.stem} for s in sorted(store.saves_dir(sid).glob("*.json"))]
         return JSONResponse({"saves": saves})
 
     @app.post("/api/save")
-    async def save_game(body: dict):
-        if _sess["state"] is None:
-            return JSONResponse({"error": "No game in progress."}, status_code=400)
-        name = body.get("name", "").strip() or f"save_{_sess['state'].turn_count}"
-        _do_save(name, _sess["state"], _sess["messages"])
+    async def save_game(body: dict, request: Request):
+        sess = store.get(_session_id(request))
+        if sess is None:
+            return JSONResponse(_NO_GAME, status_code=400)
+        name = body.get("name", "").strip() or f"save_{sess.state.turn_count}"
+        if not _valid_save_name(name):
+            return JSONResponse({"error": f"Invalid save name: {name!r}"}, status_code=400)
+        _do_save(store.saves_dir(sess.sid), name, sess.state, sess.messages)
         return JSONResponse({"name": name})
 
     @app.post("/api/load")
-    async def load_game(body: dict):
+    async def load_game(body: dict, request: Request):
         name = body.get("name", "").strip()
         if not name:
             return JSONResponse({"error": "No save name."}, status_code=400)
-        if _sess["state"] is None:
+        sess = store.get(_session_id(request))
+        if sess is None:
             return JSONResponse({"error": "Start a game first."}, status_code=400)
-        path = _SAVES_DIR / f"{name}.json"
-        if not path.exists():
+        if sess.lock.locked():
+            return JSONResponse(_BUSY, status_code=429)
+        path = store.saves_dir(sess.sid) / f"{name}.json"
+        if not _valid_save_name(name) or not path.exists():
             return JSONResponse({"error": f"Save not found: {name!r}"}, status_code=404)
-        data = json.loads(path.read_text(encoding="utf-8"))
-        _sess["state"].restore(data)
-        _sess["messages"][:] = data.get("messages", [])
-        _sess["turn_snapshot"] = None
-        log = _sess["state"].story_log
-        _sess["last_response"] = log[-1] if log else ""
-        return JSONResponse({"story_log": log, **_state_payload()})
+        data = load_save(path)
+        sess.state.restore(data)
+        sess.messages[:] = data.get("messages", [])
+        sess.history.clear()
+        sess.journal.reset()
+        log = sess.state.story_log
+        sess.last_response = log[-1] if log else ""
+        return JSONResponse({"story_log": log, **_state_payload(sess)})
 
     @app.post("/api/mode")
-    async def toggle_mode():
-        if _sess["state"] is None:
-            return JSONResponse({"error": "No game in progress."}, status_code=400)
-        state = _sess["state"]
+    async def toggle_mode(request: Request):
+        sess = store.get(_session_id(request))
+        if sess is None:
+            return JSONResponse(_NO_GAME, status_code=400)
+        state = sess.state
         state.input_mode = "story" if state.input_mode == "action" else "action"
         return JSONResponse({"input_mode": state.input_mode})
 
     @app.post("/api/undo")
-    async def undo_last():
-        if _sess["state"] is None:
-            return JSONResponse({"error": "No game in progress."}, status_code=400)
-        state: GameState = _sess["state"]
-        messages: list = _sess["messages"]
+    async def undo_last(request: Request):
+        sess = store.get(_session_id(request))
+        if sess is None:
+            return JSONResponse(_NO_GAME, status_code=400)
+        if sess.lock.locked():
+            return JSONResponse(_BUSY, status_code=429)
+        state = sess.state
+        messages = sess.messages
+        cp = sess.history.undo(state, messages)
+        if cp is not None:
+            sess.last_response = cp.last_response
+            return JSONResponse({"ok": True, **_state_payload(sess)})
         if not state.story_log or state.turn_count == 0:
             return JSONResponse({"error": "Nothing to undo."}, status_code=400)
 
-        # Find the last player turn (user message that is not a tool result)
+        # No checkpoint (restored session or loaded save): drop the last player turn
+        # (user message that is not a tool result) and everything after it
         last_player_idx = None
         for i in reversed(range(len(messages))):
             if messages[i].get("role") == "user" and "tool_call_id" not in messages[i]:
@@ -525,43 +592,45 @@ def create_app(default_scenario: str | None = None) -> FastAPI:
 
         state.story_log.pop()
         state.turn_count = max(0, state.turn_count - 1)
-        _sess["last_response"] = state.story_log[-1] if state.story_log else ""
-        _sess["turn_snapshot"] = None
-        return JSONResponse({"ok": True, **_state_payload()})
+        sess.last_response = state.story_log[-1] if state.story_log else ""
+        return JSONResponse({"ok": True, **_state_payload(sess)})
 
     @app.post("/api/edit")
-    async def edit_last(body: dict):
-        if _sess["state"] is None:
-            return JSONResponse({"error": "No game in progress."}, status_code=400)
+    async def edit_last(body: dict, request: Request):
+        sess = store.get(_session_id(request))
+        if sess is None:
+            return JSONResponse(_NO_GAME, status_code=400)
         new_text = body.get("text", "").strip()
         if not new_text:
             return JSONResponse({"error": "Empty text."}, status_code=400)
-        state: GameState = _sess["state"]
+        state = sess.state
         if not state.story_log:
             return JSONResponse({"error": "Nothing to edit."}, status_code=400)
-        messages: list = _sess["messages"]
+        messages = sess.messages
         for i in reversed(range(len(messages))):
             if messages[i].get("role") == "assistant" and messages[i].get("content"):
                 messages[i] = {**messages[i], "content": new_text}
                 break
         state.story_log[-1] = new_text
-        _sess["last_response"] = new_text
+        sess.last_response = new_text
         return JSONResponse({"ok": True})
 
     @app.post("/api/note")
-    async def update_note(body: dict):
-        if _sess["state"] is None:
-            return JSONResponse({"error": "No game in progress."}, status_code=400)
+    async def update_note(body: dict, request: Request):
+        sess = store.get(_session_id(request))
+        if sess is None:
+            return JSONResponse(_NO_GAME, status_code=400)
         content = body.get("content", "").strip()
         if content:
-            _sess["state"].author_note = content
-        return JSONResponse({"author_note": _sess["state"].author_note})
+            sess.state.author_note = content
+        return JSONResponse({"author_note": sess.state.author_note})
 
     @app.get("/api/export")
-    async def export_story():
-        if not _sess["state"] or not _sess["state"].story_log:
+    async def export_story(request: Request):
+        sess = store.get(_session_id(request))
+        if sess is None or not sess.state.story_log:
             return JSONResponse({"error": "Nothing to export."}, status_code=400)
-        state = _sess["state"]
+        state = sess.state
         title = state.scene.meta.title
         body = f"{title}\n{'=' * len(title)}\n\n" + "\n\n".join(state.story_log)
         safe_title = "".join(c if c.isalnum() or c in " -_" else "_" for c in title)
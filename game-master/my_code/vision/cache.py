@@ -0,0 +1,79 @@
+"""Vision cache — image descriptions kept on disk between runs.
+
+Every game start used to send each scene image and portrait to the vision model
+again, although the same file, label and model always produce an equivalent
+description. Entries are small JSON files keyed by a sha256 over the image
+content hash, the label, the served model id and the describe prompt.
+
+The image is keyed by its bytes, not its path, so a moved or copied file still
+hits and an edited file misses. Writes go to a temp file and are renamed into
+place; an unreadable entry counts as a miss. Caching is best-effort — a
+read-only or full disk just means the model is asked again.
+
+Config:
+    STORY_ENGINE_VISION_CACHE_DIR   cache directory
+                                    (default $XDG_CACHE_HOME/game_master/vision or
+                                    ~/.cache/game_master/vision; "off" disables it)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger("game_master.vision")
+
+# Bump when the entry layout changes so stale entries are ignored.
+_FORMAT_VERSION = 1
+
+
+def _default_cache_dir() -> str:
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "game_master", "vision")
+
+
+def _cache_dir() -> Path | None:
+    raw = os.getenv("STORY_ENGINE_VISION_CACHE_DIR", "").strip() or _default_cache_dir()
+    return None if raw.lower() == "off" else Path(raw)
+
+
+def cache_key(kind: str, *parts: str) -> str:
+    h = hashlib.sha256(f"{kind}\0{_FORMAT_VERSION}".encode("utf-8"))
+    for part in parts:
+        h.update(b"\0" + part.encode("utf-8"))
+    return h.hexdigest()
+
+
+def read(key: str) -> str | None:
+    """The cached value for `key`, or None."""
+    root = _cache_dir()
+    if root is None:
+        return None
+    path = root / f"{key}.json"
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        return entry["value"] if entry.get("version") == _FORMAT_VERSION else None
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # corrupt / foreign file — ask the model again
+        logger.debug("vision cache: ignoring %s (%s)", path, exc)
+        return None
+
+
+def write(key: str, value: str) -> None:
+    root = _cache_dir()
+    if root is None:
+        return
+    path = root / f"{key}.json"
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps({"version": _FORMAT_VERSION, "value": value}, ensure_ascii=False),
+                       encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug("vision cache: could not write %s (%s)", path, exc)
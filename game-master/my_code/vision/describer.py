@@ -2,13 +2,44 @@
 
 The description is generated once and the image bytes are discarded. Only the
 returned text string is used downstream.
+
+Descriptions are cached on disk by image content, label and model id (see
+cache.py), so an unchanged image is described once across runs. With the local
+placeholder model id ("default") the server picks the model, so the key uses
+the model the server reports: the only one listed at /v1/models, or else the
+only one LM Studio reports as loaded (/api/v0/models). When neither settles it
+nothing is cached. describe_images() looks this up once per batch.
+
+Images whose longest edge exceeds _MAX_EDGE are downscaled and sent as JPEG
+when Pillow is installed; without it the file is sent as-is. describe_images()
+runs several descriptions at once, at most STORY_ENGINE_VISION_CONCURRENCY in
+flight.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
+import io
+import logging
 from pathlib import Path
 
+import httpx
+
+from my_code.models.provider import _DEFAULT_LOCAL_MODEL, vision_concurrency
+from my_code.vision import cache
+
+try:
+    from PIL import Image
+except ImportError:  # optional — images are sent at full size
+    Image = None
+
+logger = logging.getLogger("game_master.vision")
+
+_MAX_EDGE = 1024          # px; vision encoders tile or resize to about this anyway
+_JPEG_QUALITY = 85
+
 _MIME_MAP = {
     "jpg": "image/jpeg",
     "jpeg": "image/jpeg",
@@ -25,6 +56,53 @@ _DESCRIBE_PROMPT = (
     "Write as prose — do not list items, do not say 'the image shows', "
     "do not break the fourth wall."
 )
+_PROMPT_DIGEST = hashlib.sha256(_DESCRIBE_PROMPT.encode("utf-8")).hexdigest()[:16]
+
+
+def _encode(data: bytes, ext: str) -> tuple[str, str]:
+    """(mime, base64) for the request, downscaled when the image is large."""
+    if Image is not None:
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                if max(img.size) > _MAX_EDGE:
+                    img.thumbnail((_MAX_EDGE, _MAX_EDGE))
+                    buf = io.BytesIO()
+                    img.convert("RGB").save(buf, "JPEG", quality=_JPEG_QUALITY)
+                    return "image/jpeg", base64.b64encode(buf.getvalue()).decode()
+        except Exception:
+            pass  # unreadable to Pillow — let the model try the original bytes
+    return _MIME_MAP.get(ext, "image/jpeg"), base64.b64encode(data).decode()
+
+
+def _served_model(base_url: str, model_id: str, api_key: str) -> str | None:
+    """The model id to cache descriptions under, or None to skip the cache.
+
+    An explicit model id is used as-is. For the placeholder, ask the server:
+    llama.cpp lists just the model it runs at /v1/models, LM Studio lists every
+    downloaded model there but marks the loaded ones at /api/v0/models.
+    """
+    if model_id != _DEFAULT_LOCAL_MODEL:
+        return model_id
+    headers = {"Authorization": f"Bearer {api_key}"}
+    root = base_url.rstrip("/")
+    try:
+        with httpx.Client(timeout=5.0, headers=headers) as http:
+            listed = [m["id"] for m in http.get(f"{root}/models").json().get("data", [])]
+            if len(listed) == 1:
+                return listed[0]
+            if root.endswith("/v1"):
+                resp = http.get(f"{root[:-3]}/api/v0/models")
+                if resp.status_code == 200:
+                    loaded = [m["id"] for m in resp.json().get("data", [])
+                              if m.get("state") == "loaded" and m.get("type") != "embeddings"]
+                    if len(loaded) == 1:
+                        return loaded[0]
+    except Exception as exc:
+        logger.debug("vision cache: could not ask %s for its model (%s), not caching", base_url, exc)
+        return None
+    logger.debug("vision cache: %s serves %d models, cannot tell which answers %r — not caching",
+                 base_url, len(listed), model_id)
+    return None
 
 
 def describe_image(
@@ -33,6 +111,7 @@ def describe_image(
     base_url: str,
     model_id: str,
     api_key: str,
+    cache_model: str | None = "",
 ) -> str:
     """Describe an image file as atmospheric prose for use in a text adventure.
 
@@ -42,9 +121,12 @@ def describe_image(
         base_url:   OpenAI-compat API base URL.
         model_id:   Model identifier.
         api_key:    API key (may be a placeholder for local servers).
+        cache_model: Model id to cache under, from _served_model(); None skips
+                    the cache, "" (default) looks it up for this one call.
 
     Returns:
-        A 2–3 sentence prose description.
+        A 2–3 sentence prose description, from the cache when this image, label
+        and served model were described before.
 
     Raises:
         FileNotFoundError: If image_path does not exist.
@@ -54,9 +136,18 @@ def describe_image(
     if not path.exists():
         raise FileNotFoundError(f"Image not found: {image_path}")
 
-    ext = path.suffix.lower().lstrip(".")
-    mime = _MIME_MAP.get(ext, "image/jpeg")
-    b64 = base64.b64encode(path.read_bytes()).decode()
+    data = path.read_bytes()
+    if cache_model == "":
+        cache_model = _served_model(base_url, model_id, api_key)
+    key = cache_model and cache.cache_key(
+        "description", hashlib.sha256(data).hexdigest(), label, cache_model, _PROMPT_DIGEST
+    )
+    cached = cache.read(key) if key else None
+    if cached is not None:
+        return cached
+
+    mime, b64 = _encode(data, path.suffix.lower().lstrip("."))
+    del data
 
     try:
         from openai import OpenAI
@@ -81,6 +172,30 @@ def describe_image(
             ],
             max_tokens=250,
         )
-        return resp.choices[0].message.content.strip()
+        desc = resp.choices[0].message.content.strip()
     except Exception as exc:
         raise RuntimeError(f"Vision description failed: {exc}") from exc
+    if desc and key:
+        cache.write(key, desc)
+    return desc
+
+
+async def describe_images(
+    jobs: list[tuple[str, str]],
+    client_args: tuple[str, str, str],
+    limit: int | None = None,
+) -> list[str | Exception]:
+    """Describe (image_path, label) pairs concurrently.
+
+    At most `limit` calls (default STORY_ENGINE_VISION_CONCURRENCY) are in flight
+    at once. Results are in job order; a failed job yields its exception. The
+    served model is looked up once for the whole batch.
+    """
+    sem = asyncio.Semaphore(max(1, limit or vision_concurrency()))
+    cache_model = await asyncio.to_thread(_served_model, *client_args) if jobs else None
+
+    async def one(image_path: str, label: str) -> str:
+        async with sem:
+            return await asyncio.to_thread(describe_image, image_path, label, *client_args, cache_model)
+
+    return await asyncio.gather(*(one(p, label) for p, label in jobs), return_exceptions=True)
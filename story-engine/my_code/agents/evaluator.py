@@ -1,7 +1,8 @@
 """EvaluatorAgent — quality gate.
 
 Reads beat intent vs prose output and returns pass/retry with structured feedback.
-Stateless per invocation. See AGENT_DESIGN.md §1.4.
+Stateless per invocation — reused across beats via models.pool (messages and
+metrics are reset before each call). See AGENT_DESIGN.md §1.4.
 """
 
 from __future__ import annotations
@@ -9,7 +10,8 @@ from __future__ import annotations
 from strands import Agent
 from strands.agent.conversation_manager.null_conversation_manager import NullConversationManager
 
-from my_code.models.provider import get_model, system_prompt_suffix
+from my_code.models.pool import get_pooled_model
+from my_code.models.provider import system_prompt_suffix
 from my_code.tools.eval_tools import (
     check_beat_coverage,
     check_coherence,
@@ -86,12 +88,12 @@ Rules:
 
 
 def create_evaluator() -> Agent:
-    """Create a fresh EvaluatorAgent instance."""
+    """Create an EvaluatorAgent instance. Invoke via models.pool.invoke(stateless=True)."""
     return Agent(
         name="Evaluator",
         system_prompt=system_prompt_suffix(EVALUATOR_SYSTEM_PROMPT),
         tools=[check_beat_coverage, check_style_compliance, check_coherence, emit_eval_result],
-        model=get_model("evaluator"),
+        model=get_pooled_model("evaluator"),
         conversation_manager=NullConversationManager(),
     )
 
@@ -106,6 +108,6 @@ def create_evaluator_single_pass() -> Agent:
       name="EvaluatorSinglePass",
       system_prompt=system_prompt_suffix(EVALUATOR_SINGLE_PASS_SYSTEM_PROMPT),
       tools=[],
-      model=get_model("evaluator"),
+      model=get_pooled_model("evaluator"),
       conversation_manager=NullConversationManager(),
    )
@@ -11,8 +11,10 @@ from __future__ import annotations
 from strands import Agent
 from strands.agent.conversation_manager.summarizing_conversation_manager import SummarizingConversationManager
 
+from my_code.agents.stream_guard import NarratorStream
 from my_code.models.data_models import ParsedScene
-from my_code.models.provider import get_model, system_prompt_suffix
+from my_code.models.pool import get_pooled_model
+from my_code.models.provider import system_prompt_suffix
 
 
 def _build_narrator_system_prompt(scene: ParsedScene) -> str:
@@ -76,13 +78,15 @@ def create_narrator(scene: ParsedScene) -> Agent:
     """Create a NarratorAgent with scene context baked into its system prompt.
 
     The narrator is created once per scene run. Its conversation history
-    persists across beats via SummarizingConversationManager.
+    persists across beats via SummarizingConversationManager. Its callback
+    handler is a NarratorStream (terminal echo, TTFT, optional stream guard).
     """
     return Agent(
         name="Narrator",
         system_prompt=system_prompt_suffix(_build_narrator_system_prompt(scene)),
         tools=[],  # pure generation — no tools
-        model=get_model("narrator"),
+        model=get_pooled_model("narrator"),
+        callback_handler=NarratorStream(),
         conversation_manager=SummarizingConversationManager(
             summary_ratio=0.3,
             preserve_recent_messages=6,
@@ -9,10 +9,11 @@ See AGENT_DESIGN.md §1.1 and §4.
 
 from __future__ import annotations
 
-import gc
 import json
 import logging
+import os
 import re
+import time
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
@@ -21,7 +22,10 @@ from strands.types.exceptions import MaxTokensReachedException
 
 from my_code.agents.evaluator import create_evaluator, create_evaluator_single_pass
 from my_code.agents.narrator import create_narrator
+from my_code.agents.stream_guard import GuardLimits, NarratorStream, guard_enabled, limits_for_scene
 from my_code.agents.summariser import create_summariser
+from my_code.models.pool import agent_pool, invoke, llm_seconds
+from my_code.tools.beat_memory import EVAL_BUDGET_TOKENS, NARRATOR_BUDGET_TOKENS, BeatMemory
 from my_code.tools.eval_tools import pop_last_emit
 from my_code.tools.lore_tools import build_lore_block, get_character_card, scan_for_triggers
 from my_code.models.data_models import (
@@ -35,47 +39,143 @@ from my_code.parser import parse_scene_file
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
-_NARRATOR_RESUME_SUMMARY_WINDOW = 3
-_NARRATOR_RESUME_SUMMARY_MAX_CHARS = 1200
+_NARRATOR_RESUME_SUMMARY_WINDOW = 3    # newest beats always in the resume seed
+_NARRATOR_RESUME_SUMMARY_TOKENS = 300  # resume seed budget (recent + relevant earlier beats)
 
 
 # ---------------------------------------------------------------------------
 # Checkpoint persistence
 # ---------------------------------------------------------------------------
 
+# Layout (all next to the output file):
+#   .<stem>.checkpoint.json   — snapshot: {"version": 2, "beats": {...}, "summaries": {...}}
+#                               replaced atomically (temp file + fsync + rename)
+#   .<stem>.checkpoint.jsonl  — journal: one fsync'd line per event since the snapshot,
+#                               {"beat": "3", "prose": "..."} or {"beat": "3", "summary": "..."}
+#
+# Each beat appends only its own prose and summary, so checkpoint cost per beat is
+# constant instead of re-serialising every prior beat plus the whole prior_summary.
+# The journal is folded into the snapshot on load. A torn trailing journal line is
+# dropped; replaying a line already in the snapshot is harmless (keyed by beat).
+
+_CHECKPOINT_VERSION = 2
+_SUMMARY_BLOCK_RE = re.compile(r"### Beat (\d+) Summary\n(.*?)(?=\n*### Beat \d+ Summary|\Z)", re.DOTALL)
+
+
 def _checkpoint_path(output_file: str) -> Path:
-    """Derive the checkpoint file path from the output file path."""
+    """Derive the checkpoint snapshot path from the output file path."""
     p = Path(output_file)
     return p.parent / f".{p.stem}.checkpoint.json"
 
 
+def _journal_path(output_file: str) -> Path:
+    """Derive the append-only checkpoint journal path from the output file path."""
+    p = Path(output_file)
+    return p.parent / f".{p.stem}.checkpoint.jsonl"
+
+
+def _read_snapshot(cp: Path) -> tuple[dict[str, str], dict[str, str]]:
+    """Read a snapshot file; accepts the legacy {beats, prior_summary} format."""
+    data = json.loads(cp.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or "beats" not in data:
+        raise ValueError("missing 'beats'")
+    beats = {str(k): v for k, v in data["beats"].items()}
+    if "summaries" in data:
+        summaries = {str(k): v for k, v in data["summaries"].items()}
+    else:
+        # Legacy v1: split the accumulated string back into per-beat blocks
+        summaries = {
+            m.group(1): m.group(2).strip()
+            for m in _SUMMARY_BLOCK_RE.finditer(data.get("prior_summary", ""))
+        }
+    return beats, summaries
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write text to path via temp file + fsync + rename so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as fh:
+        fh.write(text)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
 def _load_checkpoint(output_file: str) -> dict:
-    """Load existing checkpoint if present. Returns dict with beats and summary."""
+    """Load snapshot + journal if present. Returns dict with beats and summaries.
+
+    Compacts the journal into a fresh snapshot so the next run starts from one file.
+    A corrupt snapshot is moved aside (never silently discarded) and the journal is
+    still replayed on top of whatever could be recovered.
+    """
     cp = _checkpoint_path(output_file)
+    jp = _journal_path(output_file)
+    beats: dict[str, str] = {}
+    summaries: dict[str, str] = {}
+
     if cp.exists():
         try:
-            data = json.loads(cp.read_text(encoding="utf-8"))
-            if isinstance(data, dict) and "beats" in data:
-                return data
-        except (json.JSONDecodeError, KeyError):
-            logger.warning("Corrupt checkpoint file, starting fresh")
-    return {"beats": {}, "prior_summary": ""}
+            beats, summaries = _read_snapshot(cp)
+        except (json.JSONDecodeError, ValueError, AttributeError) as exc:
+            bad = cp.with_name(cp.name + ".corrupt")
+            os.replace(cp, bad)
+            logger.error("Corrupt checkpoint snapshot (%s) moved to %s", exc, bad)
+
+    replayed = 0
+    if jp.exists():
+        lines = jp.read_text(encoding="utf-8").splitlines()
+        for lineno, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                rec = json.loads(line)
+                key = str(rec["beat"])
+            except (json.JSONDecodeError, KeyError, TypeError):
+                if lineno == len(lines):
+                    logger.warning("Checkpoint journal: dropping torn final line")
+                else:
+                    logger.error("Checkpoint journal: skipping unreadable line %d", lineno)
+                continue
+            if "prose" in rec:
+                beats[key] = rec["prose"]
+            if "summary" in rec:
+                summaries[key] = rec["summary"]
+            replayed += 1
+
+    if replayed:
+        _write_checkpoint_snapshot(output_file, beats, summaries)
+        logger.info("Checkpoint journal compacted: %d records folded into snapshot", replayed)
 
+    return {"beats": beats, "summaries": summaries}
 
-def _save_checkpoint(output_file: str, completed_beats: dict[str, str], prior_summary: str):
-    """Write checkpoint after each beat. beats is {beat_index_str: prose}."""
+
+def _write_checkpoint_snapshot(output_file: str, beats: dict[str, str], summaries: dict[str, str]) -> None:
+    """Atomically replace the snapshot with the full state, then truncate the journal."""
     cp = _checkpoint_path(output_file)
     cp.parent.mkdir(parents=True, exist_ok=True)
-    data = {"beats": completed_beats, "prior_summary": prior_summary}
-    cp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    data = {"version": _CHECKPOINT_VERSION, "beats": beats, "summaries": summaries}
+    _write_atomic(cp, json.dumps(data, ensure_ascii=False))
+    # Crash between rename and truncate only means the journal is replayed again.
+    _journal_path(output_file).unlink(missing_ok=True)
+
+
+def _append_checkpoint(output_file: str, beat_key: str, **fields: str) -> None:
+    """Append one fsync'd journal record for a beat (prose= and/or summary=)."""
+    jp = _journal_path(output_file)
+    jp.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps({"beat": beat_key, **fields}, ensure_ascii=False)
+    with jp.open("a", encoding="utf-8") as fh:
+        fh.write(line + "\n")
+        fh.flush()
+        os.fsync(fh.fileno())
 
 
 def _clear_checkpoint(output_file: str):
-    """Remove checkpoint file after successful completion."""
-    cp = _checkpoint_path(output_file)
-    if cp.exists():
-        cp.unlink()
-        logger.info("Checkpoint cleared: %s", cp)
+    """Remove checkpoint snapshot and journal after successful completion."""
+    for cp in (_checkpoint_path(output_file), _journal_path(output_file)):
+        if cp.exists():
+            cp.unlink()
+            logger.info("Checkpoint cleared: %s", cp)
 
 
 # ---------------------------------------------------------------------------
@@ -142,26 +242,55 @@ def run_scene(file_path: str) -> str:
         # --- Load checkpoint ---
         checkpoint = _load_checkpoint(meta.output_file)
         checkpoint_beats: dict[str, str] = checkpoint["beats"]
-        prior_summary: str = checkpoint.get("prior_summary", "")
+        checkpoint_summaries: dict[str, str] = checkpoint["summaries"]
 
         if checkpoint_beats:
             logger.info("Resuming from checkpoint: %d/%d beats already done", len(checkpoint_beats), len(scene.beats))
+            # A crash between the prose and summary journal records leaves a beat
+            # without its summary — regenerate it rather than lose continuity.
+            last_key = str(scene.beats[-1].index)
+            for key in sorted(checkpoint_beats, key=int):
+                if key not in checkpoint_summaries and key != last_key:
+                    logger.info("Beat %s: summary missing from checkpoint — re-summarising", key)
+                    with agent_pool.lease("summariser", create_summariser) as summariser:
+                        beat_summary = _summarise_beat(summariser, checkpoint_beats[key], int(key))
+                    checkpoint_summaries[key] = beat_summary
+                    _append_checkpoint(meta.output_file, key, summary=beat_summary)
+
+        # --- Beat memory: retrieval over accepted-beat summaries (see tools/beat_memory.py) ---
+        memory = BeatMemory()
+        for key in sorted(checkpoint_summaries, key=int):
+            memory.add(int(key), checkpoint_summaries[key])
+        logger.info("Beat memory: backend=%s summaries=%d", memory.backend, len(memory))
 
         # --- Create sub-agents ---
         # Narrator is created once — it must persist across beats to maintain
         # its SummarizingConversationManager state (KV cache continuity on port 8080).
         # Evaluator and summariser are stateless (NullConversationManager) and are
-        # recreated each beat so Strands SDK metric objects don't accumulate in RAM.
+        # leased from models.pool and reset in place per call — pool.invoke() swaps
+        # in fresh metrics each call, so nothing accumulates across beats.
         narrator = create_narrator(scene)
         logger.info("Agents ready: narrator | evaluator | summariser (lore injection is pure-Python)")
 
+        # Stream guard: abort clearly bad narrator drafts mid-stream (see stream_guard.py)
+        guard = limits_for_scene(scene) if guard_enabled(mode) else None
+        if guard is not None:
+            logger.info(
+                "Stream guard on: max_words=%d third_person=%s", guard.max_words, guard.third_person,
+            )
+
         # --- Serialise characters once for lore injector ---
         characters_json = json.dumps([asdict(c) for c in scene.characters], ensure_ascii=False)
 
+        # Beats whose prose is still in the narrator's own conversation — anything
+        # earlier (trimmed away, or from before a resume) is recalled from memory.
+        narrator_beats: list[int] = []
+
         resume_story_summary = ""
         resume_context_pending = False
         if checkpoint_beats:
-            resume_story_summary = _build_resume_story_summary(prior_summary)
+            next_beat = next((b for b in scene.beats if str(b.index) not in checkpoint_beats), None)
+            resume_story_summary = _build_resume_story_summary(memory, next_beat.text if next_beat else "")
             resume_context_pending = bool(resume_story_summary)
             logger.info(
                 "Resume context prepared from checkpoint summary (beats=%d chars=%d)",
@@ -188,18 +317,14 @@ def run_scene(file_path: str) -> str:
                 continue
 
             logger.info("--- Beat %d/%d ---", beat.index, len(scene.beats))
-
-            # Fresh stateless agents per beat — prevents Strands SDK metric
-            # objects from accumulating across beats in long runs.
-            # gc.collect() ensures the previous beat's agent objects are freed
-            # before we allocate new ones (relevant on Apple Silicon unified memory).
-            gc.collect()
-            summariser = create_summariser()
+            beat_wall_start = time.perf_counter()
+            beat_llm_start = llm_seconds()
 
             # 1. Lore injection (pure Python — no LLM call)
-            lore_context = _call_lore_injector(
+            lore_context, matched_names = _call_lore_injector(
                 beat.text, beat.index, characters_json, scene.world_info
             )
+            memory_query = " ".join([beat.text, *matched_names])
 
             # 2. Build narrator context
             author_note_text = None
@@ -213,6 +338,17 @@ def run_scene(file_path: str) -> str:
             else:
                 _prior_summary_for_beat = None
 
+            recalled_beats = None
+            if _prior_summary_for_beat is None and len(memory):
+                held_from = narrator_beats[0] if narrator_beats else beat.index
+                recalled_beats = memory.recall(memory_query, NARRATOR_BUDGET_TOKENS, before=held_from) or None
+
+            # Evaluator continuity: newest beats plus the most relevant earlier ones,
+            # inside a fixed budget however long the scene gets.
+            prior_summary = memory.recall(
+                memory_query, EVAL_BUDGET_TOKENS, recent=_EVALUATOR_RECENT_BEATS,
+            )
+
             ctx = NarratorContext(
                 beat_instruction=beat.text,
                 lore_context=lore_context,
@@ -220,11 +356,12 @@ def run_scene(file_path: str) -> str:
                 beat_total=len(scene.beats),
                 author_note=author_note_text,
                 prior_story_summary=_prior_summary_for_beat,
+                recalled_beats=recalled_beats,
             )
 
             # 3. Narrate + evaluate loop (with retries)
             prose, retry_count, last_narrator_in, beat_start_state = _narrate_and_evaluate(
-                narrator, ctx, scene.writing_style, prior_summary
+                narrator, ctx, scene.writing_style, prior_summary, guard
             )
 
             if retry_count >= MAX_RETRIES:
@@ -238,8 +375,8 @@ def run_scene(file_path: str) -> str:
                 )
 
             if action == "stop":
-                # Save checkpoint before exiting so we can resume later
-                _save_checkpoint(meta.output_file, checkpoint_beats, prior_summary)
+                # Every accepted beat is already journaled — nothing to flush
+                logger.info("Beat %d: stopped by user (checkpoint kept for resume)", beat.index)
                 break
             elif action == "skip":
                 logger.info("Beat %d: skipped by user", beat.index)
@@ -256,18 +393,34 @@ def run_scene(file_path: str) -> str:
             # sends a different prompt to port 8080, destroying all SWA checkpoints and forcing
             # full context re-processing on every subsequent beat (+80-100s each). Direct
             # deletion accepts a one-time cache miss only when actually approaching ctx=12288.
-            _trim_narrator_context(narrator, last_narrator_in)
+            narrator_beats.append(beat.index)
+            if _trim_narrator_context(narrator, last_narrator_in):
+                kept = narrator.conversation_manager.preserve_recent_messages // 2
+                narrator_beats = narrator_beats[-kept:] if kept else []
 
-            # 6. Summarise beat for coherence tracking, then save checkpoint
+            # 6. Journal the prose first (the expensive part), then summarise
+            # for coherence tracking and journal the summary separately.
             checkpoint_beats[key] = prose
+            _append_checkpoint(meta.output_file, key, prose=prose)
+            logger.info("Beat %d: saved (%d words)", beat.index, len(prose.split()))
             is_last_beat = beat.index == scene.beats[-1].index
             if not is_last_beat:
                 logger.info("Beat %d/%d: → summariser", beat.index, len(scene.beats))
-                beat_summary = _summarise_beat(summariser, prose, beat.index)
+                with agent_pool.lease("summariser", create_summariser) as summariser:
+                    beat_summary = _summarise_beat(summariser, prose, beat.index)
                 logger.info("Beat %d/%d: ← summariser", beat.index, len(scene.beats))
-                prior_summary += f"\n\n### Beat {beat.index} Summary\n{beat_summary}"
-            _save_checkpoint(meta.output_file, checkpoint_beats, prior_summary)
-            logger.info("Beat %d: saved (%d words)", beat.index, len(prose.split()))
+                checkpoint_summaries[key] = beat_summary
+                _append_checkpoint(meta.output_file, key, summary=beat_summary)
+                memory.add(beat.index, beat_summary)
+
+            # overhead = wall time not spent inside LLM calls (prompt building,
+            # agent setup, checkpoint I/O — and human think time on paused beats).
+            beat_wall = time.perf_counter() - beat_wall_start
+            beat_llm = llm_seconds() - beat_llm_start
+            logger.info(
+                "Beat %d/%d: timing wall=%.2fs llm=%.2fs overhead=%.3fs",
+                beat.index, len(scene.beats), beat_wall, beat_llm, beat_wall - beat_llm,
+            )
 
         # --- Final output ---
         # Assemble beats in order from checkpoint
@@ -286,7 +439,7 @@ def run_scene(file_path: str) -> str:
 
 _NARRATOR_TRIM_TOKEN_THRESHOLD = 10500  # ~85% of ctx=12288; trim only when actually close
 
-def _trim_narrator_context(narrator, last_input_tokens: int) -> None:
+def _trim_narrator_context(narrator, last_input_tokens: int) -> bool:
     """Trim narrator conversation by direct message deletion when approaching ctx=12288.
 
     IMPORTANT: Do NOT call SummarizingConversationManager.reduce_context() here.
@@ -298,9 +451,11 @@ def _trim_narrator_context(narrator, last_input_tokens: int) -> None:
 
     Only fires when last_input_tokens exceeds the threshold — for short scenes this
     never triggers, preserving perfect KV cache continuity throughout.
+
+    Returns True if messages were dropped.
     """
     if last_input_tokens < _NARRATOR_TRIM_TOKEN_THRESHOLD:
-        return
+        return False
 
     msg_count = len(narrator.messages)
     preserve = narrator.conversation_manager.preserve_recent_messages
@@ -310,13 +465,14 @@ def _trim_narrator_context(narrator, last_input_tokens: int) -> None:
     other_msgs  = [m for m in narrator.messages if _msg_role(m) != "system"]
 
     if len(other_msgs) <= preserve:
-        return
+        return False
 
     narrator.messages[:] = system_msgs + other_msgs[-preserve:]
     logger.info(
         "Narrator context trimmed: %d → %d messages (input_tokens=%d)",
         msg_count, len(narrator.messages), last_input_tokens,
     )
+    return True
 
 
 def _snapshot_narrator_state(narrator):
@@ -338,11 +494,13 @@ def _msg_role(msg) -> str:
 
 def _call_lore_injector(
     beat_text: str, beat_index: int, characters_json: str, world_info: str
-) -> str:
+) -> tuple[str, list[str]]:
     """Build lore context using direct Python tool calls — no LLM required.
 
     The three lore tools are pure Python (regex, dict lookup, string assembly).
     Bypassing the agent eliminates one full KV-cache eviction per beat.
+
+    Returns (lore_block, matched character names).
     """
     logger.debug("Beat %d: lore injection (pure-Python)", beat_index)
     matched_names = json.loads(scan_for_triggers(beat_text, characters_json))
@@ -351,15 +509,22 @@ def _call_lore_injector(
         card = get_character_card(name, characters_json)
         if not card.startswith("Character not found"):
             cards.append(card)
-    return build_lore_block(json.dumps(cards))
+    return build_lore_block(json.dumps(cards)), matched_names
+
 
+def _call_narrator(agent, ctx: NarratorContext, guard: GuardLimits | None = None) -> tuple[str, int]:
+    """Call the NarratorAgent to write prose for a beat.
 
-def _call_narrator(agent, ctx: NarratorContext) -> tuple[str, int]:
-    """Call the NarratorAgent to write prose for a beat."""
+    The draft streams to the terminal as it is generated. With `guard` set, the
+    NarratorStream handler may cancel the call mid-stream — check
+    _stream_violation(agent) afterwards; the returned prose is then the partial draft.
+    """
     parts = [f"Write prose for beat {ctx.beat_index}/{ctx.beat_total}.\n"]
 
     if ctx.prior_story_summary:
         parts.append(f"## Story So Far\n{ctx.prior_story_summary}\n")
+    if ctx.recalled_beats:
+        parts.append(f"## Relevant Earlier Beats\n{ctx.recalled_beats}\n")
 
     parts.append(f"## Beat Instruction\n{ctx.beat_instruction}\n")
     if ctx.lore_context:
@@ -373,28 +538,29 @@ def _call_narrator(agent, ctx: NarratorContext) -> tuple[str, int]:
 
     prompt = "\n".join(parts)
     logger.debug(
-        "Beat %d/%d: narrator prompt chars=%d (resume=%d instruction=%d lore=%d author_note=%d redirect=%d)",
+        "Beat %d/%d: narrator prompt chars=%d (resume=%d recalled=%d instruction=%d lore=%d author_note=%d redirect=%d)",
         ctx.beat_index,
         ctx.beat_total,
         len(prompt),
         len(ctx.prior_story_summary or ""),
+        len(ctx.recalled_beats or ""),
         len(ctx.beat_instruction),
         len(ctx.lore_context),
         len(ctx.author_note or ""),
         len(ctx.redirect_instruction or ""),
     )
-    # Snapshot cumulative usage before this call so we can log per-beat deltas.
-    # agent.event_loop_metrics accumulates across the agent's lifetime; result.metrics
-    # is the same object, so subtracting the pre-call snapshot gives per-call usage.
-    prev = agent.event_loop_metrics.accumulated_usage
-    prev_in = prev.get("inputTokens", 0)
-    prev_out = prev.get("outputTokens", 0)
-
-    result = agent(prompt)
+    stream = _narrator_stream(agent)
+    if stream is not None:
+        stream.arm(agent, guard)
+    # pool.invoke() gives the agent fresh metrics per call (history is kept),
+    # so result.metrics is already per-call usage.
+    result = invoke(agent, prompt)
+    if stream is not None and stream.ttft is not None:
+        logger.info("Beat %d/%d: narrator ttft=%.2fs", ctx.beat_index, ctx.beat_total, stream.ttft)
 
     usage = result.metrics.accumulated_usage
-    beat_in = usage.get("inputTokens", 0) - prev_in
-    beat_out = usage.get("outputTokens", 0) - prev_out
+    beat_in = usage.get("inputTokens", 0)
+    beat_out = usage.get("outputTokens", 0)
     logger.info(
         "Beat %d/%d: narrator tokens in=%d out=%d stop=%s (history=%d msgs)",
         ctx.beat_index,
@@ -404,11 +570,23 @@ def _call_narrator(agent, ctx: NarratorContext) -> tuple[str, int]:
         result.stop_reason,
         len(agent.messages),
     )
+    if stream is not None and stream.violation:
+        return stream.text, beat_in
     return str(result), beat_in
 
 
-_EVALUATOR_PRIOR_SUMMARY_WINDOW = 10  # Keep only the last N beat summaries
-_EVALUATOR_PRIOR_SUMMARY_MAX_CHARS = 4500  # Secondary hard cap after window trim
+def _narrator_stream(agent) -> NarratorStream | None:
+    handler = getattr(agent, "callback_handler", None)
+    return handler if isinstance(handler, NarratorStream) else None
+
+
+def _stream_violation(agent) -> str | None:
+    """Reason the last narrator call was aborted by the stream guard, or None."""
+    stream = _narrator_stream(agent)
+    return stream.violation if stream is not None else None
+
+
+_EVALUATOR_RECENT_BEATS = 2  # newest summaries always in the evaluator prompt; the rest by relevance
 _EVALUATOR_SINGLE_PASS_PRIOR_SUMMARY_MAX_CHARS = 1800
 _EVALUATOR_SINGLE_PASS_PROSE_MAX_CHARS = 4200
 _SUMMARY_MAX_BULLETS = 5
@@ -416,32 +594,17 @@ _SUMMARY_MAX_BULLET_CHARS = 220
 _SUMMARY_MAX_TOTAL_CHARS = 1000
 
 
-def _build_resume_story_summary(prior_summary: str) -> str:
+def _build_resume_story_summary(memory: BeatMemory, next_beat_text: str) -> str:
     """Build a compact narrator seed for the first beat after checkpoint resume."""
-    trimmed = _trim_prior_summary(prior_summary, window=_NARRATOR_RESUME_SUMMARY_WINDOW)
-    return _cap_prior_summary_chars(trimmed, max_chars=_NARRATOR_RESUME_SUMMARY_MAX_CHARS)
-
-
-def _trim_prior_summary(prior_summary: str, window: int = _EVALUATOR_PRIOR_SUMMARY_WINDOW) -> str:
-    """Return the last `window` beat summaries from the accumulated prior_summary string.
-
-    Each summary block starts with '### Beat N Summary'. Older summaries are dropped
-    to keep the evaluator prompt within the 9B model's context window.
-    """
-    if not prior_summary:
-        return prior_summary
-    # Split on section headers, keeping the delimiter
-    parts = re.split(r'(?=### Beat \d+ Summary)', prior_summary.strip())
-    parts = [p for p in parts if p.strip()]
-    if len(parts) <= window:
-        return prior_summary
-    return "\n\n" + "\n\n".join(parts[-window:])
+    return memory.recall(
+        next_beat_text, _NARRATOR_RESUME_SUMMARY_TOKENS, recent=_NARRATOR_RESUME_SUMMARY_WINDOW,
+    )
 
 
 def _cap_prior_summary_chars(
-    prior_summary: str, max_chars: int = _EVALUATOR_PRIOR_SUMMARY_MAX_CHARS
+    prior_summary: str, max_chars: int = _EVALUATOR_SINGLE_PASS_PRIOR_SUMMARY_MAX_CHARS
 ) -> str:
-    """Apply a hard character budget to evaluator prior-summary context.
+    """Shrink the recalled prior-summary blocks to the single-pass recovery budget.
 
     Keeps the most recent beat-summary blocks first, then truncates to tail as fallback.
     """
@@ -504,11 +667,7 @@ def _call_evaluator_single_pass(
     beat_instruction: str, prose: str, writing_style: str, prior_summary: str
 ) -> EvalResult | None:
     """Fallback evaluator path with no tool-calling to avoid recursive tool loops."""
-    trimmed_summary = _trim_prior_summary(prior_summary)
-    capped_summary = _cap_prior_summary_chars(
-        trimmed_summary,
-        max_chars=_EVALUATOR_SINGLE_PASS_PRIOR_SUMMARY_MAX_CHARS,
-    )
+    capped_summary = _cap_prior_summary_chars(prior_summary)
     compact_prose = _truncate_middle(prose, _EVALUATOR_SINGLE_PASS_PROSE_MAX_CHARS)
     prompt = (
         "Evaluate this beat's prose and return strict JSON only.\n\n"
@@ -525,7 +684,8 @@ def _call_evaluator_single_pass(
     )
 
     try:
-        result = create_evaluator_single_pass()(prompt)
+        with agent_pool.lease("evaluator_single_pass", create_evaluator_single_pass) as agent:
+            result = invoke(agent, prompt, stateless=True)
         raw = str(result)
     except Exception as exc:
         logger.warning(
@@ -559,28 +719,28 @@ def _call_evaluator_single_pass(
 def _call_evaluator(
     agent, beat_instruction: str, prose: str, writing_style: str, prior_summary: str
 ) -> EvalResult:
-    """Call the EvaluatorAgent and parse its verdict."""
-    trimmed_summary = _trim_prior_summary(prior_summary)
-    capped_summary = _cap_prior_summary_chars(trimmed_summary)
+    """Call the EvaluatorAgent and parse its verdict.
+
+    prior_summary is the beat-memory recall for this beat — already inside the
+    evaluator token budget (STORY_ENGINE_MEMORY_EVAL_TOKENS).
+    """
     prompt = (
         f"Evaluate this beat's prose.\n\n"
         f"## Beat Instruction\n{beat_instruction}\n\n"
         f"## Prose Output\n{prose}\n\n"
         f"## Writing Style\n{writing_style}\n\n"
-        f"## Prior Beats Summary\n{capped_summary if capped_summary else '(first beat — no prior context)'}"
+        f"## Prior Beats Summary\n{prior_summary if prior_summary else '(first beat — no prior context)'}"
     )
     logger.debug(
-        "Evaluator prompt chars=%d (instruction=%d prose=%d style=%d prior_raw=%d prior_window=%d prior_capped=%d)",
+        "Evaluator prompt chars=%d (instruction=%d prose=%d style=%d prior=%d)",
         len(prompt),
         len(beat_instruction),
         len(prose),
         len(writing_style),
         len(prior_summary),
-        len(trimmed_summary),
-        len(capped_summary),
     )
     try:
-        result = agent(prompt)
+        result = invoke(agent, prompt, stateless=True)
         raw = str(result)
         usage = result.metrics.accumulated_usage
         logger.info(
@@ -693,39 +853,51 @@ def _call_evaluator(
 # ---------------------------------------------------------------------------
 
 def _narrate_and_evaluate(
-    narrator, ctx: NarratorContext, writing_style: str, prior_summary: str
+    narrator, ctx: NarratorContext, writing_style: str, prior_summary: str,
+    guard: GuardLimits | None = None,
 ) -> tuple[str, int, int, list]:
     """Run the narrator → evaluator loop with retries.
 
+    A draft aborted by the stream guard counts as a failed attempt without an
+    evaluator call; its reason becomes the retry feedback. The final attempt
+    always runs unguarded so the beat ends with a complete draft.
+
     Returns (prose, retry_count, last_narrator_input_tokens, beat_start_state).
     """
+    def _attempt_guard() -> GuardLimits | None:
+        return guard if retry_count < MAX_RETRIES - 1 else None
+
     retry_count = 0
     beat_start_state = _snapshot_narrator_state(narrator)
     logger.info("Beat %d/%d: → narrator (attempt 1)", ctx.beat_index, ctx.beat_total)
-    prose, last_narrator_in = _call_narrator(narrator, ctx)
-    logger.info("Beat %d/%d: ← narrator (%d words)", ctx.beat_index, ctx.beat_total, len(prose.split()))
+    prose, last_narrator_in = _call_narrator(narrator, ctx, _attempt_guard())
+    _log_narrator_result(narrator, ctx, prose)
 
     while retry_count < MAX_RETRIES:
-        logger.info("Beat %d/%d: → evaluator", ctx.beat_index, ctx.beat_total)
-        gc.collect()
-        evaluator = create_evaluator()
-        eval_result = _call_evaluator(evaluator, ctx.beat_instruction, prose, writing_style, prior_summary)
-        if eval_result.evaluated:
-            logger.info(
-                "Beat %d/%d: ← evaluator %s score=%.2f | %s",
-                ctx.beat_index, ctx.beat_total,
-                eval_result.result, eval_result.score, eval_result.reason,
-            )
+        violation = _stream_violation(narrator)
+        if violation:
+            feedback = f"[Stream guard — draft stopped early, please address]: {violation}"
         else:
-            logger.warning(
-                "Beat %d/%d: ← evaluator fallback accepted output (%s)",
-                ctx.beat_index,
-                ctx.beat_total,
-                eval_result.fallback_reason,
-            )
+            logger.info("Beat %d/%d: → evaluator", ctx.beat_index, ctx.beat_total)
+            with agent_pool.lease("evaluator", create_evaluator) as evaluator:
+                eval_result = _call_evaluator(evaluator, ctx.beat_instruction, prose, writing_style, prior_summary)
+            if eval_result.evaluated:
+                logger.info(
+                    "Beat %d/%d: ← evaluator %s score=%.2f | %s",
+                    ctx.beat_index, ctx.beat_total,
+                    eval_result.result, eval_result.score, eval_result.reason,
+                )
+            else:
+                logger.warning(
+                    "Beat %d/%d: ← evaluator fallback accepted output (%s)",
+                    ctx.beat_index,
+                    ctx.beat_total,
+                    eval_result.fallback_reason,
+                )
 
-        if eval_result.result == "pass":
-            break
+            if eval_result.result == "pass":
+                break
+            feedback = f"[Evaluator feedback — please address]: {eval_result.reason}"
 
         retry_count += 1
         if retry_count < MAX_RETRIES:
@@ -734,17 +906,25 @@ def _narrate_and_evaluate(
                 "Beat %d/%d: → narrator (retry %d/%d)",
                 ctx.beat_index, ctx.beat_total, retry_count + 1, MAX_RETRIES,
             )
-            # Append evaluator feedback to context for the retry
-            ctx.redirect_instruction = f"[Evaluator feedback — please address]: {eval_result.reason}"
-            prose, last_narrator_in = _call_narrator(narrator, ctx)
-            logger.info(
-                "Beat %d/%d: ← narrator (%d words)",
-                ctx.beat_index, ctx.beat_total, len(prose.split()),
-            )
+            # Append evaluator / stream-guard feedback to context for the retry
+            ctx.redirect_instruction = feedback
+            prose, last_narrator_in = _call_narrator(narrator, ctx, _attempt_guard())
+            _log_narrator_result(narrator, ctx, prose)
 
     return prose, retry_count, last_narrator_in, beat_start_state
 
 
+def _log_narrator_result(narrator, ctx: NarratorContext, prose: str) -> None:
+    violation = _stream_violation(narrator)
+    if violation:
+        logger.info(
+            "Beat %d/%d: ← narrator aborted by stream guard after %d words (%s)",
+            ctx.beat_index, ctx.beat_total, len(prose.split()), violation,
+        )
+    else:
+        logger.info("Beat %d/%d: ← narrator (%d words)", ctx.beat_index, ctx.beat_total, len(prose.split()))
+
+
 # ---------------------------------------------------------------------------
 # Human input handling
 # ---------------------------------------------------------------------------
@@ -776,8 +956,8 @@ def _handle_human_input(
             prose, _ = _call_narrator(narrator, ctx)
             logger.info("Beat %d/%d: ← narrator (%d words)", beat.index, len(scene.beats), len(prose.split()))
             logger.info("Beat %d/%d: → evaluator (human retry)", beat.index, len(scene.beats))
-            gc.collect()
-            eval_result = _call_evaluator(create_evaluator(), ctx.beat_instruction, prose, scene.writing_style, prior_summary)
+            with agent_pool.lease("evaluator", create_evaluator) as evaluator:
+                eval_result = _call_evaluator(evaluator, ctx.beat_instruction, prose, scene.writing_style, prior_summary)
             if eval_result.evaluated:
                 logger.info("Beat %d/%d: ← evaluator %s score=%.2f", beat.index, len(scene.beats), eval_result.result, eval_result.score)
             else:
@@ -791,8 +971,8 @@ def _handle_human_input(
             prose, _ = _call_narrator(narrator, ctx)
             logger.info("Beat %d/%d: ← narrator (%d words)", beat.index, len(scene.beats), len(prose.split()))
             logger.info("Beat %d/%d: → evaluator (human redirect)", beat.index, len(scene.beats))
-            gc.collect()
-            eval_result = _call_evaluator(create_evaluator(), ctx.beat_instruction, prose, scene.writing_style, prior_summary)
+            with agent_pool.lease("evaluator", create_evaluator) as evaluator:
+                eval_result = _call_evaluator(evaluator, ctx.beat_instruction, prose, scene.writing_style, prior_summary)
             if eval_result.evaluated:
                 logger.info("Beat %d/%d: ← evaluator %s score=%.2f", beat.index, len(scene.beats), eval_result.result, eval_result.score)
             else:
@@ -898,7 +1078,7 @@ def _summarise_beat(agent, prose: str, beat_index: int) -> str:
                 len(prompt),
                 len(current_prose),
             )
-            result = agent(prompt)
+            result = invoke(agent, prompt, stateless=True)
             raw_summary = str(result).strip()
             capped_summary = _normalize_summary_for_budget(raw_summary)
             if capped_summary != raw_summary:
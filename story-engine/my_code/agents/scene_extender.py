@@ -11,7 +11,8 @@ from __future__ import annotations
 from strands import Agent
 from strands.agent.conversation_manager.null_conversation_manager import NullConversationManager
 
-from my_code.models.provider import get_model, system_prompt_suffix
+from my_code.models.pool import get_pooled_model
+from my_code.models.provider import system_prompt_suffix
 
 SCENE_EXTENDER_SYSTEM_PROMPT = """\
 You are a story continuation planner for a multi-agent story engine.
@@ -55,6 +56,6 @@ def create_scene_extender() -> Agent:
         name="SceneExtender",
         system_prompt=system_prompt_suffix(SCENE_EXTENDER_SYSTEM_PROMPT),
         tools=[],
-        model=get_model("summariser"),
+        model=get_pooled_model("summariser"),
         conversation_manager=NullConversationManager(),
     )
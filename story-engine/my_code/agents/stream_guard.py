@@ -0,0 +1,186 @@
+"""Narrator streaming — echo, time-to-first-token, and an in-process stream guard.
+
+NarratorStream is the narrator agent's Strands callback_handler. It replaces the
+default PrintingCallbackHandler (text deltas still go to the terminal as they
+arrive) and adds:
+
+    - time-to-first-token per call (logged by the orchestrator)
+    - a cheap guard that inspects the draft while it streams and calls
+      agent.cancel() on a clearly bad generation, instead of paying for the
+      full draft plus a full evaluator pass that would reject it anyway
+
+Guard checks (all pure Python, incremental — each delta is scanned once):
+    - length overrun : narration past STORY_ENGINE_STREAM_GUARD_OVERRUN × the
+                       per-beat word target (target_length / beat count)
+    - POV drift      : third-person scenes only — first-person singular pronouns
+                       outside dialogue quotes past a small threshold
+    - forbidden text : leaked tool-call JSON, assistant boilerplate, and any
+                       extra regex from STORY_ENGINE_STREAM_GUARD_FORBIDDEN
+
+Config:
+    STORY_ENGINE_STREAM_GUARD            interactive (default) | always | off
+                                         interactive = interactive and semi-interactive modes
+    STORY_ENGINE_STREAM_GUARD_OVERRUN    multiple of the per-beat target (default 2.0)
+    STORY_ENGINE_STREAM_GUARD_FORBIDDEN  extra case-insensitive regex to abort on
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass
+
+from my_code.models.data_models import ParsedScene
+
+logger = logging.getLogger(__name__)
+
+GUARD_MODE: str = os.getenv("STORY_ENGINE_STREAM_GUARD", "interactive").strip().lower()
+OVERRUN: float = float(os.getenv("STORY_ENGINE_STREAM_GUARD_OVERRUN", "2.0"))
+_EXTRA_FORBIDDEN: str = os.getenv("STORY_ENGINE_STREAM_GUARD_FORBIDDEN", "")
+
+# Narration that is clearly not prose — matches leaked tool calls / chat boilerplate.
+_DEFAULT_FORBIDDEN = (
+    r'^\s*\{\s*"(?:function|role|name|tool)"'
+    r"|\bas an ai(?: language model)?\b"
+    r"|\bi(?:'m| am) (?:sorry|unable)[^.\n]{0,40}\b(?:write|continue|assist)"
+)
+
+_POV_DRIFT_MIN_WORDS = 60     # don't judge POV on the first sentence or two
+_POV_DRIFT_MAX_PRONOUNS = 6   # first-person pronouns allowed outside dialogue
+_FIRST_PERSON = frozenset({"i", "me", "my", "mine", "myself", "i'm", "i'd", "i've", "i'll"})
+_QUOTES = '"“”'
+_FORBIDDEN_LOOKBACK = 200     # chars re-scanned so matches across delta boundaries are caught
+
+
+@dataclass
+class GuardLimits:
+    """Per-scene guard thresholds. max_words=0 disables the length check."""
+    max_words: int = 0
+    third_person: bool = False
+    forbidden: re.Pattern | None = None
+
+
+def guard_enabled(mode: str) -> bool:
+    """Whether the stream guard applies to a run in the given execution mode."""
+    if GUARD_MODE == "off":
+        return False
+    if GUARD_MODE == "always":
+        return True
+    return mode in ("interactive", "semi-interactive")
+
+
+def limits_for_scene(scene: ParsedScene) -> GuardLimits:
+    """Derive guard thresholds from the scene's [meta] (same per-beat target the narrator is given)."""
+    beat_count = len(scene.beats)
+    target = scene.meta.target_length
+    words_per_beat = target // beat_count if beat_count else target
+    pattern = _DEFAULT_FORBIDDEN + (f"|{_EXTRA_FORBIDDEN}" if _EXTRA_FORBIDDEN else "")
+    return GuardLimits(
+        max_words=int(words_per_beat * OVERRUN) if words_per_beat and OVERRUN > 0 else 0,
+        third_person=scene.meta.pov.lower().startswith("third"),
+        forbidden=re.compile(pattern, re.IGNORECASE | re.MULTILINE),
+    )
+
+
+class NarratorStream:
+    """Callback handler for the narrator agent: echo deltas, time TTFT, guard the draft.
+
+    Strands calls the handler on the pool's event-loop thread for every stream
+    event; agent.cancel() is thread-safe and makes the model stream stop at the
+    next chunk with stop_reason="cancelled".
+    """
+
+    def __init__(self, echo: bool = True) -> None:
+        self.echo = echo
+        self._agent = None
+        self._limits: GuardLimits | None = None
+        self._start = 0.0
+        self.ttft: float | None = None
+        self.violation: str | None = None
+        self._text = ""
+        self._scanned = 0
+        self._words = 0
+        self._first_person = 0
+        self._in_quote = False
+
+    def arm(self, agent, limits: GuardLimits | None) -> None:
+        """Reset per-call state before invoking the agent. limits=None streams unguarded."""
+        self._agent = agent
+        self._limits = limits
+        self._start = time.perf_counter()
+        self.ttft = None
+        self.violation = None
+        self._text = ""
+        self._scanned = 0
+        self._words = 0
+        self._first_person = 0
+        self._in_quote = False
+
+    def __call__(self, **kwargs) -> None:
+        reasoning = kwargs.get("reasoningText")
+        if reasoning and self.echo:
+            sys.stdout.write(reasoning)
+        data = kwargs.get("data")
+        if data:
+            if self.ttft is None:
+                self.ttft = time.perf_counter() - self._start
+            if self.echo:
+                sys.stdout.write(data)
+                sys.stdout.flush()
+            if self.violation is None:
+                self._text += data
+                if self._limits is not None:
+                    self._check(final=False)
+            if kwargs.get("complete") and self.echo:
+                sys.stdout.write("\n\n")
+                sys.stdout.flush()
+
+    @property
+    def text(self) -> str:
+        """Draft text received so far in the current call."""
+        return self._text
+
+    # -- guard ---------------------------------------------------------------
+
+    def _check(self, final: bool) -> None:
+        text = self._text
+        # Only scan up to the last whitespace so a word split across deltas is counted once.
+        end = len(text) if final else max(text.rfind(" "), text.rfind("\n")) + 1
+        if end <= self._scanned:
+            return
+        limits = self._limits
+        segment = text[self._scanned:end]
+        window_start = max(0, self._scanned - _FORBIDDEN_LOOKBACK)
+        self._scanned = end
+
+        for token in segment.split():
+            self._words += 1
+            if token[0] in _QUOTES:
+                self._in_quote = not self._in_quote
+            if not self._in_quote and limits.third_person:
+                if re.sub(r"[^\w']", "", token).lower() in _FIRST_PERSON:
+                    self._first_person += 1
+            if len(token) > 1 and token.rstrip(".,;:!?—-)")[-1:] in _QUOTES:
+                self._in_quote = not self._in_quote
+
+        if limits.max_words and self._words > limits.max_words:
+            self._trip(f"length overrun: {self._words} words > {limits.max_words} limit")
+        elif (limits.third_person and self._words >= _POV_DRIFT_MIN_WORDS
+              and self._first_person > _POV_DRIFT_MAX_PRONOUNS):
+            self._trip(f"POV drift: {self._first_person} first-person pronouns in third-person narration")
+        elif limits.forbidden is not None:
+            m = limits.forbidden.search(text, window_start, end)
+            if m:
+                self._trip(f"forbidden content: {m.group(0)[:60]!r}")
+
+    def _trip(self, reason: str) -> None:
+        self.violation = reason
+        logger.warning("Stream guard: aborting narrator draft — %s", reason)
+        if self.echo:
+            sys.stdout.write(f"\n[stream guard: {reason} — draft aborted]\n")
+            sys.stdout.flush()
+        if self._agent is not None:
+            self._agent.cancel()
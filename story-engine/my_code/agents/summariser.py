@@ -1,6 +1,7 @@
 """BeatSummariserAgent — produces structured beat summaries for coherence tracking.
 
-Called once per accepted beat. Stateless per invocation.
+Called once per accepted beat. Stateless per invocation — one instance is
+reused across beats via models.pool.
 Output accumulates in prior_summary and is passed to the evaluator each beat.
 
 See AGENT_DESIGN.md §1.5.
@@ -11,7 +12,8 @@ from __future__ import annotations
 from strands import Agent
 from strands.agent.conversation_manager.null_conversation_manager import NullConversationManager
 
-from my_code.models.provider import get_model, system_prompt_suffix
+from my_code.models.pool import get_pooled_model
+from my_code.models.provider import system_prompt_suffix
 
 SUMMARISER_SYSTEM_PROMPT = """\
 You are a story continuity tracker for a multi-agent story engine.
@@ -42,6 +44,6 @@ def create_summariser() -> Agent:
         name="BeatSummariser",
         system_prompt=system_prompt_suffix(SUMMARISER_SYSTEM_PROMPT),
         tools=[],
-        model=get_model("summariser"),
+        model=get_pooled_model("summariser"),
         conversation_manager=NullConversationManager(),
     )
@@ -1,7 +1,8 @@
 """TranslatorAgent — translates story prose paragraph by paragraph.
 
-Stateless per invocation. Rolling context (last 2 translated paragraphs)
-is injected manually into each prompt to preserve name/tone continuity.
+Stateless per invocation — instances are leased from models.pool and reset
+between paragraphs. Rolling context (last 2 translated paragraphs) is injected
+manually into each prompt to preserve name/tone continuity.
 
 Model: reuses the summariser endpoint (STORY_ENGINE_SUMMARISER_BASE_URL).
 """
@@ -11,7 +12,8 @@ from __future__ import annotations
 from strands import Agent
 from strands.agent.conversation_manager.null_conversation_manager import NullConversationManager
 
-from my_code.models.provider import get_model, system_prompt_suffix
+from my_code.models.pool import get_pooled_model
+from my_code.models.provider import system_prompt_suffix
 
 _SYSTEM_PROMPT = """\
 You are a professional literary translator. You translate story prose faithfully,
@@ -31,7 +33,7 @@ preserving tone, style, character voice, and narrative flow.
 
 
 def create_translator(source_lang: str, target_lang: str, hint: str | None = None) -> Agent:
-    """Create a fresh TranslatorAgent for one paragraph."""
+    """Create a TranslatorAgent for one language pair + hint."""
     lang_directive = (
         f"Source language: {source_lang}.\n"
         f"Target language: {target_lang}.\n"
@@ -43,6 +45,6 @@ def create_translator(source_lang: str, target_lang: str, hint: str | None = Non
         name="Translator",
         system_prompt=prompt,
         tools=[],
-        model=get_model("summariser"),
+        model=get_pooled_model("summariser"),
         conversation_manager=NullConversationManager(),
     )
@@ -0,0 +1,303 @@
+"""bench.py — deterministic performance benchmark for run_scene.
+
+Runs a scene end-to-end against the local replay server (my_code.replay_server)
+instead of a real model, captures per-stage timings from the orchestrator's
+log points and writes a JSON report that can be diffed across commits.
+
+Usage:
+    python -m my_code.bench examples/ashenveil_scene1.md
+    python -m my_code.bench scene.md --out bench/report.json
+    python -m my_code.bench scene.md --compare bench/baseline.json      # exit 1 on regression
+
+    # Record real answers once, then replay them deterministically
+    python -m my_code.bench scene.md --record recordings/ash.jsonl --upstream http://localhost:8080/v1
+    python -m my_code.bench scene.md --replay recordings/ash.jsonl
+
+The scene always runs in autonomous mode with its output and checkpoint redirected
+to a temporary directory, so the real output/ folder is never touched.
+
+Report fields worth watching:
+    beats[].narrator_prompt_tokens  — context growth per beat
+    beats[].overhead_s              — per-beat time outside LLM calls
+    beats[].narrator_ttft_s         — time to first streamed narrator token, per attempt
+    server.<agent>.cached_tokens    — prompt-cache reuse on the simulated server
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from my_code.replay_server import LatencyModel, ReplayServer, ReplayState
+
+_REPORT_VERSION = 1
+_ROLES = ("NARRATOR", "EVALUATOR", "SUMMARISER", "ORCHESTRATOR", "LORE_INJECTOR")
+
+_BEAT_START_RE = re.compile(r"^--- Beat (\d+)/\d+ ---$")
+_STAGE_RE = re.compile(r"^Beat (\d+)/\d+: (→|←) (narrator|evaluator|summariser)\b")
+_TIMING_RE = re.compile(r"^Beat (\d+)/\d+: timing wall=([\d.]+)s llm=([\d.]+)s overhead=([\d.]+)s")
+_NARRATOR_TOKENS_RE = re.compile(r"^Beat (\d+)/\d+: narrator tokens in=(\d+) out=(\d+)")
+_NARRATOR_TTFT_RE = re.compile(r"^Beat (\d+)/\d+: narrator ttft=([\d.]+)s")
+
+
+# ---------------------------------------------------------------------------
+# Log capture
+# ---------------------------------------------------------------------------
+
+class _StageRecorder(logging.Handler):
+    """Collects (timestamp, message) from the orchestrator logger."""
+
+    def __init__(self) -> None:
+        super().__init__(level=logging.DEBUG)
+        self.records: list[tuple[float, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append((record.created, record.getMessage()))
+
+
+def _beats_from_log(records: list[tuple[float, str]]) -> list[dict]:
+    """Turn orchestrator log points into per-beat stage timings."""
+    beats: dict[int, dict] = {}
+    open_stage: dict[tuple[int, str], float] = {}
+    first_stage_seen: set[int] = set()
+
+    def beat(n: int) -> dict:
+        return beats.setdefault(n, {
+            "beat": n, "stages": {"prep": 0.0, "narrator": 0.0, "evaluator": 0.0, "summariser": 0.0},
+            "calls": {"narrator": 0, "evaluator": 0, "summariser": 0},
+        })
+
+    for ts, msg in records:
+        if m := _BEAT_START_RE.match(msg):
+            n = int(m.group(1))
+            beat(n)["_start"] = ts
+        elif m := _STAGE_RE.match(msg):
+            n, arrow, stage = int(m.group(1)), m.group(2), m.group(3)
+            b = beat(n)
+            if arrow == "→":
+                if n not in first_stage_seen and "_start" in b:
+                    b["stages"]["prep"] += ts - b["_start"]
+                first_stage_seen.add(n)
+                open_stage[(n, stage)] = ts
+            elif (n, stage) in open_stage:
+                b["stages"][stage] += ts - open_stage.pop((n, stage))
+                b["calls"][stage] += 1
+        elif m := _TIMING_RE.match(msg):
+            b = beat(int(m.group(1)))
+            b["wall_s"], b["llm_s"], b["overhead_s"] = (float(m.group(i)) for i in (2, 3, 4))
+        elif m := _NARRATOR_TOKENS_RE.match(msg):
+            b = beat(int(m.group(1)))
+            b.setdefault("narrator_prompt_tokens", []).append(int(m.group(2)))
+            b.setdefault("narrator_completion_tokens", []).append(int(m.group(3)))
+        elif m := _NARRATOR_TTFT_RE.match(msg):
+            beat(int(m.group(1))).setdefault("narrator_ttft_s", []).append(float(m.group(2)))
+
+    out = []
+    for n in sorted(beats):
+        b = beats[n]
+        b.pop("_start", None)
+        b["stages"] = {k: round(v, 4) for k, v in b["stages"].items()}
+        out.append(b)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Run
+# ---------------------------------------------------------------------------
+
+def _prepare_scene(scene_path: Path, workdir: Path) -> Path:
+    """Copy the scene with [meta] mode/output_file redirected into workdir."""
+    text = scene_path.read_text(encoding="utf-8")
+    out_file = workdir / "output" / f"{scene_path.stem}.md"
+    text = re.sub(r"(?m)^output_file:.*$", f"output_file: {out_file.as_posix()}", text, count=1)
+    text = re.sub(r"(?m)^mode:.*$", "mode: autonomous", text, count=1)
+    dest = workdir / scene_path.name
+    dest.write_text(text, encoding="utf-8")
+    return dest
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(
+    scene_path: Path,
+    state: ReplayState,
+    verbose: bool = False,
+) -> dict:
+    """Run one scene against a replay server and return the report dict."""
+    with ReplayServer(state) as server, tempfile.TemporaryDirectory(prefix="se-bench-") as tmp:
+        # Route every role to the replay server before any model is built.
+        os.environ["STORY_ENGINE_PROVIDER"] = "local"
+        os.environ["STORY_ENGINE_LOCAL_BASE_URL"] = server.base_url
+        for role in _ROLES:
+            os.environ[f"STORY_ENGINE_{role}_BASE_URL"] = server.base_url
+
+        from my_code.agents.orchestrator import run_scene
+
+        scene_file = _prepare_scene(scene_path, Path(tmp))
+        recorder = _StageRecorder()
+        orch_logger = logging.getLogger("my_code.agents.orchestrator")
+        prev_level = orch_logger.level
+        orch_logger.setLevel(logging.DEBUG)
+        orch_logger.addHandler(recorder)
+
+        sink = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        start = time.perf_counter()
+        try:
+            with sink:
+                run_scene(str(scene_file))
+        finally:
+            wall = time.perf_counter() - start
+            orch_logger.removeHandler(recorder)
+            orch_logger.setLevel(prev_level)
+
+    beats = _beats_from_log(recorder.records)
+    server_stats = state.stats_dict()
+    walls = [b["wall_s"] for b in beats if "wall_s" in b]
+    overheads = [b["overhead_s"] for b in beats if "overhead_s" in b]
+    return {
+        "version": _REPORT_VERSION,
+        "scene": str(scene_path),
+        "git_commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "latency_model": vars(state.latency),
+        "shared_cache": state.shared_cache,
+        "totals": {
+            "wall_s": round(wall, 3),
+            "beats": len(beats),
+            "llm_calls": sum(s["calls"] for s in server_stats.values()),
+            "prompt_tokens": sum(s["prompt_tokens"] for s in server_stats.values()),
+            "cached_tokens": sum(s["cached_tokens"] for s in server_stats.values()),
+            "completion_tokens": sum(s["completion_tokens"] for s in server_stats.values()),
+            "simulated_llm_s": round(sum(s["simulated_s"] for s in server_stats.values()), 3),
+            "beat_wall_p50_s": round(statistics.median(walls), 4) if walls else None,
+            "beat_wall_p95_s": round(_p95(walls), 4) if walls else None,
+            "beat_overhead_mean_s": round(statistics.mean(overheads), 4) if overheads else None,
+            "replay_misses": sum(s["synthetic"] for s in server_stats.values()) if state.recording else 0,
+        },
+        "beats": beats,
+        "server": server_stats,
+    }
+
+
+def _p95(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+
+
+# ---------------------------------------------------------------------------
+# Compare
+# ---------------------------------------------------------------------------
+
+def _last_narrator_tokens(report: dict) -> int:
+    for b in reversed(report.get("beats", [])):
+        if b.get("narrator_prompt_tokens"):
+            return b["narrator_prompt_tokens"][-1]
+    return 0
+
+
+_COMPARE_METRICS = [
+    # (label, getter)
+    ("total prompt tokens", lambda r: r["totals"]["prompt_tokens"]),
+    ("uncached prompt tokens", lambda r: r["totals"]["prompt_tokens"] - r["totals"]["cached_tokens"]),
+    ("last-beat narrator prompt tokens", _last_narrator_tokens),
+    ("simulated LLM time (s)", lambda r: r["totals"]["simulated_llm_s"]),
+    ("beat wall p95 (s)", lambda r: r["totals"]["beat_wall_p95_s"] or 0),
+    ("beat overhead mean (s)", lambda r: r["totals"]["beat_overhead_mean_s"] or 0),
+]
+
+
+def compare_reports(baseline: dict, current: dict, tolerance: float) -> list[str]:
+    """Print a side-by-side table; return labels of metrics that regressed."""
+    regressions = []
+    print(f"\n  {'metric':<34} {'baseline':>12} {'current':>12} {'change':>9}")
+    for label, get in _COMPARE_METRICS:
+        old, new = get(baseline), get(current)
+        change = (new - old) / old if old else 0.0
+        flag = ""
+        if old and change > tolerance:
+            flag = "  REGRESSION"
+            regressions.append(label)
+        print(f"  {label:<34} {old:>12.4g} {new:>12.4g} {change:>+8.1%}{flag}")
+    return regressions
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark run_scene against a local replay server.")
+    parser.add_argument("scene", type=Path, help="Scene .md file to run")
+    parser.add_argument("--out", type=Path, help="Write the JSON report here (default: print only)")
+    parser.add_argument("--replay", help="JSONL recording to serve answers from")
+    parser.add_argument("--record", help="Append upstream answers to this JSONL recording")
+    parser.add_argument("--upstream", help="Real OpenAI-compatible base URL to record from")
+    parser.add_argument("--shared-cache", action="store_true",
+                        help="Simulate one prompt-cache slot shared by all agents")
+    parser.add_argument("--base-latency", type=float, default=LatencyModel.base_latency)
+    parser.add_argument("--prefill-tps", type=float, default=LatencyModel.prefill_tps)
+    parser.add_argument("--decode-tps", type=float, default=LatencyModel.decode_tps)
+    parser.add_argument("--compare", type=Path, help="Baseline report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed relative increase before a metric counts as a regression (default: 0.10)")
+    parser.add_argument("--verbose", action="store_true", help="Show streamed model output")
+    args = parser.parse_args(argv)
+
+    if not args.scene.exists():
+        print(f"Error: file not found: {args.scene}", file=sys.stderr)
+        sys.exit(1)
+    if args.record and not args.upstream:
+        parser.error("--record requires --upstream")
+
+    state = ReplayState(
+        LatencyModel(args.base_latency, args.prefill_tps, args.decode_tps),
+        replay_path=args.replay, record_path=args.record,
+        upstream=args.upstream, shared_cache=args.shared_cache,
+    )
+    report = run_benchmark(args.scene, state, verbose=args.verbose)
+
+    t = report["totals"]
+    print(f"\nScene: {report['scene']}  ({t['beats']} beats, commit {report['git_commit'] or '?'})")
+    print(f"  wall {t['wall_s']:.2f}s | simulated LLM {t['simulated_llm_s']:.2f}s | "
+          f"{t['llm_calls']} calls | prompt {t['prompt_tokens']} tok "
+          f"({t['cached_tokens']} cached) | completion {t['completion_tokens']} tok")
+    for b in report["beats"]:
+        tokens = b.get("narrator_prompt_tokens", [])
+        print(f"  beat {b['beat']:>3}: wall {b.get('wall_s', 0):6.2f}s  overhead {b.get('overhead_s', 0):.3f}s  "
+              f"narrator-in {tokens[-1] if tokens else '-':>6}  stages {b['stages']}")
+
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nReport written: {args.out}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare_reports(baseline, report, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ import sys
 from pathlib import Path
 
 from my_code.agents.scene_extender import create_scene_extender
+from my_code.models.pool import invoke
 from my_code.parser import get_raw_sections, parse_scene_file
 
 
@@ -135,7 +136,7 @@ def _call_extender(prev_raw: str, brief: str, beats: int) -> dict:
     )
 
     agent = create_scene_extender()
-    result = str(agent(prompt))
+    result = str(invoke(agent, prompt, stateless=True))
 
     # Extract JSON — local models sometimes wrap output in prose
     json_start = result.find("{")
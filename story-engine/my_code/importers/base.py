@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 try:
     from dotenv import load_dotenv
@@ -39,6 +40,13 @@ API_KEY: str = (
 MAX_WORDS: int = int(os.getenv("STORY_IMPORTER_MAX_WORDS", "6000"))
 WARN_WORDS: int = int(os.getenv("STORY_IMPORTER_WARN_WORDS", "4000"))
 
+# Long-story (chunked) mode — see importers/chunked.py
+CHUNK_WORDS: int = int(os.getenv("STORY_IMPORTER_CHUNK_WORDS", "1500"))
+CHUNK_OVERLAP: int = int(os.getenv("STORY_IMPORTER_CHUNK_OVERLAP", "200"))
+PARALLEL_CHUNKS: bool = os.getenv("STORY_IMPORTER_PARALLEL_CHUNKS", "false").lower() in ("1", "true", "yes")
+CHUNK_CONCURRENCY: int = max(1, int(os.getenv("STORY_IMPORTER_CHUNK_CONCURRENCY", "4")))
+CACHE_DIR: str = os.getenv("STORY_IMPORTER_CACHE_DIR", ".cache/story_importer")
+
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
@@ -46,10 +54,15 @@ def word_count(text: str) -> int:
     return len(text.split())
 
 
+@lru_cache(maxsize=1)
+def _client() -> OpenAI:
+    """Shared client — thread-safe, so parallel chunk calls reuse one connection pool."""
+    return OpenAI(base_url=BASE_URL, api_key=API_KEY)
+
+
 def call_llm(messages: list[dict], temperature: float = 0.7) -> str:
     """Call the configured LLM endpoint and return the raw response string."""
-    client = OpenAI(base_url=BASE_URL, api_key=API_KEY)
-    response = client.chat.completions.create(
+    response = _client().chat.completions.create(
         model=MODEL,
         messages=messages,
         temperature=temperature,
@@ -90,7 +103,6 @@ class StoryAnalyser(ABC):
             beats (list), writing_instructions.
 
         Raises:
-            NotImplementedError: If the strategy is not yet implemented.
             json.JSONDecodeError: If the LLM returns malformed JSON.
         """
 
@@ -100,8 +112,8 @@ class StoryAnalyser(ABC):
 def get_analyser(wc: int) -> StoryAnalyser:
     """Return the appropriate StoryAnalyser for the given word count.
 
-    Currently routes anything above MAX_WORDS to ChunkedAnalyser, which
-    raises NotImplementedError with a user-friendly message until implemented.
+    Anything above MAX_WORDS is routed to ChunkedAnalyser (chunk → merge →
+    synthesis), which keeps every individual LLM call within the single-pass limit.
     """
     from my_code.importers.single_pass import SinglePassAnalyser
     from my_code.importers.chunked import ChunkedAnalyser
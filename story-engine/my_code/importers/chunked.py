@@ -1,9 +1,12 @@
 """ChunkedAnalyser — multi-pass story analyser for long prose.
 
-NOT YET IMPLEMENTED. Raises NotImplementedError with a user-friendly message.
+Used automatically by get_analyser() when the story exceeds
+STORY_IMPORTER_MAX_WORDS. Every individual LLM call stays within the
+single-pass limit, so novel-length inputs import in time roughly linear in
+chunk count / STORY_IMPORTER_CHUNK_CONCURRENCY.
 
 ─────────────────────────────────────────────────────────────────
-DESIGN SPEC (for future implementation)
+DESIGN
 ─────────────────────────────────────────────────────────────────
 
 Entry condition:
@@ -11,7 +14,7 @@ Entry condition:
 
 High-level pipeline:
 
-    Pass 1 — Chunked extraction
+    Pass 1 — Chunked extraction (map)
         Split the story into overlapping chunks (~1500 words, ~200-word overlap).
         For each chunk, make one LLM call to extract a partial JSON:
             {
@@ -20,16 +23,22 @@ High-level pipeline:
               "settings": [{"location": "...", "time": "...", "atmosphere_fragment": "..."}],
               "style_notes": "..."
             }
-        Chunks may be processed sequentially or in parallel
-        (gate behind STORY_IMPORTER_PARALLEL_CHUNKS env var).
+        Chunks are processed sequentially, or concurrently on a bounded thread
+        pool when STORY_IMPORTER_PARALLEL_CHUNKS=true.
 
-    Pass 2 — Merge
-        Deduplicate characters by name and known aliases.
+        Extraction is independent of imagination and beat_count, so each result
+        is cached on disk keyed by sha256(model, prompt version, chunk text).
+        Re-importing the same prose with different --imagination / --beats only
+        reruns synthesis; a failed run resumes from the chunks already cached.
+
+    Pass 2 — Merge (pure Python, deterministic)
+        Deduplicate characters by name and known aliases ("Lyra" ⊂ "Lyra Voss").
         Resolve pronoun chains across chunk boundaries (best-effort heuristic:
-            the most recently introduced named character owns the pronoun).
-        Union world-building/setting details; deduplicate by semantic similarity.
-        Sort events chronologically by position_hint, preserving chunk order
-            within each tier (early → mid → late).
+            the most recently named character owns the pronoun).
+        Union world-building/setting details; deduplicate by word overlap.
+        Order events by (chunk, position_hint, extraction order) — position_hint
+            is relative to its chunk — and drop near-duplicates produced by the
+            overlap between adjacent chunks.
 
     Pass 3 — Synthesis
         One final LLM call receives the merged extraction (characters, events, world)
@@ -40,38 +49,409 @@ High-level pipeline:
     Pass 4 — Beat mapping (handled inside synthesis prompt)
         N beats are distributed proportionally across the ordered event list.
         Early events → early beats; late events → late beats.
-        The synthesis prompt receives the event list in order and is instructed
-        to map them to the requested beat count.
 
-Configuration env vars to add when implementing:
-    STORY_IMPORTER_CHUNK_WORDS     — target words per chunk (default: 1500)
-    STORY_IMPORTER_CHUNK_OVERLAP   — overlap between adjacent chunks in words (default: 200)
-    STORY_IMPORTER_PARALLEL_CHUNKS — "true" to extract chunks concurrently (default: false)
+Configuration env vars (see importers/base.py):
+    STORY_IMPORTER_CHUNK_WORDS        — target words per chunk (default: 1500)
+    STORY_IMPORTER_CHUNK_OVERLAP      — overlap between adjacent chunks in words (default: 200)
+    STORY_IMPORTER_PARALLEL_CHUNKS    — "true" to extract chunks concurrently (default: false)
+    STORY_IMPORTER_CHUNK_CONCURRENCY  — max in-flight chunk calls when parallel (default: 4)
+    STORY_IMPORTER_CACHE_DIR          — chunk extraction cache (default: .cache/story_importer)
 
-Known edge cases to handle:
+Known edge cases:
     - A character introduced late in the story may appear as a pronoun only in
-      earlier chunks if the author uses a flashback structure.
-    - Very short chunks (< 500 words) may not give the LLM enough context for
-      meaningful extraction — enforce a minimum chunk size.
-    - Synthesis LLM call may be large if many chunks produced many events; may
-      need its own context-size guard.
+      earlier chunks if the author uses a flashback structure. Pronoun sightings
+      before any named character are dropped rather than guessed.
+    - Very short chunks (< 500 words) do not give the LLM enough context for
+      meaningful extraction — a short tail is folded into the previous chunk.
+    - The synthesis digest is capped at STORY_IMPORTER_MAX_WORDS; events are
+      sampled evenly across the story when it would overflow.
 """
 
 from __future__ import annotations
 
-from my_code.importers.base import StoryAnalyser, MAX_WORDS
+import hashlib
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from my_code.importers.base import (
+    StoryAnalyser, call_llm,
+    MODEL, MAX_WORDS, CHUNK_WORDS, CHUNK_OVERLAP,
+    PARALLEL_CHUNKS, CHUNK_CONCURRENCY, CACHE_DIR,
+)
+from my_code.importers.single_pass import _SYSTEM, _SCHEMA, _imagination_clause
+
+logger = logging.getLogger(__name__)
+
+_MIN_CHUNK_WORDS = 500
+# Bump when _EXTRACT_SYSTEM / _EXTRACT_USER change so stale cache entries are ignored.
+_EXTRACT_PROMPT_VERSION = "1"
+
+_POSITION_RANK = {"early": 0, "mid": 1, "late": 2}
+_PRONOUNS = {
+    "he", "him", "his", "she", "her", "hers", "they", "them", "their",
+    "i", "me", "my", "you", "your", "it", "unnamed", "unknown", "someone",
+}
+_TITLE_WORDS = {"the", "a", "an", "of", "lord", "lady", "sir", "brother", "sister", "captain", "mr", "mrs", "ms", "dr"}
+_ROLES = ("player-character", "npc", "antagonist", "neutral")
+_AMBIGUOUS = "\0ambiguous"   # resolve(): a partial name that matches several characters
+
+
+# ── Prompts ────────────────────────────────────────────────────────────────────
+
+_EXTRACT_SYSTEM = """\
+You are a story structure analyst reading ONE excerpt of a longer story.
+Extract only what is explicitly present in this excerpt — do not invent, do not
+summarise events outside it.
+
+- characters_sighted : every character who appears or is named; use the full name as written,
+                       or the pronoun/descriptor ("she", "the old man") if unnamed in this excerpt;
+                       role_hint is one of player-character|npc|antagonist|neutral;
+                       description_fragment is any appearance/personality/backstory detail given here
+- events             : what happens, in order; summary is one sentence; position_hint is where in
+                       THIS excerpt the event occurs (early|mid|late)
+- settings           : places the excerpt is set in, with time and atmosphere as described
+- style_notes        : one or two sentences on the prose style (rhythm, tense, POV, dialogue format)
+
+Return ONLY valid JSON. No markdown fences. No explanation outside the JSON."""
+
+_EXTRACT_USER = """\
+EXCERPT {index} OF {total}:
+{chunk_text}
+
+Return this JSON:
+{{
+  "characters_sighted": [{{"name": "...", "role_hint": "...", "description_fragment": "..."}}],
+  "events": [{{"summary": "...", "characters_involved": ["..."], "position_hint": "early|mid|late"}}],
+  "settings": [{{"location": "...", "time": "...", "atmosphere_fragment": "..."}}],
+  "style_notes": "..."
+}}"""
+
+_SYNTH_ADDENDUM = """
+
+SYNTHESIS MODE
+You are not given the story itself but a merged extraction from all of its excerpts:
+the characters, settings, style notes, and the ordered list of story events.
+Treat it as the source story. Distribute the events proportionally across the
+{beat_count} beats — early events map to early beats, late events to late beats."""
+
+_SYNTH_USER = """\
+MERGED STORY EXTRACTION ({chunk_count} excerpts, {word_count:,} source words):
+{digest}
+
+""" + _SCHEMA
+
+
+# ── Pass 1: chunking + extraction ──────────────────────────────────────────────
+
+def split_chunks(
+    story_text: str, chunk_words: int = CHUNK_WORDS, overlap: int = CHUNK_OVERLAP
+) -> list[str]:
+    """Split prose into overlapping word-window chunks, preserving original formatting.
+
+    A trailing chunk shorter than _MIN_CHUNK_WORDS is merged into its predecessor.
+    """
+    spans = [m.span() for m in re.finditer(r"\S+", story_text)]
+    if not spans:
+        return []
+    size = max(chunk_words, _MIN_CHUNK_WORDS)
+    step = max(1, size - max(0, min(overlap, size - 1)))
+
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    while True:
+        end = min(start + size, len(spans))
+        bounds.append((start, end))
+        if end >= len(spans):
+            break
+        start += step
+    if len(bounds) > 1 and bounds[-1][1] - bounds[-1][0] < _MIN_CHUNK_WORDS:
+        last_end = bounds.pop()[1]
+        bounds[-1] = (bounds[-1][0], last_end)
+
+    return [story_text[spans[s][0]:spans[e - 1][1]] for s, e in bounds]
+
+
+def _cache_path(chunk_text: str) -> Path:
+    key = hashlib.sha256(
+        f"{MODEL}\0{_EXTRACT_PROMPT_VERSION}\0{chunk_text}".encode("utf-8")
+    ).hexdigest()
+    return Path(CACHE_DIR) / "chunks" / f"{key}.json"
+
+
+def _extract_chunk(chunk_text: str, index: int, total: int) -> dict:
+    """Run (or load from cache) the extraction call for one chunk."""
+    path = _cache_path(chunk_text)
+    if path.exists():
+        try:
+            logger.debug("Chunk %d/%d: cache hit %s", index, total, path.name)
+            return json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            logger.warning("Chunk %d/%d: corrupt cache entry, re-extracting", index, total)
+
+    raw = call_llm([
+        {"role": "system", "content": _EXTRACT_SYSTEM},
+        {"role": "user",   "content": _EXTRACT_USER.format(
+            index=index, total=total, chunk_text=chunk_text,
+        )},
+    ], temperature=0.2)
+    data = json.loads(raw)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(path)
+    logger.debug("Chunk %d/%d: extracted and cached", index, total)
+    return data
+
+
+def extract_chunks(chunks: list[str]) -> list[dict]:
+    """Map stage: extract every chunk, in parallel when PARALLEL_CHUNKS is set.
+
+    Results are returned in chunk order regardless of completion order.
+    """
+    total = len(chunks)
+    if not PARALLEL_CHUNKS or total == 1:
+        return [_extract_chunk(c, i, total) for i, c in enumerate(chunks, 1)]
+    with ThreadPoolExecutor(max_workers=min(CHUNK_CONCURRENCY, total)) as pool:
+        return list(pool.map(
+            _extract_chunk, chunks, range(1, total + 1), [total] * total,
+        ))
+
+
+# ── Pass 2: merge ──────────────────────────────────────────────────────────────
+
+def _norm(text: str) -> str:
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s'-]", " ", str(text or "").lower())).strip()
+
+
+def _name_tokens(name: str) -> frozenset[str]:
+    return frozenset(t for t in _norm(name).split() if t not in _TITLE_WORDS)
+
+
+def _jaccard(a: str, b: str) -> float:
+    sa, sb = set(_norm(a).split()), set(_norm(b).split())
+    if not sa or not sb:
+        return 0.0
+    return len(sa & sb) / len(sa | sb)
+
+
+def _append_unique(items: list[str], text: str) -> None:
+    text = str(text or "").strip()
+    if text and all(_jaccard(text, existing) < 0.8 for existing in items):
+        items.append(text)
+
+
+def _is_pronoun(name: str) -> bool:
+    n = _norm(name)
+    return not n or n in _PRONOUNS or not _name_tokens(name)
+
+
+def merge_extractions(extractions: list[dict]) -> dict:
+    """Deterministically merge per-chunk extractions into one story digest.
+
+    Same input always yields the same output: iteration follows chunk order and
+    extraction order, ties resolve to first appearance.
+
+    A partial name ("Lyra", "Mr. Voss") joins a fuller one ("Lyra Voss") only
+    when exactly one known character matches it; with two Vosses it stays
+    unattributed. A pronoun, in a sighting or an event, belongs to the most
+    recently named character at that point — for events, as of the end of
+    their chunk.
+    """
+    chars: dict[str, dict] = {}       # canonical key → merged record
+    alias: dict[str, str] = {}        # normalised spelling → canonical key (full names only)
+    settings: list[dict] = []
+    events: list[tuple[int, int, int, dict]] = []
+    style: list[str] = []
+    last_named: str | None = None
+    named_by_chunk: list[str | None] = []   # last_named at the end of each chunk
+
+    def resolve(name: str) -> str | None:
+        """Map a sighted name to a canonical character key, None if new, _AMBIGUOUS if unclear."""
+        toks = _name_tokens(name)
+        key = alias.get(_norm(name))
+        if key is not None and chars[key]["tokens"] == toks:
+            return key
+        # Alias heuristic: one name's tokens are a subset of the other's
+        # ("Lyra" / "Lyra Voss"); only a unique match counts. Partial names are
+        # matched again every time, as a second Voss may have turned up since.
+        matches = [
+            key for key, rec in chars.items()
+            if toks and (toks <= rec["tokens"] or rec["tokens"] <= toks)
+        ]
+        if len(matches) > 1:
+            return _AMBIGUOUS
+        return matches[0] if matches else None
 
+    for ci, ext in enumerate(extractions):
+        if not isinstance(ext, dict):
+            named_by_chunk.append(last_named)
+            continue
+        for sighting in ext.get("characters_sighted") or []:
+            if not isinstance(sighting, dict):
+                continue
+            name = str(sighting.get("name", "")).strip()
+            if _is_pronoun(name):
+                key = last_named
+            else:
+                key = resolve(name)
+                if key is _AMBIGUOUS:
+                    last_named = None       # a later pronoun could be either of them
+                    continue
+                if key is None:
+                    key = _norm(name)
+                    chars[key] = {
+                        "name": name, "tokens": _name_tokens(name), "aliases": [],
+                        "roles": {}, "fragments": [], "first_chunk": ci, "mentions": 0,
+                    }
+                rec = chars[key]
+                # Prefer the longest (most specific) spelling as display name
+                if len(_name_tokens(name)) > len(rec["tokens"]):
+                    rec["aliases"].append(rec["name"])
+                    rec["name"], rec["tokens"] = name, _name_tokens(name)
+                elif _norm(name) != _norm(rec["name"]) and name not in rec["aliases"]:
+                    rec["aliases"].append(name)
+                alias[_norm(name)] = key
+                last_named = key
+            if key is None:
+                continue
+            rec = chars[key]
+            rec["mentions"] += 1
+            role = str(sighting.get("role_hint", "")).strip().lower()
+            if role in _ROLES:
+                rec["roles"][role] = rec["roles"].get(role, 0) + 1
+            _append_unique(rec["fragments"], sighting.get("description_fragment", ""))
+
+        for si in ext.get("settings") or []:
+            if not isinstance(si, dict) or not str(si.get("location", "")).strip():
+                continue
+            match = next(
+                (s for s in settings if _jaccard(s["location"], si["location"]) >= 0.6), None
+            )
+            if match is None:
+                match = {"location": str(si["location"]).strip(), "time": [], "atmosphere": []}
+                settings.append(match)
+            _append_unique(match["time"], si.get("time", ""))
+            _append_unique(match["atmosphere"], si.get("atmosphere_fragment", ""))
+
+        for ei, ev in enumerate(ext.get("events") or []):
+            if not isinstance(ev, dict) or not str(ev.get("summary", "")).strip():
+                continue
+            rank = _POSITION_RANK.get(str(ev.get("position_hint", "")).lower(), 1)
+            events.append((ci, rank, ei, ev))
+
+        _append_unique(style, ext.get("style_notes", ""))
+        named_by_chunk.append(last_named)
+
+    # Resolve event participants to canonical names (pronouns → most recently
+    # named character as of the end of the event's chunk, as for sightings).
+    events.sort(key=lambda e: e[:3])
+    merged_events: list[dict] = []
+    for ci, _rank, _ei, ev in events:
+        summary = str(ev["summary"]).strip()
+        # Overlap between adjacent chunks yields near-duplicate events
+        if any(
+            prev["chunk"] >= ci - 1 and _jaccard(prev["summary"], summary) >= 0.7
+            for prev in merged_events[-8:]
+        ):
+            continue
+        involved: list[str] = []
+        for who in ev.get("characters_involved") or []:
+            key = named_by_chunk[ci] if _is_pronoun(str(who)) else resolve(str(who))
+            name = chars[key]["name"] if key and key is not _AMBIGUOUS else str(who).strip()
+            if name and name not in involved:
+                involved.append(name)
+        merged_events.append({"chunk": ci, "summary": summary, "characters": involved})
+
+    characters = []
+    for rec in chars.values():
+        role = max(rec["roles"], key=lambda r: (rec["roles"][r], -_ROLES.index(r)), default="neutral")
+        characters.append({
+            "name": rec["name"],
+            "aliases": rec["aliases"],
+            "role_hint": role,
+            "mentions": rec["mentions"],
+            "description": " ".join(rec["fragments"]),
+        })
+
+    return {
+        "characters": characters,
+        "settings": [
+            {"location": s["location"], "time": "; ".join(s["time"]), "atmosphere": " ".join(s["atmosphere"])}
+            for s in settings
+        ],
+        "events": merged_events,
+        "style_notes": style[:6],
+    }
+
+
+# ── Pass 3: synthesis ──────────────────────────────────────────────────────────
+
+def _render_digest(merged: dict, max_words: int = MAX_WORDS) -> str:
+    """Render the merged extraction as plain text, sampling events to fit max_words."""
+    head: list[str] = ["CHARACTERS:"]
+    for c in merged["characters"]:
+        aka = f" (also: {', '.join(c['aliases'])})" if c["aliases"] else ""
+        head.append(f"- {c['name']}{aka} [{c['role_hint']}, {c['mentions']} mentions]: {c['description']}")
+    head.append("\nSETTINGS:")
+    for s in merged["settings"]:
+        head.append(f"- {s['location']} — {s['time']} — {s['atmosphere']}")
+    head.append("\nSTYLE NOTES:")
+    head.extend(f"- {n}" for n in merged["style_notes"])
+    head.append("\nEVENTS (in story order):")
+
+    lines = [
+        f"{e['summary']}" + (f" [{', '.join(e['characters'])}]" if e["characters"] else "")
+        for e in merged["events"]
+    ]
+    budget = max_words - len(" ".join(head).split())
+    total = sum(len(l.split()) for l in lines)
+    if total > budget and lines:
+        # Keep an evenly spaced subset so the beginning, middle and end stay represented
+        keep = max(1, int(len(lines) * budget / total))
+        idx = sorted({round(i * (len(lines) - 1) / max(1, keep - 1)) for i in range(keep)})
+        logger.info("Synthesis digest over budget: sampling %d/%d events", len(idx), len(lines))
+        lines = [lines[i] for i in idx]
+
+    return "\n".join(head + [f"{i}. {l}" for i, l in enumerate(lines, 1)])
+
+
+# ── Analyser ───────────────────────────────────────────────────────────────────
 
 class ChunkedAnalyser(StoryAnalyser):
     """Multi-pass story analyser for prose longer than STORY_IMPORTER_MAX_WORDS.
 
-    NOT YET IMPLEMENTED — see module docstring for the full design spec.
+    Chunk extraction (cached, optionally parallel) → deterministic merge →
+    one synthesis call producing the same schema as SinglePassAnalyser.
+    See the module docstring for the full design.
     """
 
     def analyse(self, story_text: str, imagination: int, beat_count: int) -> dict:
-        wc = len(story_text.split())
-        raise NotImplementedError(
-            f"Story is {wc:,} words — long-story mode is not yet implemented.\n"
-            f"  Single-pass limit: {MAX_WORDS:,} words (STORY_IMPORTER_MAX_WORDS).\n"
-            f"  Tip: trim the input to a single chapter or scene and re-run."
+        chunks = split_chunks(story_text)
+        logger.info(
+            "Chunked import: %d chunks (parallel=%s, concurrency=%d)",
+            len(chunks), PARALLEL_CHUNKS, CHUNK_CONCURRENCY,
+        )
+        merged = merge_extractions(extract_chunks(chunks))
+        logger.info(
+            "Merged extraction: %d characters, %d settings, %d events",
+            len(merged["characters"]), len(merged["settings"]), len(merged["events"]),
+        )
+
+        system = _SYSTEM.format(
+            imagination_clause=_imagination_clause(imagination),
+            beat_count=beat_count,
+        ) + _SYNTH_ADDENDUM.format(beat_count=beat_count)
+        user = _SYNTH_USER.format(
+            chunk_count=len(chunks),
+            word_count=len(story_text.split()),
+            digest=_render_digest(merged),
         )
+        raw = call_llm([
+            {"role": "system", "content": system},
+            {"role": "user",   "content": user},
+        ])
+        return json.loads(raw)
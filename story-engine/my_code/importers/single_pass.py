@@ -101,10 +101,9 @@ Field rules:
 
 Return ONLY valid JSON. No markdown fences. No explanation outside the JSON."""
 
-_USER = """\
-SOURCE STORY:
-{story_text}
-
+# Output schema shared with ChunkedAnalyser's synthesis pass (braces pre-escaped
+# for str.format).
+_SCHEMA = """\
 Return this JSON (all fields required):
 {{
   "title": "...",
@@ -141,6 +140,12 @@ Return this JSON (all fields required):
   "writing_instructions": "..."
 }}"""
 
+_USER = """\
+SOURCE STORY:
+{story_text}
+
+""" + _SCHEMA
+
 
 # ── Analyser ───────────────────────────────────────────────────────────────────
 
@@ -152,7 +157,7 @@ class SinglePassAnalyser(StoryAnalyser):
     extraction and free invention for missing details.
 
     Suitable for stories up to STORY_IMPORTER_MAX_WORDS (default: 6,000 words).
-    For longer stories, use ChunkedAnalyser (not yet implemented).
+    For longer stories, get_analyser() routes to ChunkedAnalyser.
     """
 
     def analyse(self, story_text: str, imagination: int, beat_count: int) -> dict:
@@ -81,6 +81,7 @@ class NarratorContext:
     beat_total: int
     author_note: str | None = None
     prior_story_summary: str | None = None
+    recalled_beats: str | None = None  # earlier beats the narrator's own history no longer holds
     redirect_instruction: str | None = None
 
 
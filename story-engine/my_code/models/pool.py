@@ -0,0 +1,173 @@
+"""Model and agent pooling — reuse HTTP clients and Strands agents across calls.
+
+Why: `Agent.__call__` runs every invocation in a fresh thread with a fresh
+asyncio loop, and OpenAIModel built from client_args opens (and closes) a new
+AsyncOpenAI client per request. Recreating agents per beat/paragraph on top of
+that meant repeated client construction and TCP/TLS setup on every LLM call.
+
+How:
+    - One persistent event loop runs on a daemon thread. All pooled agents are
+      invoked on it via invoke(), so a single AsyncOpenAI client per role (and
+      its keep-alive connection pool) can be shared safely.
+    - get_pooled_model(role) returns one model per role, built once.
+    - invoke() swaps in a fresh EventLoopMetrics before each call. Strands
+      appends traces / cycle durations / invocation records to that object for
+      the agent's whole lifetime — the leak that used to force agent re-creation
+      (plus gc.collect()) every beat. result.metrics is now per-call usage.
+    - stateless=True also clears agent.messages, which NullConversationManager
+      never trims, so a reused stateless agent behaves like a fresh one.
+    - AgentPool leases agents to concurrent callers (one agent per in-flight
+      call; Strands agents reject concurrent invocation).
+
+IMPORTANT: an agent built on a pooled model must be called through invoke(),
+never agent(prompt) — the shared client is bound to the pool's loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Hashable, Iterator
+
+from strands.telemetry.metrics import EventLoopMetrics
+
+from my_code.models.provider import get_model, openai_compat_config
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Persistent event loop
+# ---------------------------------------------------------------------------
+
+class _LoopThread:
+    """A daemon thread running one asyncio loop for all pooled agent calls."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="story-engine-llm-loop", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_loop_lock = threading.Lock()
+_loop_thread: _LoopThread | None = None
+
+
+def _get_loop() -> _LoopThread:
+    global _loop_thread
+    with _loop_lock:
+        if _loop_thread is None:
+            _loop_thread = _LoopThread()
+        return _loop_thread
+
+
+# ---------------------------------------------------------------------------
+# Models
+# ---------------------------------------------------------------------------
+
+_models: dict[str, object] = {}
+_models_lock = threading.Lock()
+
+
+def get_pooled_model(role: str):
+    """Return the shared Strands model for a role, building it on first use.
+
+    OpenAI-compatible roles get one AsyncOpenAI client (keep-alive connection
+    pool) injected via OpenAIModel(client=...). Other providers reuse a single
+    get_model() instance.
+    """
+    with _models_lock:
+        model = _models.get(role)
+        if model is None:
+            compat = openai_compat_config(role)
+            if compat is None:
+                model = get_model(role)
+            else:
+                import openai
+                from strands.models.openai import OpenAIModel
+
+                client = openai.AsyncOpenAI(base_url=compat["base_url"], api_key=compat["api_key"])
+                model = OpenAIModel(client=client, model_id=compat["model_id"])
+            _models[role] = model
+            logger.debug("Pooled model built for role=%s", role)
+        return model
+
+
+# ---------------------------------------------------------------------------
+# Invocation
+# ---------------------------------------------------------------------------
+
+_llm_seconds = 0.0
+_llm_lock = threading.Lock()
+
+
+def llm_seconds() -> float:
+    """Total wall time spent inside invoke() so far (for overhead accounting)."""
+    return _llm_seconds
+
+
+def reset_agent(agent, stateless: bool = False) -> None:
+    """Reset per-call state in place instead of rebuilding the agent."""
+    agent.event_loop_metrics = EventLoopMetrics()
+    if stateless:
+        agent.messages.clear()
+
+
+def invoke(agent, prompt, stateless: bool = False):
+    """Invoke an agent on the shared loop and return its AgentResult.
+
+    Args:
+        agent: A Strands Agent (normally built on get_pooled_model()).
+        prompt: Anything Agent.invoke_async accepts.
+        stateless: Clear the conversation before the call (NullConversationManager agents).
+    """
+    global _llm_seconds
+    reset_agent(agent, stateless=stateless)
+    start = time.perf_counter()
+    try:
+        return _get_loop().run(agent.invoke_async(prompt))
+    finally:
+        elapsed = time.perf_counter() - start
+        with _llm_lock:
+            _llm_seconds += elapsed
+
+
+# ---------------------------------------------------------------------------
+# Agent pool
+# ---------------------------------------------------------------------------
+
+class AgentPool:
+    """Keyed free-lists of idle agents for concurrent callers.
+
+    Keys identify an agent configuration (e.g. role plus language pair); agents
+    under one key are interchangeable once reset.
+    """
+
+    def __init__(self) -> None:
+        self._idle: dict[Hashable, list] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lease(self, key: Hashable, factory: Callable[[], object]) -> Iterator:
+        """Borrow an idle agent for `key`, creating one with `factory` if none is free."""
+        with self._lock:
+            agent = self._idle[key].pop() if self._idle[key] else None
+        if agent is None:
+            agent = factory()
+        try:
+            yield agent
+        finally:
+            with self._lock:
+                self._idle[key].append(agent)
+
+
+agent_pool = AgentPool()
@@ -20,14 +20,11 @@ def system_prompt_suffix(prompt: str) -> str:
     return f"{prompt}\n{suffix}" if suffix else prompt
 
 
-def get_model(role: str):
-    """Return a Strands model instance for the given agent role.
+def openai_compat_config(role: str) -> dict | None:
+    """Resolve base_url / model_id / api_key for an OpenAI-compatible role.
 
-    Args:
-        role: One of "narrator", "evaluator", "summariser", "orchestrator", "lore_injector".
-
-    Returns:
-        A Strands Model instance ready to pass to Agent(model=...).
+    Returns None when the role is served by a non-OpenAI provider (anthropic,
+    bedrock). Shared by get_model() and models.pool.get_pooled_model().
     """
     provider = os.environ.get("STORY_ENGINE_PROVIDER", "local")
     role_key = role.upper()
@@ -37,31 +34,49 @@ def get_model(role: str):
     # evaluator/summariser by setting STORY_ENGINE_EVALUATOR_BASE_URL etc.
     role_base_url = os.environ.get(f"STORY_ENGINE_{role_key}_BASE_URL")
     if role_base_url:
-        return _build_openai_compat(
-            base_url=role_base_url,
-            model_id=os.environ.get(f"STORY_ENGINE_{role_key}_MODEL", _DEFAULT_LOCAL_MODEL),
-            api_key="not-needed",
-        )
+        return {
+            "base_url": role_base_url,
+            "model_id": os.environ.get(f"STORY_ENGINE_{role_key}_MODEL", _DEFAULT_LOCAL_MODEL),
+            "api_key": "not-needed",
+        }
 
     if provider == "local":
-        base_url = os.environ.get(
-            "STORY_ENGINE_LOCAL_BASE_URL", "http://localhost:1234/v1"
-        )
-        return _build_openai_compat(
-            base_url=base_url,
-            model_id=os.environ.get(f"STORY_ENGINE_{role_key}_MODEL", _DEFAULT_LOCAL_MODEL),
-            api_key="not-needed",
-        )
+        return {
+            "base_url": os.environ.get("STORY_ENGINE_LOCAL_BASE_URL", "http://localhost:1234/v1"),
+            "model_id": os.environ.get(f"STORY_ENGINE_{role_key}_MODEL", _DEFAULT_LOCAL_MODEL),
+            "api_key": "not-needed",
+        }
 
-    elif provider == "openrouter":
-        return _build_openai_compat(
-            base_url="https://openrouter.ai/api/v1",
-            model_id=os.environ.get(f"STORY_ENGINE_{role_key}_MODEL", "deepseek/deepseek-v3.2"),
-            api_key=os.environ["OPENROUTER_API_KEY"],
-        )
+    if provider == "openrouter":
+        return {
+            "base_url": "https://openrouter.ai/api/v1",
+            "model_id": os.environ.get(f"STORY_ENGINE_{role_key}_MODEL", "deepseek/deepseek-v3.2"),
+            "api_key": os.environ["OPENROUTER_API_KEY"],
+        }
+
+    return None
+
+
+def get_model(role: str):
+    """Return a Strands model instance for the given agent role.
+
+    Each OpenAI-compatible model built here opens a new HTTP client per request.
+    Agents that are invoked repeatedly should use models.pool.get_pooled_model()
+    instead, which shares one keep-alive client per role.
+
+    Args:
+        role: One of "narrator", "evaluator", "summariser", "orchestrator", "lore_injector".
+
+    Returns:
+        A Strands Model instance ready to pass to Agent(model=...).
+    """
+    provider = os.environ.get("STORY_ENGINE_PROVIDER", "local")
 
+    compat = openai_compat_config(role)
+    if compat is not None:
+        return _build_openai_compat(**compat)
 
-    elif provider == "anthropic":
+    if provider == "anthropic":
         from strands.models import AnthropicModel
 
         model_id = os.environ.get(f"STORY_ENGINE_{role.upper()}_MODEL", "claude-sonnet-4-20250514")
@@ -2,6 +2,7 @@
 
 Splits on [section-name] markers, parses each section into its typed structure.
 See SCHEMA.md for the full input format specification.
+Tokenizing (and its path + mtime cache) lives in my_code/scene_format.py.
 """
 
 from __future__ import annotations
@@ -9,6 +10,7 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from my_code import scene_format
 from my_code.models.data_models import (
     AuthorNote,
     Beat,
@@ -28,74 +30,18 @@ class ParseError(Exception):
 
 
 # ---------------------------------------------------------------------------
-# Section splitter
+# Tokenizer — shared single-pass splitter + parse cache (my_code/scene_format.py)
 # ---------------------------------------------------------------------------
 
-_SECTION_RE = re.compile(r"^\[([a-z][a-z0-9_-]*)\]\s*$", re.MULTILINE)
-
-
-def _split_sections(text: str) -> dict[str, str]:
-    """Split raw file text into {section_name: content} pairs."""
-    matches = list(_SECTION_RE.finditer(text))
-    if not matches:
+def _load_sections(file_path: str) -> scene_format.SceneTokens:
+    """Tokenize a scene file (cached by path + mtime) — see scene_format.load()."""
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Scene file not found: {file_path}")
+    tokens = scene_format.load(path)
+    if not tokens.sections:
         raise ParseError("file", "No [section] markers found")
-
-    sections: dict[str, str] = {}
-    for i, m in enumerate(matches):
-        name = m.group(1)
-        start = m.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        sections[name] = text[start:end].strip()
-    return sections
-
-
-# ---------------------------------------------------------------------------
-# Key-value parser (for meta, scene-setup, character cards, author-note)
-# ---------------------------------------------------------------------------
-
-def _parse_kv(text: str) -> dict[str, str]:
-    """Parse a block of key: value lines, handling multi-line continuation.
-
-    Multi-line values use either YAML-style `>` folding or simple indentation.
-    """
-    result: dict[str, str] = {}
-    current_key: str | None = None
-    current_lines: list[str] = []
-
-    for line in text.splitlines():
-        # New key: value line
-        kv_match = re.match(r"^([a-z_]+)\s*:\s*(.*)", line)
-        if kv_match:
-            # Save previous key
-            if current_key is not None:
-                result[current_key] = _join_lines(current_lines)
-            current_key = kv_match.group(1)
-            value = kv_match.group(2).strip()
-            # Strip YAML fold marker
-            if value == ">":
-                current_lines = []
-            else:
-                current_lines = [value]
-        elif current_key is not None and line.strip():
-            # Continuation line
-            current_lines.append(line.strip())
-        elif current_key is not None and not line.strip():
-            # Blank line inside multi-line — keep as paragraph break
-            if current_lines and current_lines[-1] != "":
-                current_lines.append("")
-
-    if current_key is not None:
-        result[current_key] = _join_lines(current_lines)
-
-    return result
-
-
-def _join_lines(lines: list[str]) -> str:
-    """Join continuation lines, collapsing whitespace but preserving paragraph breaks."""
-    # Remove trailing empty lines
-    while lines and lines[-1] == "":
-        lines.pop()
-    return " ".join(l for l in lines if l).strip()
+    return tokens
 
 
 # ---------------------------------------------------------------------------
@@ -154,22 +100,14 @@ def _parse_scene_setup(kv: dict[str, str]) -> SceneSetup:
     )
 
 
-_BEAT_RE = re.compile(r"^(\d+)\.\s+", re.MULTILINE)
-
-
 def _parse_beats(text: str) -> list[Beat]:
     """Parse numbered beat list, detecting inline [pause] markers."""
-    matches = list(_BEAT_RE.finditer(text))
-    if not matches:
+    items = scene_format.split_numbered(text)
+    if not items:
         raise ParseError("scene-beats", "No numbered beats found")
 
     beats: list[Beat] = []
-    for i, m in enumerate(matches):
-        index = int(m.group(1))
-        start = m.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        raw = text[start:end].strip()
-
+    for index, raw in items:
         has_pause = "[pause]" in raw
         # Remove the [pause] marker from the beat text
         beat_text = raw.replace("[pause]", "").strip()
@@ -187,10 +125,7 @@ def _parse_beats(text: str) -> list[Beat]:
 
 def get_raw_sections(file_path: str) -> dict[str, str]:
     """Return the raw {section_name: content} dict for a scene file without full parsing."""
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Scene file not found: {file_path}")
-    return _split_sections(path.read_text(encoding="utf-8"))
+    return dict(_load_sections(file_path).sections)
 
 
 def parse_scene_file(file_path: str) -> ParsedScene:
@@ -206,25 +141,8 @@ def parse_scene_file(file_path: str) -> ParsedScene:
         ParseError: On missing required sections or malformed content.
         FileNotFoundError: If the file does not exist.
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Scene file not found: {file_path}")
-
-    raw = path.read_text(encoding="utf-8")
-
-    # Strip comment lines (# ...)
-    lines = []
-    for line in raw.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("#") and not stripped.startswith("#="):
-            # Keep section-internal # comments only if inside a section
-            # But top-level # comments are stripped
-            pass
-        else:
-            lines.append(line)
-    # Re-join — but we actually want to keep comments inside sections too
-    # Simpler: just split on section markers from the raw text
-    sections = _split_sections(raw)
+    tokens = _load_sections(file_path)
+    sections = tokens.sections
 
     # --- Required sections ---
     required_sections = ("meta", "narrator-prompt", "writing-style", "world-info", "scenario", "scene-beats")
@@ -233,7 +151,7 @@ def parse_scene_file(file_path: str) -> ParsedScene:
             raise ParseError(name, "Required section missing")
 
     # --- Parse each section ---
-    meta = _parse_meta(_parse_kv(sections["meta"]))
+    meta = _parse_meta(tokens.kv("meta"))
 
     narrator_prompt = sections["narrator-prompt"]
     writing_style = sections["writing-style"]
@@ -243,23 +161,20 @@ def parse_scene_file(file_path: str) -> ParsedScene:
     # Author note (optional)
     author_note = None
     if "author-note" in sections:
-        author_note = _parse_author_note(_parse_kv(sections["author-note"]))
+        author_note = _parse_author_note(tokens.kv("author-note"))
 
     # Characters — collect all [character-N] sections
     characters: list[CharacterCard] = []
-    char_sections = sorted(
-        [(name, content) for name, content in sections.items() if name.startswith("character-")],
-        key=lambda x: int(x[0].split("-")[1]),
-    )
+    char_sections = tokens.numbered("character")
     if not char_sections:
         raise ParseError("character-*", "At least one character card is required")
-    for name, content in char_sections:
-        characters.append(_parse_character(name, _parse_kv(content)))
+    for name, _content in char_sections:
+        characters.append(_parse_character(name, tokens.kv(name)))
 
     # Scene setup
     scene_setup = SceneSetup()
     if "scene-setup" in sections:
-        scene_setup = _parse_scene_setup(_parse_kv(sections["scene-setup"]))
+        scene_setup = _parse_scene_setup(tokens.kv("scene-setup"))
 
     # Beats
     beats = _parse_beats(sections["scene-beats"])
@@ -24,16 +24,32 @@ Usage:
   # Commit the best prompt back to single_pass.py after a run:
   python -m my_code.roundtrip_test examples/ashenveil_scene1.md \\
       --prose output/ashenveil_scene1.md --skip-generate --auto --iters 6 --commit
+
+  # Population search: 6 prompt variants per generation, imported concurrently
+  # (the first generation is the seed plus 5 rewrites of it); the top 2 survive
+  # and are mutated by the optimizer (--iters = generations):
+  python -m my_code.roundtrip_test examples/ashenveil_scene1.md \\
+      --prose output/ashenveil_scene1.md --skip-generate --population 6 --iters 4
+
+In population mode import results are cached in output/roundtrip_work/import_cache/,
+keyed by (prompt, prose, imagination, beat_count, model), so re-scoring a prompt
+that was already imported costs nothing. Results that needed the compact fallback
+prompt are not cached. Pass --no-cache to force fresh imports.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 try:
@@ -42,7 +58,8 @@ try:
 except ImportError:
     pass
 
-from my_code.parser import _split_sections, _parse_kv, _parse_beats
+from my_code import scene_format
+from my_code.parser import _parse_beats
 from my_code.importers.base import call_llm, BASE_URL, MODEL, word_count
 from my_code.importers.single_pass import _imagination_clause, _USER
 import my_code.importers.single_pass as _sp_module
@@ -97,7 +114,9 @@ _QUANTITY_WEIGHT  = 0.6
 _SEMANTIC_WEIGHT  = 0.4
 _SATISFACTION     = 0.82
 _DEFAULT_ITERS    = 5
+_DEFAULT_SURVIVORS = 2
 _WORK_DIR         = Path("output/roundtrip_work")
+_IMPORT_CACHE_DIR = _WORK_DIR / "import_cache"
 
 
 # ── Semantic check helpers ─────────────────────────────────────────────────────
@@ -290,10 +309,10 @@ def _semantic_score(check_results: list[dict]) -> float:
 # ── Lenient scene parser ───────────────────────────────────────────────────────
 
 def parse_scene_lenient(path: Path) -> dict:
-    raw = path.read_text(encoding="utf-8")
-    try:
-        sections = _split_sections(raw)
-    except Exception:
+    # Cached by path + mtime: the loop re-reads the unchanged original every iteration.
+    tokens = scene_format.load(path)
+    sections = tokens.sections
+    if not sections:
         return {}
 
     result: dict = {}
@@ -301,17 +320,10 @@ def parse_scene_lenient(path: Path) -> dict:
                 "scenario", "writing-instructions"):
         result[key] = sections.get(key, "").strip()
 
-    result["meta"]        = _parse_kv(sections["meta"]) if "meta" in sections else {}
-    result["author_note"] = _parse_kv(sections["author-note"]) if "author-note" in sections else {}
-    result["scene_setup"] = _parse_kv(sections["scene-setup"]) if "scene-setup" in sections else {}
-
-    chars: list[dict] = []
-    for name, content in sorted(
-        [(n, c) for n, c in sections.items() if re.match(r"^character-\d+$", n)],
-        key=lambda x: int(x[0].split("-")[1]),
-    ):
-        chars.append(_parse_kv(content))
-    result["characters"] = chars
+    result["meta"]        = tokens.kv("meta")
+    result["author_note"] = tokens.kv("author-note")
+    result["scene_setup"] = tokens.kv("scene-setup")
+    result["characters"]  = [tokens.kv(name) for name, _ in tokens.numbered("character")]
 
     if "scene-beats" in sections:
         try:
@@ -671,8 +683,12 @@ Return this JSON with ALL fields populated:
 Return ONLY valid JSON. No markdown fences."""
 
 
-def run_import(prose: str, imagination: int, beat_count: int, system_prompt: str) -> dict:
-    """Call the importer LLM. Retries with compact prompt on JSON parse failure."""
+def run_import(prose: str, imagination: int, beat_count: int, system_prompt: str) -> tuple[dict, bool]:
+    """Call the importer LLM. Retries with compact prompt on JSON parse failure.
+
+    Returns (result, compact) — compact is True when the result came from the
+    _SYSTEM_COMPACT fallback rather than system_prompt.
+    """
 
     def _build_messages(sys: str) -> list[dict]:
         sys_rendered = sys.format(
@@ -694,7 +710,7 @@ def run_import(prose: str, imagination: int, beat_count: int, system_prompt: str
     raw = call_llm(_build_messages(system_prompt), temperature=0.5)
     raw = _clean(raw)
     try:
-        return json.loads(raw)
+        return json.loads(raw), False
     except json.JSONDecodeError:
         pass
 
@@ -702,7 +718,7 @@ def run_import(prose: str, imagination: int, beat_count: int, system_prompt: str
     repaired = _repair_json(raw)
     if repaired != raw:
         try:
-            return json.loads(repaired)
+            return json.loads(repaired), False
         except json.JSONDecodeError:
             pass
 
@@ -711,13 +727,57 @@ def run_import(prose: str, imagination: int, beat_count: int, system_prompt: str
     raw2 = call_llm(_build_messages(_SYSTEM_COMPACT), temperature=0)
     raw2 = _clean(raw2)
     try:
-        return json.loads(raw2)
+        return json.loads(raw2), True
     except json.JSONDecodeError:
         repaired2 = _repair_json(raw2)
-        return json.loads(repaired2)   # raise on final failure — caller handles it
+        return json.loads(repaired2), True   # raise on final failure — caller handles it
+
+
+def _import_cache_key(prose: str, imagination: int, beat_count: int, system_prompt: str) -> str:
+    h = hashlib.sha256()
+    for part in (MODEL, system_prompt, prose, str(imagination), str(beat_count)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def cached_import(prose: str, imagination: int, beat_count: int, system_prompt: str,
+                  use_cache: bool = True) -> tuple[dict, bool, bool]:
+    """run_import() with an on-disk result cache. Returns (result, was_cached, compact).
+
+    Only results produced by system_prompt itself are cached; a compact-fallback
+    result says nothing about system_prompt and is not stored under its key.
+    """
+    path = _IMPORT_CACHE_DIR / f"{_import_cache_key(prose, imagination, beat_count, system_prompt)}.json"
+    if use_cache and path.exists():
+        try:
+            return json.loads(path.read_text(encoding="utf-8")), True, False
+        except (OSError, json.JSONDecodeError):
+            pass   # unreadable entry — re-import and overwrite
+
+    result, compact = run_import(prose, imagination, beat_count, system_prompt)
+    if use_cache and not compact:
+        _IMPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+    return result, False, compact
 
 
-def result_to_scene(result: dict, stem: str, iteration: int) -> tuple[Path, dict]:
+def _generated_block(result: dict) -> dict:
+    return {
+        "narrator_prompt":      result.get("narrator_prompt", ""),
+        "writing_style":        result.get("writing_style", ""),
+        "author_note_content":  result.get("author_note_content", ""),
+        "world_info":           result.get("world_info", ""),
+        "scene_setup":          result.get("scene_setup", {}),
+        "characters":           result.get("characters", []),
+        "beats":                result.get("beats", []),
+        "writing_instructions": result.get("writing_instructions", ""),
+    }
+
+
+def result_to_scene(result: dict, stem: str, iteration: int | str) -> tuple[Path, dict]:
     _WORK_DIR.mkdir(parents=True, exist_ok=True)
     out_path = _WORK_DIR / f"{stem}_iter{iteration}.md"
 
@@ -731,18 +791,8 @@ def result_to_scene(result: dict, stem: str, iteration: int) -> tuple[Path, dict
         "scenario":      result.get("scenario", ""),
         "_loaded":       True,
     }
-    generated = {
-        "narrator_prompt":      result.get("narrator_prompt", ""),
-        "writing_style":        result.get("writing_style", ""),
-        "author_note_content":  result.get("author_note_content", ""),
-        "world_info":           result.get("world_info", ""),
-        "scene_setup":          result.get("scene_setup", {}),
-        "characters":           result.get("characters", []),
-        "beats":                result.get("beats", []),
-        "writing_instructions": result.get("writing_instructions", ""),
-    }
 
-    content = assemble(user_data, generated)
+    content = assemble(user_data, _generated_block(result))
     out_path.write_text(content, encoding="utf-8")
     return out_path, parse_scene_lenient(out_path)
 
@@ -809,7 +859,16 @@ def _failure_report(report: dict, orig: dict) -> str:
 
 
 def optimize_prompt(current_system: str, report: dict, orig: dict) -> str:
-    failures = _failure_report(report, orig)
+    return _rewrite_prompt(current_system, _failure_report(report, orig))
+
+
+def seed_variant(seed_system: str, focus: str) -> str:
+    """A rewrite of the seed prompt before any import has been scored, tightening `focus`."""
+    return _rewrite_prompt(seed_system, f"(no import scored yet — make the rules for {focus} "
+                                        "more specific and concrete)")
+
+
+def _rewrite_prompt(current_system: str, failures: str) -> str:
     user_content = (
         f"CURRENT SYSTEM PROMPT:\n{current_system}\n\n"
         f"FAILURE REPORT:\n{failures}\n\n"
@@ -823,6 +882,188 @@ def optimize_prompt(current_system: str, report: dict, orig: dict) -> str:
     return improved.strip()
 
 
+def _has_placeholders(prompt: str) -> bool:
+    return "{imagination_clause}" in prompt and "{beat_count}" in prompt
+
+
+# ── Population search ──────────────────────────────────────────────────────────
+# Instead of one candidate prompt per iteration, keep a population of K prompts.
+# The first generation is the seed plus K-1 optimizer rewrites of it, each
+# tightening a different part of the scene. Each generation imports every new
+# candidate concurrently, ranks all candidates seen so far by combined score,
+# and refills the population by asking the optimizer to mutate the top
+# survivors against their own failure reports. A candidate whose import only
+# parsed with the _SYSTEM_COMPACT fallback is reported but never ranked.
+
+# Parts of the scene the first-generation rewrites each focus on, in turn.
+_SEED_FOCUS = (
+    "characters (triggers, personality, speech_style, backstory)",
+    "beats (ALL-CAPS titles, concrete instructions, pause on decision points)",
+    "world_info and scene_setup",
+    "narrator_prompt, writing_style and author_note_content",
+    "scenario and writing_instructions",
+)
+
+def _prompt_sha(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+
+
+def _evaluate_candidate(cand: dict, prose: str, orig: dict, stem: str,
+                        imagination: int, beat_count: int, use_cache: bool) -> dict:
+    """Import, assemble and score one candidate prompt. Fills cand in place."""
+    start = time.perf_counter()
+    try:
+        result, cand["cached"], compact = cached_import(prose, imagination, beat_count,
+                                                        cand["system"], use_cache)
+        cand["import_s"] = round(time.perf_counter() - start, 2)
+        if compact:
+            # Scored output would be the compact prompt's, not this candidate's — leave it unranked
+            cand.update(fallback=True, error="importer fell back to the compact prompt")
+            return cand
+        gen_path, gen = result_to_scene(result, stem, cand["id"])
+    except Exception as exc:
+        # A malformed candidate scores zero instead of aborting the generation
+        cand.update(score=0.0, q_score=0.0, sem_score=0.0, error=str(exc),
+                    import_s=round(time.perf_counter() - start, 2))
+        return cand
+
+    report = diff_scenes(orig, gen)
+    cand.update(
+        score=report["score"], q_score=report["q_score"], sem_score=report["sem_score"],
+        val_errors=len(validate_generated(_generated_block(result))),
+        gen_path=str(gen_path), report=report,
+    )
+    return cand
+
+
+def run_population(prose: str, orig: dict, stem: str, seed_system: str,
+                   imagination: int, beat_count: int, population: int,
+                   generations: int, survivors: int, parallel: int,
+                   use_cache: bool) -> tuple[list[dict], dict]:
+    """Evolve importer prompts. Returns (all candidates ranked, best candidate)."""
+    candidates: list[dict] = []
+    seen: set[str] = set()
+
+    def _new(system: str, generation: int, parent: str | None) -> dict | None:
+        sha = _prompt_sha(system)
+        if sha in seen:
+            return None
+        seen.add(sha)
+        cid = f"g{generation}c{sum(1 for c in candidates if c['generation'] == generation) + 1}"
+        cand = {"id": cid, "generation": generation, "parent": parent,
+                "prompt_sha": sha, "system": system}
+        candidates.append(cand)
+        return cand
+
+    def _ranked() -> list[dict]:
+        return sorted((c for c in candidates if "score" in c),
+                      key=lambda c: (-c["score"], -c["sem_score"], c["generation"]))
+
+    seed = _new(seed_system, 0, None)
+    pending = [seed]
+
+    with ThreadPoolExecutor(max_workers=max(1, parallel)) as pool:
+        if population > 1:
+            print(f"\n  Seeding generation 1 with {population - 1} rewrite(s) of the seed prompt …")
+
+            def _seed(focus: str) -> str | None:
+                try:
+                    return seed_variant(seed_system, focus)
+                except Exception as exc:
+                    print(f"    WARNING: optimizer failed for seed variant ({exc})")
+                    return None
+
+            focuses = [_SEED_FOCUS[i % len(_SEED_FOCUS)] for i in range(population - 1)]
+            for variant in pool.map(_seed, focuses):
+                if variant and _has_placeholders(variant):
+                    child = _new(variant, 0, seed["id"])
+                    if child is not None:
+                        pending.append(child)
+
+        for generation in range(generations):
+            print(f"\n{'─'*66}")
+            print(f"  Generation {generation + 1}/{generations}  —  importing {len(pending)} candidate(s) …")
+            gen_start = time.perf_counter()
+            list(pool.map(
+                lambda c: _evaluate_candidate(c, prose, orig, stem, imagination, beat_count, use_cache),
+                pending,
+            ))
+            for c in pending:
+                (_WORK_DIR / f"{stem}_system_{c['id']}.txt").write_text(c["system"], encoding="utf-8")
+                if "error" in c:
+                    print(f"    ✗ {c['id']:<7} ERROR: {c['error'][:60]}")
+                else:
+                    tag = "cached" if c["cached"] else f"{c['import_s']:.1f}s"
+                    print(f"    {c['id']:<7} combined={c['score']:.0%}  qty={c['q_score']:.0%}  "
+                          f"sem={c['sem_score']:.0%}  val_errors={c['val_errors']}  [{tag}]"
+                          + (f"  ← {c['parent']}" if c["parent"] else ""))
+
+            ranked = _ranked()
+            best = ranked[0] if ranked else candidates[0]
+            print(f"  Generation wall: {time.perf_counter() - gen_start:.1f}s   "
+                  f"best so far: {best['id']} {best.get('score', 0):.0%}")
+
+            if best.get("score", 0) >= _SATISFACTION:
+                print(f"\n  Score {best['score']:.0%} ≥ {_SATISFACTION:.0%} — satisfied!")
+                break
+            if generation == generations - 1:
+                print("\n  Max generations reached.")
+                break
+
+            # ── Mutate top survivors to refill the population ──────────────
+            parents = [c for c in ranked if "report" in c][:max(1, survivors)]
+            if not parents:
+                print("\n  No scoreable candidates — stopping.")
+                break
+            n_children = max(1, population - len(parents))
+            slots = [parents[i % len(parents)] for i in range(n_children)]
+            print(f"\n  Mutating {', '.join(p['id'] for p in parents)} → {n_children} children …")
+
+            def _mutate(parent: dict) -> tuple[dict, str | None]:
+                try:
+                    return parent, optimize_prompt(parent["system"], parent["report"], orig)
+                except Exception as exc:
+                    print(f"    WARNING: optimizer failed for {parent['id']} ({exc})")
+                    return parent, None
+
+            pending = []
+            for parent, improved in pool.map(_mutate, slots):
+                if not improved or not _has_placeholders(improved):
+                    continue
+                child = _new(improved, generation + 1, parent["id"])
+                if child is not None:
+                    pending.append(child)
+            if not pending:
+                print("  Optimizer produced no new valid prompts — stopping.")
+                break
+
+    ranked = _ranked()
+    return ranked, (ranked[0] if ranked else candidates[0])
+
+
+def write_leaderboard(ranked: list[dict], stem: str, config: dict) -> Path:
+    """Write one JSON leaderboard per run to the work dir."""
+    path = _WORK_DIR / f"{stem}_leaderboard_{datetime.now():%Y%m%d_%H%M%S}.json"
+    board = {
+        "scene":     stem,
+        "model":     MODEL,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "config":    config,
+        "ranking": [
+            {
+                "rank":        i + 1,
+                **{k: c.get(k) for k in ("id", "generation", "parent", "prompt_sha", "score",
+                                         "q_score", "sem_score", "val_errors", "cached",
+                                         "import_s", "gen_path", "error")},
+                "prompt_path": str(_WORK_DIR / f"{stem}_system_{c['id']}.txt"),
+            }
+            for i, c in enumerate(ranked)
+        ],
+    }
+    path.write_text(json.dumps(board, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
 # ── Story engine runner ────────────────────────────────────────────────────────
 
 def generate_prose(scene_path: Path) -> Path:
@@ -860,9 +1101,83 @@ def _parse_args() -> argparse.Namespace:
                    help="Automatically apply LLM prompt improvements each iteration")
     p.add_argument("--commit", action="store_true",
                    help="Write the best improved prompt back to single_pass.py")
+    p.add_argument("--population", type=int, default=0, metavar="K",
+                   help="Population search: K prompt variants per generation, "
+                        "imported concurrently (--iters = generations)")
+    p.add_argument("--survivors", type=int, default=_DEFAULT_SURVIVORS, metavar="N",
+                   help=f"Top candidates mutated each generation (default {_DEFAULT_SURVIVORS})")
+    p.add_argument("--parallel", type=int, default=0, metavar="N",
+                   help="Max concurrent importer calls in population mode (default: K)")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Population mode: ignore and do not write the import result cache")
     return p.parse_args()
 
 
+def _commit_prompt(best_system: str, commit: bool) -> None:
+    if commit and best_system != _sp_module._SYSTEM:
+        sp_path = Path(__file__).parent / "importers" / "single_pass.py"
+        src = sp_path.read_text(encoding="utf-8")
+        pattern = re.compile(r'(_SYSTEM\s*=\s*""")[^"]*(?:""")', re.DOTALL)
+        new_src = pattern.sub(
+            lambda m: m.group(1) + best_system + '"""',
+            src, count=1,
+        )
+        if new_src == src:
+            print("\n  WARNING: could not locate _SYSTEM in single_pass.py — not written.")
+        else:
+            backup = sp_path.with_suffix(".py.bak")
+            shutil.copy(sp_path, backup)
+            sp_path.write_text(new_src, encoding="utf-8")
+            print(f"\n  Backed up: {backup}")
+            print(f"  Wrote improved _SYSTEM to: {sp_path}")
+    elif commit:
+        print("\n  Prompt unchanged — nothing to commit.")
+    else:
+        print(f"\n  To commit best prompt to single_pass.py, re-run with --commit")
+    print()
+
+
+def _main_population(args: argparse.Namespace, prose_text: str, orig: dict,
+                     stem: str, beat_count: int) -> None:
+    parallel = args.parallel or args.population
+    start = time.perf_counter()
+    ranked, best = run_population(
+        prose_text, orig, stem, _sp_module._SYSTEM,
+        imagination=args.imagination, beat_count=beat_count,
+        population=args.population, generations=args.iters,
+        survivors=args.survivors, parallel=parallel,
+        use_cache=not args.no_cache,
+    )
+    wall = time.perf_counter() - start
+
+    if "report" in best:
+        print_diff_report(best["report"], best["id"])
+
+    print(f"\n{'═'*66}")
+    print("  LEADERBOARD")
+    print(f"{'═'*66}")
+    for i, c in enumerate(ranked[:10], 1):
+        print(f"  {i:>2}. {c['id']:<7} combined={c['score']:.0%}  qty={c['q_score']:.0%}  "
+              f"sem={c['sem_score']:.0%}  sha={c['prompt_sha']}"
+              + (f"  ← {c['parent']}" if c["parent"] else ""))
+    print(f"\n  Best combined score: {best.get('score', 0):.0%}  ({best['id']})   "
+          f"candidates: {len(ranked)}   wall: {wall:.1f}s")
+
+    board = write_leaderboard(ranked, stem, {
+        "population": args.population, "survivors": args.survivors,
+        "generations": args.iters, "parallel": parallel,
+        "imagination": args.imagination, "beat_count": beat_count,
+        "wall_s": round(wall, 1),
+    })
+    print(f"  Leaderboard       : {board}")
+
+    best_path = _WORK_DIR / f"{stem}_system_best.txt"
+    best_path.write_text(best["system"], encoding="utf-8")
+    print(f"  Best prompt saved : {best_path}")
+
+    _commit_prompt(best["system"], args.commit)
+
+
 # ── Main ───────────────────────────────────────────────────────────────────────
 
 def main() -> None:
@@ -880,7 +1195,10 @@ def main() -> None:
     print(f"  STORY IMPORTER — ROUNDTRIP TEST")
     print(f"  scene    : {scene_path}")
     print(f"  importer : {BASE_URL}  [{MODEL}]")
-    print(f"  auto     : {args.auto}   iters: {args.iters}")
+    if args.population:
+        print(f"  population: {args.population}   survivors: {args.survivors}   generations: {args.iters}")
+    else:
+        print(f"  auto     : {args.auto}   iters: {args.iters}")
     print(f"{'═'*66}")
 
     # ── Phase 1: prose ────────────────────────────────────────────────────────
@@ -908,6 +1226,10 @@ def main() -> None:
     orig_beat_count = len(orig.get("beats", []))
     print(f"  Original: {len(orig.get('characters', []))} chars, {orig_beat_count} beats")
 
+    if args.population:
+        _main_population(args, prose_text, orig, stem, orig_beat_count or 5)
+        return
+
     # ── Phase 2: loop ────────────────────────────────────────────────────────
     current_system = _sp_module._SYSTEM
     best_score, best_system = 0.0, current_system
@@ -918,8 +1240,8 @@ def main() -> None:
         print(f"  Iteration {iteration}/{args.iters}  —  importing …")
 
         try:
-            result = run_import(prose_text, args.imagination,
-                                orig_beat_count or 5, current_system)
+            result, _ = run_import(prose_text, args.imagination,
+                                   orig_beat_count or 5, current_system)
         except json.JSONDecodeError as exc:
             print(f"  ERROR: invalid JSON from importer — {exc}")
             continue
@@ -930,17 +1252,7 @@ def main() -> None:
         gen_path, gen = result_to_scene(result, stem, iteration)
         print(f"  Generated: {gen_path}")
 
-        generated_block = {
-            "narrator_prompt":      result.get("narrator_prompt", ""),
-            "writing_style":        result.get("writing_style", ""),
-            "author_note_content":  result.get("author_note_content", ""),
-            "world_info":           result.get("world_info", ""),
-            "scene_setup":          result.get("scene_setup", {}),
-            "characters":           result.get("characters", []),
-            "beats":                result.get("beats", []),
-            "writing_instructions": result.get("writing_instructions", ""),
-        }
-        val_errors = validate_generated(generated_block)
+        val_errors = validate_generated(_generated_block(result))
         if val_errors:
             print(f"  Validation errors: {len(val_errors)}")
             for e in val_errors[:6]:
@@ -980,7 +1292,7 @@ def main() -> None:
             print("\n  Auto-improving prompt …")
             try:
                 improved = optimize_prompt(current_system, report, orig)
-                if "{imagination_clause}" in improved and "{beat_count}" in improved:
+                if _has_placeholders(improved):
                     current_system = improved
                     print(f"  Prompt updated ({word_count(improved)} words).")
                 else:
@@ -1000,7 +1312,7 @@ def main() -> None:
                 print("  Optimizing …")
                 try:
                     improved = optimize_prompt(current_system, report, orig)
-                    if "{imagination_clause}" in improved and "{beat_count}" in improved:
+                    if _has_placeholders(improved):
                         current_system = improved
                         print(f"  Prompt updated ({word_count(improved)} words).")
                     else:
@@ -1023,27 +1335,7 @@ def main() -> None:
     print(f"  Best prompt saved : {best_path}")
 
     # ── Commit ────────────────────────────────────────────────────────────────
-    if args.commit and best_system != _sp_module._SYSTEM:
-        sp_path = Path(__file__).parent / "importers" / "single_pass.py"
-        src = sp_path.read_text(encoding="utf-8")
-        pattern = re.compile(r'(_SYSTEM\s*=\s*""")[^"]*(?:""")', re.DOTALL)
-        new_src = pattern.sub(
-            lambda m: m.group(1) + best_system + '"""',
-            src, count=1,
-        )
-        if new_src == src:
-            print("\n  WARNING: could not locate _SYSTEM in single_pass.py — not written.")
-        else:
-            backup = sp_path.with_suffix(".py.bak")
-            shutil.copy(sp_path, backup)
-            sp_path.write_text(new_src, encoding="utf-8")
-            print(f"\n  Backed up: {backup}")
-            print(f"  Wrote improved _SYSTEM to: {sp_path}")
-    elif args.commit:
-        print("\n  Prompt unchanged — nothing to commit.")
-    else:
-        print(f"\n  To commit best prompt to single_pass.py, re-run with --commit")
-    print()
+    _commit_prompt(best_system, args.commit)
 
 
 if __name__ == "__main__":
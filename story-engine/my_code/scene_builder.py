@@ -8,6 +8,7 @@ Config (via .env or environment variables):
   SCENE_BUILDER_BASE_URL   — defaults to STORY_ENGINE_LOCAL_BASE_URL
   SCENE_BUILDER_MODEL      — defaults to STORY_ENGINE_EVALUATOR_MODEL, then NARRATOR_MODEL
   SCENE_BUILDER_API_KEY    — defaults to "none" (fine for local servers)
+  SCENE_BUILDER_PREFETCH   — background rewrite workers during beat review (default 2, 0 = off)
 
 Usage:
   python my_code/scene_builder.py                    # fresh build via interview
@@ -16,11 +17,16 @@ Usage:
 """
 
 import argparse
+import copy
+import hashlib
 import json
 import os
 import re
 import sys
 import textwrap
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -35,6 +41,11 @@ try:
 except ImportError:
     pass
 
+try:
+    from my_code import scene_format
+except ImportError:  # run as a script: python my_code/scene_builder.py
+    import scene_format
+
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
@@ -49,6 +60,11 @@ MODEL = (
 )
 API_KEY = os.getenv("SCENE_BUILDER_API_KEY", "none")
 
+# Background rewrite prefetch during beat review: worker count (0 disables) and
+# how many beats after the last rewritten one get the same direction prefetched.
+PREFETCH_WORKERS = max(0, int(os.getenv("SCENE_BUILDER_PREFETCH", "2")))
+PREFETCH_AHEAD = 2
+
 # Theme: dark | light | system  (system = no ANSI colors)
 # Set via SCENE_BUILDER_THEME env var; --theme CLI arg overrides at runtime.
 _THEME: str = os.getenv("SCENE_BUILDER_THEME", "dark").lower()
@@ -317,10 +333,15 @@ Return this JSON (all fields required):
 }}"""
 
 
+@lru_cache(maxsize=1)
+def _client() -> OpenAI:
+    """Shared client — thread-safe, so prefetch workers reuse one connection pool."""
+    return OpenAI(base_url=BASE_URL, api_key=API_KEY)
+
+
 def _call_llm(messages: list, temperature: float = 0.7) -> str:
     """Make a chat completion call and return the content string."""
-    client = OpenAI(base_url=BASE_URL, api_key=API_KEY)
-    response = client.chat.completions.create(
+    response = _client().chat.completions.create(
         model=MODEL,
         messages=messages,
         temperature=temperature,
@@ -352,11 +373,16 @@ You are a story beat editor. You make targeted edits to individual scene beats.
 Return ONLY valid JSON. No markdown fences. No explanation."""
 
 
-def llm_rewrite_beat(beat: dict, direction: str, context: dict) -> dict:
-    """Ask the LLM to rewrite a single beat based on user direction.
+def _story_context_block(context: dict) -> str:
+    return f"""\
+STORY CONTEXT:
+Title: {context.get("title", "")}
+Scenario: {context.get("scenario", "")}
+World: {context.get("world_info", "")}"""
+
 
-    Returns an updated beat dict with title, instruction, and pause preserved.
-    """
+def _rewrite_beat_call(beat: dict, direction: str, context: dict) -> dict:
+    """One LLM rewrite of a single beat (no console output — safe off the main thread)."""
     prompt = f"""\
 Rewrite the following story beat based on the requested changes.
 
@@ -367,10 +393,7 @@ Instruction: {beat["instruction"]}
 REQUESTED CHANGES:
 {direction}
 
-STORY CONTEXT:
-Title: {context.get("title", "")}
-Scenario: {context.get("scenario", "")}
-World: {context.get("world_info", "")}
+{_story_context_block(context)}
 
 Return ONLY this JSON:
 {{
@@ -378,7 +401,6 @@ Return ONLY this JSON:
   "instruction": "2-4 sentences of directional beat guidance"
 }}"""
 
-    print(_c("  Rewriting beat — please wait...", "waiting"))
     raw = _call_llm([
         {"role": "system", "content": _SYSTEM_BEAT},
         {"role": "user",   "content": prompt},
@@ -389,6 +411,68 @@ Return ONLY this JSON:
     return result
 
 
+def _rewrite_beats_call(items: list, direction: str, context: dict) -> dict:
+    """Rewrite several beats with one LLM call.
+
+    items is a list of (number, beat) pairs (1-based numbers). Returns
+    {number: updated beat}; beats the model dropped are rewritten one by one.
+    """
+    if len(items) == 1:
+        n, beat = items[0]
+        return {n: _rewrite_beat_call(beat, direction, context)}
+
+    beats_block = "\n\n".join(
+        f"[{n}]\nTitle: {b['title']}\nInstruction: {b['instruction']}" for n, b in items
+    )
+    prompt = f"""\
+Rewrite each of the following story beats based on the requested changes.
+Apply the changes to every beat; keep each beat's role in the arc.
+
+CURRENT BEATS:
+{beats_block}
+
+REQUESTED CHANGES:
+{direction}
+
+{_story_context_block(context)}
+
+Return ONLY a JSON array with one object per beat, in the same order:
+[
+  {{
+    "beat": <number in brackets above>,
+    "title": "SHORT EVOCATIVE TITLE",
+    "instruction": "2-4 sentences of directional beat guidance"
+  }}
+]"""
+
+    raw = _call_llm([
+        {"role": "system", "content": _SYSTEM_BEAT},
+        {"role": "user",   "content": prompt},
+    ])
+    result = json.loads(raw)
+    if not isinstance(result, list):
+        raise ValueError("LLM did not return a JSON array for batched rewrite")
+
+    wanted = {n for n, _ in items}
+    by_number: dict = {}
+    for i, entry in enumerate(result):
+        if not isinstance(entry, dict) or not entry.get("title") or not entry.get("instruction"):
+            continue
+        n = entry.get("beat")
+        if n not in wanted and len(result) == len(items):
+            n = items[i][0]     # model renumbered — fall back to position
+        if n in wanted and n not in by_number:
+            by_number[n] = {"title": entry["title"], "instruction": entry["instruction"]}
+
+    out: dict = {}
+    for n, beat in items:
+        if n in by_number:
+            out[n] = {**by_number[n], "pause": beat.get("pause", False)}
+        else:
+            out[n] = _rewrite_beat_call(beat, direction, context)
+    return out
+
+
 _SYSTEM_EXTEND = """\
 You are a story structure assistant. You extend an existing beat arc with new beats.
 Beat titles must be SHORT and evocative. Instructions are directional (WHAT happens),
@@ -438,6 +522,138 @@ Return ONLY a JSON array of {count} new beat(s):
     return result
 
 
+# ── Rewrite cache and background prefetch ───────────────────────────────────
+# Rewrites are cached by (beat content, direction, story context), so undo/redo
+# and repeated directions are instant. After each rewrite the same direction is
+# prefetched for the next few beats on a small worker pool while the user reads
+# and confirms; prefetches still queued are cancelled when the direction changes
+# or the review ends. Running requests finish and land in the cache.
+
+def _hash(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+class RewritePipeline:
+    """Cached, batched, prefetching beat rewrites for one review session."""
+
+    def __init__(self, context: dict, workers: int = PREFETCH_WORKERS):
+        self._context = context
+        self._context_hash = _hash(
+            context.get("title", ""), context.get("scenario", ""), context.get("world_info", "")
+        )
+        self._cache: dict = {}      # key -> rewritten beat
+        self._pending: dict = {}    # key -> Future of {key: rewritten beat}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="beat-prefetch") if workers else None
+
+    def _key(self, beat: dict, direction: str) -> tuple:
+        return (_hash(beat["title"], beat["instruction"]), " ".join(direction.lower().split()), self._context_hash)
+
+    def _run(self, keyed: list, direction: str) -> dict:
+        """keyed: list of (key, number, beat). Calls the LLM once and fills the cache."""
+        result = _rewrite_beats_call([(n, b) for _, n, b in keyed], direction, self._context)
+        out = {key: result[n] for key, n, _ in keyed}
+        with self._lock:
+            self._cache.update(out)
+            for key in out:
+                self._pending.pop(key, None)
+        return out
+
+    def rewrite(self, items: list, direction: str) -> tuple[dict, int]:
+        """Rewrite (number, beat) pairs. Returns ({number: beat}, cache_hits).
+
+        Cached results return immediately, in-flight prefetches are awaited, and
+        everything else goes out as one batched call.
+        """
+        out: dict = {}
+        waits: list = []
+        missing: list = []
+        with self._lock:
+            for n, beat in items:
+                key = self._key(beat, direction)
+                if key in self._cache:
+                    out[n] = self._cache[key]
+                elif key in self._pending and not self._pending[key].cancelled():
+                    waits.append((key, n, beat, self._pending[key]))
+                else:
+                    missing.append((key, n, beat))
+
+        for key, n, beat, fut in waits:
+            try:
+                out[n] = fut.result()[key]
+            except Exception:
+                missing.append((key, n, beat))   # prefetch failed — retry in the batch
+        hits = len(out)
+
+        if missing:
+            fresh = self._run(missing, direction)
+            for key, n, _ in missing:
+                out[n] = fresh[key]
+        return {n: copy.deepcopy(beat) for n, beat in out.items()}, hits
+
+    def prefetch(self, items: list, direction: str) -> None:
+        """Queue one background batched rewrite for beats not cached or in flight."""
+        if self._pool is None:
+            return
+        with self._lock:
+            keyed = [
+                (key, n, copy.deepcopy(beat))
+                for n, beat in items
+                for key in [self._key(beat, direction)]
+                if key not in self._cache and key not in self._pending
+            ]
+            if not keyed:
+                return
+            fut: Future = self._pool.submit(self._run_quietly, keyed, direction)
+            for key, _, _ in keyed:
+                self._pending[key] = fut
+
+    def _run_quietly(self, keyed: list, direction: str) -> dict:
+        try:
+            return self._run(keyed, direction)
+        except Exception:
+            with self._lock:
+                for key, _, _ in keyed:
+                    self._pending.pop(key, None)
+            raise
+
+    def discard(self, beat: dict, direction: str) -> None:
+        """Forget a rejected candidate so asking again produces a fresh one."""
+        with self._lock:
+            self._cache.pop(self._key(beat, direction), None)
+
+    def cancel_pending(self, keep_direction: str | None = None) -> None:
+        """Cancel queued prefetches (optionally keeping those for one direction)."""
+        keep = " ".join(keep_direction.lower().split()) if keep_direction else None
+        with self._lock:
+            for key, fut in list(self._pending.items()):
+                if key[1] != keep and fut.cancel():
+                    del self._pending[key]
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self.cancel_pending()
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_beat_numbers(spec: str, total: int) -> list[int]:
+    """Parse '3', '2,4' or '2-4' into sorted 1-based beat numbers."""
+    numbers: set[int] = set()
+    for part in spec.split(","):
+        if "-" in part:
+            lo, hi = (int(x) for x in part.split("-", 1))
+            numbers.update(range(lo, hi + 1))
+        else:
+            numbers.add(int(part))
+    if not numbers or min(numbers) < 1 or max(numbers) > total:
+        raise ValueError(f"Beat number out of range (1–{total}).")
+    return sorted(numbers)
+
+
 # ── Beat arc review ───────────────────────────────────────────────────────────
 
 def _print_beats(beats: list):
@@ -461,6 +677,7 @@ def review_beats(beats: list, mode: str, context: dict) -> list:
     print("  Commands:")
     print("    ok                        — accept as-is and continue")
     print("    rewrite N <description>   — LLM rewrites beat N based on your direction")
+    print("    rewrite 2,4 / 2-4 <desc>  — rewrite several beats in one LLM call")
     print("    extend <description>      — LLM adds more beats continuing the story")
     print("    edit N <new text>         — manually replace beat N instruction")
     print("    title N <new title>       — rename beat N")
@@ -468,111 +685,40 @@ def review_beats(beats: list, mode: str, context: dict) -> list:
     print("    add <instruction>         — append a beat manually")
     print("    remove N                  — delete beat N")
     print("    swap N M                  — swap beats N and M")
+    print("    undo / redo               — step back / forward through beat changes")
 
-    while True:
-        cmd = ask("Command [ok]:").strip()
-        if not cmd or cmd.lower() == "ok":
-            break
-
-        parts = cmd.split(None, 2)
-        action = parts[0].lower()
-
-        try:
-            # ── LLM rewrite ──────────────────────────────────────────────────
-            if action == "rewrite" and len(parts) >= 3:
-                n = int(parts[1]) - 1
-                if not (0 <= n < len(beats)):
-                    print(f"  Beat number out of range (1–{len(beats)}).")
-                    continue
-                direction = parts[2]
-                try:
-                    updated = llm_rewrite_beat(beats[n], direction, context)
-                    print(f"\n  Rewritten beat {n+1}:")
-                    print(f"    Title: {updated['title']}")
-                    print(wrap(updated["instruction"], indent="    "))
-                    confirm = ask("  Accept? [yes] / 'no' to discard:").strip().lower()
-                    if confirm in ("", "yes", "y"):
-                        beats[n] = updated
-                        print(f"  Beat {n+1} updated.")
-                    else:
-                        print("  Discarded — original kept.")
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"  LLM returned bad output: {e} — original kept.")
-
-            # ── LLM extend ───────────────────────────────────────────────────
-            elif action == "extend" and len(parts) >= 2:
-                direction = " ".join(parts[1:])
-                remaining = 10 - len(beats)
-                if remaining <= 0:
-                    print("  Already at maximum 10 beats.")
-                    continue
-                raw_count = ask(
-                    f"  How many beats to add? (max {remaining})  [{min(2, remaining)}]",
-                    str(min(2, remaining)),
-                ).strip()
-                try:
-                    count = max(1, min(remaining, int(raw_count)))
-                except ValueError:
-                    count = min(2, remaining)
-                try:
-                    new_beats = llm_extend_beats(beats, direction, count, context)
-                    print(f"\n  {len(new_beats)} new beat(s) generated:")
-                    for i, b in enumerate(new_beats, len(beats) + 1):
-                        print(f"    {i}. {b.get('title', '?')}")
-                        print(wrap(b.get("instruction", ""), indent="       "))
-                    confirm = ask("  Append these? [yes] / 'no' to discard:").strip().lower()
-                    if confirm in ("", "yes", "y"):
-                        beats.extend(new_beats)
-                        print(f"  {len(new_beats)} beat(s) appended. Total: {len(beats)}")
-                    else:
-                        print("  Discarded.")
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"  LLM returned bad output: {e} — no beats added.")
-
-            # ── Manual edit ──────────────────────────────────────────────────
-            elif action == "edit" and len(parts) >= 3:
-                n = int(parts[1]) - 1
-                beats[n]["instruction"] = parts[2]
-                print(f"  Beat {n+1} updated.")
-
-            elif action == "title" and len(parts) >= 3:
-                n = int(parts[1]) - 1
-                beats[n]["title"] = parts[2].upper()
-                print(f"  Beat {n+1} renamed.")
-
-            elif action == "pause" and len(parts) == 2:
-                n = int(parts[1]) - 1
-                beats[n]["pause"] = not beats[n].get("pause", False)
-                state = "ON" if beats[n]["pause"] else "OFF"
-                print(f"  Pause {state} for beat {n+1}.")
-
-            elif action == "add" and len(parts) >= 2:
-                if len(beats) >= 10:
-                    print("  Already at maximum 10 beats.")
+    pipeline = RewritePipeline(context)
+    undo_stack: list = []
+    redo_stack: list = []
+    try:
+        while True:
+            cmd = ask("Command [ok]:").strip()
+            if not cmd or cmd.lower() == "ok":
+                break
+
+            parts = cmd.split(None, 2)
+            action = parts[0].lower()
+            before = copy.deepcopy(beats)
+
+            if action in ("undo", "redo"):
+                source, target = (undo_stack, redo_stack) if action == "undo" else (redo_stack, undo_stack)
+                if not source:
+                    print(f"  Nothing to {action}.")
                     continue
-                instruction = " ".join(parts[1:])
-                beats.append({"title": f"BEAT {len(beats)+1}", "instruction": instruction, "pause": False})
-                print(f"  Beat {len(beats)} added.")
-
-            elif action == "remove" and len(parts) == 2:
-                n = int(parts[1]) - 1
-                removed = beats.pop(n)
-                print(f"  Removed: {removed['title']}")
-
-            elif action == "swap" and len(parts) == 3:
-                n, m = int(parts[1]) - 1, int(parts[2]) - 1
-                beats[n], beats[m] = beats[m], beats[n]
-                print(f"  Swapped beats {n+1} and {m+1}.")
-
-            else:
-                print("  Unrecognised command — try again.")
+                target.append(before)
+                beats[:] = source.pop()
+                print(f"  {action.capitalize()} done.")
+                _print_beats(beats)
                 continue
 
-        except (ValueError, IndexError) as e:
-            print(f"  Error: {e}")
-            continue
-
-        _print_beats(beats)
+            if not _review_command(action, parts, beats, pipeline, context):
+                continue
+            if beats != before:
+                undo_stack.append(before)
+                redo_stack.clear()
+            _print_beats(beats)
+    finally:
+        pipeline.close()
 
     # Remind about pauses if semi-interactive and none set
     if mode == "semi-interactive" and not any(b.get("pause") for b in beats):
@@ -588,6 +734,148 @@ def review_beats(beats: list, mode: str, context: dict) -> list:
     return beats
 
 
+def _review_rewrite(spec: str, direction: str, beats: list,
+                    pipeline: RewritePipeline) -> None:
+    """rewrite N|N,M|N-M <direction>: cached/batched rewrite, then confirm."""
+    numbers = _parse_beat_numbers(spec, len(beats))
+    items = [(n, beats[n - 1]) for n in numbers]
+    # Moving on to a new direction — drop queued prefetches for older ones
+    pipeline.cancel_pending(keep_direction=direction)
+
+    label = f"beat {numbers[0]}" if len(numbers) == 1 else f"{len(numbers)} beats in one call"
+    try:
+        print(_c(f"  Rewriting {label} — please wait...", "waiting"))
+        updated, hits = pipeline.rewrite(items, direction)
+    except (json.JSONDecodeError, ValueError) as e:
+        print(f"  LLM returned bad output: {e} — original kept.")
+        return
+
+    # Likely next: the same direction on the beats that follow
+    last = numbers[-1]
+    ahead = [(m, beats[m - 1]) for m in range(last + 1, min(len(beats), last + PREFETCH_AHEAD) + 1)]
+    pipeline.prefetch(ahead, direction)
+
+    if hits:
+        print(_c(f"  ({hits} from cache)", "muted"))
+    for n in numbers:
+        print(f"\n  Rewritten beat {n}:")
+        print(f"    Title: {updated[n]['title']}")
+        print(wrap(updated[n]["instruction"], indent="    "))
+
+    if len(numbers) == 1:
+        confirm = ask("  Accept? [yes] / 'no' to discard:").strip().lower()
+        accepted = numbers if confirm in ("", "yes", "y") else []
+    else:
+        confirm = ask("  Accept all? [yes] / 'no' to discard / beat numbers to keep:").strip().lower()
+        if confirm in ("", "yes", "y"):
+            accepted = numbers
+        elif confirm in ("no", "n"):
+            accepted = []
+        else:
+            keep = {int(t) for t in re.split(r"[\s,]+", confirm) if t.isdigit()}
+            accepted = [n for n in numbers if n in keep]
+
+    for n in numbers:
+        if n in accepted:
+            beats[n - 1] = updated[n]
+        else:
+            pipeline.discard(items[numbers.index(n)][1], direction)
+    if accepted:
+        print(f"  Updated beat(s): {', '.join(str(n) for n in accepted)}.")
+    else:
+        print("  Discarded — original kept.")
+
+
+def _review_command(action: str, parts: list, beats: list,
+                    pipeline: RewritePipeline, context: dict) -> bool:
+    """Apply one beat-review command. Returns False when nothing should be re-printed."""
+    try:
+        # ── LLM rewrite ──────────────────────────────────────────────────────
+        if action == "rewrite" and len(parts) >= 3:
+            try:
+                numbers_spec = parts[1]
+                _parse_beat_numbers(numbers_spec, len(beats))
+            except ValueError:
+                print(f"  Beat number out of range (1–{len(beats)}).")
+                return False
+            _review_rewrite(numbers_spec, parts[2], beats, pipeline)
+
+        # ── LLM extend ───────────────────────────────────────────────────────
+        elif action == "extend" and len(parts) >= 2:
+            direction = " ".join(parts[1:])
+            remaining = 10 - len(beats)
+            if remaining <= 0:
+                print("  Already at maximum 10 beats.")
+                return False
+            raw_count = ask(
+                f"  How many beats to add? (max {remaining})  [{min(2, remaining)}]",
+                str(min(2, remaining)),
+            ).strip()
+            try:
+                count = max(1, min(remaining, int(raw_count)))
+            except ValueError:
+                count = min(2, remaining)
+            try:
+                new_beats = llm_extend_beats(beats, direction, count, context)
+                print(f"\n  {len(new_beats)} new beat(s) generated:")
+                for i, b in enumerate(new_beats, len(beats) + 1):
+                    print(f"    {i}. {b.get('title', '?')}")
+                    print(wrap(b.get("instruction", ""), indent="       "))
+                confirm = ask("  Append these? [yes] / 'no' to discard:").strip().lower()
+                if confirm in ("", "yes", "y"):
+                    beats.extend(new_beats)
+                    print(f"  {len(new_beats)} beat(s) appended. Total: {len(beats)}")
+                else:
+                    print("  Discarded.")
+            except (json.JSONDecodeError, ValueError) as e:
+                print(f"  LLM returned bad output: {e} — no beats added.")
+
+        # ── Manual edit ──────────────────────────────────────────────────────
+        elif action == "edit" and len(parts) >= 3:
+            n = int(parts[1]) - 1
+            beats[n]["instruction"] = parts[2]
+            print(f"  Beat {n+1} updated.")
+
+        elif action == "title" and len(parts) >= 3:
+            n = int(parts[1]) - 1
+            beats[n]["title"] = parts[2].upper()
+            print(f"  Beat {n+1} renamed.")
+
+        elif action == "pause" and len(parts) == 2:
+            n = int(parts[1]) - 1
+            beats[n]["pause"] = not beats[n].get("pause", False)
+            state = "ON" if beats[n]["pause"] else "OFF"
+            print(f"  Pause {state} for beat {n+1}.")
+
+        elif action == "add" and len(parts) >= 2:
+            if len(beats) >= 10:
+                print("  Already at maximum 10 beats.")
+                return False
+            instruction = " ".join(parts[1:])
+            beats.append({"title": f"BEAT {len(beats)+1}", "instruction": instruction, "pause": False})
+            print(f"  Beat {len(beats)} added.")
+
+        elif action == "remove" and len(parts) == 2:
+            n = int(parts[1]) - 1
+            removed = beats.pop(n)
+            print(f"  Removed: {removed['title']}")
+
+        elif action == "swap" and len(parts) == 3:
+            n, m = int(parts[1]) - 1, int(parts[2]) - 1
+            beats[n], beats[m] = beats[m], beats[n]
+            print(f"  Swapped beats {n+1} and {m+1}.")
+
+        else:
+            print("  Unrecognised command — try again.")
+            return False
+
+    except (ValueError, IndexError) as e:
+        print(f"  Error: {e}")
+        return False
+
+    return True
+
+
 # ── Section review ────────────────────────────────────────────────────────────
 
 def review_voice(generated: dict):
@@ -630,56 +918,14 @@ class LoadError(Exception):
     pass
 
 
-def _split_sections(text: str) -> dict:
-    """Split raw file text on [section-name] markers."""
-    section_re = re.compile(r"^\[([a-z][a-z0-9_-]*)\]\s*$", re.MULTILINE)
-    matches = list(section_re.finditer(text))
-    if not matches:
-        raise LoadError("No [section] markers found — not a valid scene file.")
-    sections = {}
-    for i, m in enumerate(matches):
-        name = m.group(1)
-        start = m.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        sections[name] = text[start:end].strip()
-    return sections
-
-
-def _parse_kv(text: str) -> dict:
-    """Parse key: value lines, handling multi-line continuation and YAML > folding."""
-    result = {}
-    current_key = None
-    current_lines = []
-
-    for line in text.splitlines():
-        kv = re.match(r"^([a-z_]+)\s*:\s*(.*)", line)
-        if kv:
-            if current_key is not None:
-                result[current_key] = " ".join(l for l in current_lines if l).strip()
-            current_key = kv.group(1)
-            value = kv.group(2).strip()
-            current_lines = [] if value == ">" else [value]
-        elif current_key is not None and line.strip():
-            current_lines.append(line.strip())
-
-    if current_key is not None:
-        result[current_key] = " ".join(l for l in current_lines if l).strip()
-
-    return result
-
-
 def _parse_beats_from_text(text: str) -> list:
     """Parse numbered beat list from scene-beats section text."""
-    beat_re = re.compile(r"^(\d+)\.\s+", re.MULTILINE)
-    matches = list(beat_re.finditer(text))
-    if not matches:
+    items = scene_format.split_numbered(text)
+    if not items:
         raise LoadError("[scene-beats]: No numbered beats found.")
 
     beats = []
-    for i, m in enumerate(matches):
-        start = m.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        raw = text[start:end].strip()
+    for number, raw in items:
         has_pause = "[pause]" in raw
         instruction = re.sub(r"\[pause\]", "", raw).strip()
         instruction = re.sub(r"\s+", " ", instruction)
@@ -689,7 +935,7 @@ def _parse_beats_from_text(text: str) -> list:
             title = lines[0].strip()
             instruction = " ".join(lines[1:]).strip() or title
         else:
-            title = f"BEAT {m.group(1)}"
+            title = f"BEAT {number}"
         beats.append({"title": title, "instruction": instruction, "pause": has_pause})
     return beats
 
@@ -709,32 +955,31 @@ def load_scene_file(path_str: str) -> tuple[dict, dict]:
     if path.suffix.lower() != ".md":
         raise LoadError(f"Expected a .md file, got: {path.suffix}")
 
-    text = path.read_text(encoding="utf-8")
-    sections = _split_sections(text)
+    tokens = scene_format.load(path)
+    sections = tokens.sections
+    if not sections:
+        raise LoadError("No [section] markers found — not a valid scene file.")
 
     # Check required sections
     missing = [s for s in _REQUIRED_SECTIONS if s not in sections]
     if missing:
         raise LoadError(f"Missing required section(s): {', '.join(f'[{s}]' for s in missing)}")
 
-    if not any(k.startswith("character-") for k in sections):
+    char_sections = tokens.numbered("character")
+    if not char_sections:
         raise LoadError("No [character-N] sections found — at least one is required.")
 
     # Parse meta
-    meta = _parse_kv(sections["meta"])
+    meta = tokens.kv("meta")
     required_meta = ("title", "mode", "output_file", "output_format", "pov")
     missing_meta = [k for k in required_meta if k not in meta]
     if missing_meta:
         raise LoadError(f"[meta] missing required field(s): {', '.join(missing_meta)}")
 
     # Parse characters
-    char_sections = sorted(
-        [(name, content) for name, content in sections.items() if name.startswith("character-")],
-        key=lambda x: int(re.search(r"\d+", x[0]).group()),
-    )
     characters = []
-    for name, content in char_sections:
-        kv = _parse_kv(content)
+    for name, _content in char_sections:
+        kv = tokens.kv(name)
         missing_char = [f for f in ("name", "role", "triggers", "description", "personality") if f not in kv]
         if missing_char:
             raise LoadError(f"[{name}] missing required field(s): {', '.join(missing_char)}")
@@ -749,7 +994,7 @@ def load_scene_file(path_str: str) -> tuple[dict, dict]:
         })
 
     # Parse scene-setup (optional fields)
-    setup_kv = _parse_kv(sections.get("scene-setup", ""))
+    setup_kv = tokens.kv("scene-setup")
     scene_setup = {
         "location":   setup_kv.get("location", ""),
         "time":       setup_kv.get("time", ""),
@@ -764,7 +1009,7 @@ def load_scene_file(path_str: str) -> tuple[dict, dict]:
     # Parse author-note
     author_note_content = ""
     if "author-note" in sections:
-        an_kv = _parse_kv(sections["author-note"])
+        an_kv = tokens.kv("author-note")
         author_note_content = an_kv.get("content", "")
 
     # Build user_data and generated dicts
@@ -12,8 +12,12 @@ Config (via .env or environment variables):
   STORY_IMPORTER_MODEL      — model to use
                               (falls back to SCENE_BUILDER_MODEL, then STORY_ENGINE_NARRATOR_MODEL)
   STORY_IMPORTER_API_KEY    — API key (default: "none" for local servers)
-  STORY_IMPORTER_MAX_WORDS  — hard word-count limit for single-pass extraction (default: 6000)
+  STORY_IMPORTER_MAX_WORDS  — single-pass limit; longer stories use chunked extraction (default: 6000)
   STORY_IMPORTER_WARN_WORDS — warn-but-proceed threshold (default: 4000)
+  STORY_IMPORTER_CHUNK_WORDS / STORY_IMPORTER_CHUNK_OVERLAP — chunk size / overlap in words (1500 / 200)
+  STORY_IMPORTER_PARALLEL_CHUNKS   — "true" to extract chunks concurrently (default: false)
+  STORY_IMPORTER_CHUNK_CONCURRENCY — max in-flight chunk calls when parallel (default: 4)
+  STORY_IMPORTER_CACHE_DIR  — chunk extraction cache (default: .cache/story_importer)
 
 Usage:
   python my_code/story_importer.py story.txt
@@ -47,6 +51,7 @@ from my_code.scene_builder import (
 from my_code.importers.base import (
     BASE_URL, MODEL,
     MAX_WORDS, WARN_WORDS,
+    CHUNK_WORDS, CHUNK_CONCURRENCY, PARALLEL_CHUNKS,
     word_count, get_analyser,
 )
 
@@ -185,14 +190,13 @@ def main() -> None:
     analyser = get_analyser(wc)
 
     if wc > MAX_WORDS:
-        # get_analyser returned ChunkedAnalyser; let it emit the user-friendly error
-        try:
-            analyser.analyse(story_text, args.imagination, 3)
-        except NotImplementedError as exc:
-            print(_c(f"\n  ERROR: {exc}", "error"))
-            sys.exit(1)
-
-    if wc > WARN_WORDS:
+        print(_c(
+            f"  Long story: {wc:,} words exceeds the single-pass limit ({MAX_WORDS:,}) — "
+            f"using chunked extraction (~{CHUNK_WORDS:,} words/chunk, "
+            f"{'parallel x' + str(CHUNK_CONCURRENCY) if PARALLEL_CHUNKS else 'sequential'}).",
+            "muted",
+        ))
+    elif wc > WARN_WORDS:
         print(_c(
             f"  WARNING: {wc:,} words approaches the single-pass limit ({MAX_WORDS:,}). "
             "Extraction quality may degrade for very long inputs.",
@@ -0,0 +1,189 @@
+"""Beat memory — in-process retrieval store over BeatSummariser output.
+
+Replaces the old "last N summaries, then cut by characters" window. Every
+accepted beat's summary is indexed; prompts get a fixed token budget filled
+with the most recent beats plus the earlier beats most relevant to the current
+beat instruction and the characters it names. Prompt size stays constant on
+long scenes and long-range facts (an oath in beat 3, a wound in beat 12) come
+back when a later beat touches them again.
+
+Pure Python, no LLM. Two backends:
+    - embeddings : a small local CPU sentence-transformers model, when
+                   STORY_ENGINE_MEMORY_EMBED_MODEL is set and the package is installed
+    - TF-IDF     : default / fallback — sparse term vectors, cosine similarity
+
+Config:
+    STORY_ENGINE_MEMORY_EMBED_MODEL       e.g. all-MiniLM-L6-v2 (unset = TF-IDF)
+    STORY_ENGINE_MEMORY_EVAL_TOKENS       evaluator "Prior Beats Summary" budget (default 1100)
+    STORY_ENGINE_MEMORY_NARRATOR_TOKENS   narrator recall budget once its history is trimmed (default 300)
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+EMBED_MODEL: str = os.getenv("STORY_ENGINE_MEMORY_EMBED_MODEL", "").strip()
+EVAL_BUDGET_TOKENS: int = int(os.getenv("STORY_ENGINE_MEMORY_EVAL_TOKENS", "1100"))
+NARRATOR_BUDGET_TOKENS: int = int(os.getenv("STORY_ENGINE_MEMORY_NARRATOR_TOKENS", "300"))
+
+_CHARS_PER_TOKEN = 4
+_WORD_RE = re.compile(r"[a-z0-9']+")
+_STOPWORDS = frozenset(
+    "the and for with that this from into onto upon over under then than they them their there "
+    "these those was were are has have had his her hers him she its it's not but out off all any "
+    "been being who whom whose what when where which while will would could should about after "
+    "before again against between through during each some such only own same very can did does "
+    "doing just now you your yours our ours i'm he's she's".split()
+)
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // _CHARS_PER_TOKEN)
+
+
+def format_summary(beat_index: int, summary: str) -> str:
+    """One block in the accumulated-summary format the evaluator prompt has always used."""
+    return f"### Beat {beat_index} Summary\n{summary}"
+
+
+def _terms(text: str) -> list[str]:
+    return [w.strip("'") for w in _WORD_RE.findall(text.lower())
+            if len(w) > 2 and w not in _STOPWORDS]
+
+
+@lru_cache(maxsize=2)
+def _load_encoder(model_name: str):
+    """Load a sentence-transformers model once per process; None if unavailable."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        logger.warning(
+            "Beat memory: sentence-transformers not installed — using TF-IDF "
+            "(pip install sentence-transformers to use %s)", model_name,
+        )
+        return None
+    try:
+        return SentenceTransformer(model_name, device="cpu")
+    except Exception as exc:
+        logger.warning("Beat memory: could not load %s (%s) — using TF-IDF", model_name, exc)
+        return None
+
+
+@dataclass
+class _Entry:
+    index: int
+    summary: str
+    block: str
+    tokens: int
+    terms: Counter = field(default_factory=Counter)
+    vector: list[float] | None = None
+
+
+class BeatMemory:
+    """Summaries of accepted beats, retrievable by relevance inside a token budget."""
+
+    def __init__(self, embed_model: str = EMBED_MODEL) -> None:
+        self._entries: dict[int, _Entry] = {}
+        self._df: Counter = Counter()
+        self._encoder = _load_encoder(embed_model) if embed_model else None
+        self.backend = f"embeddings:{embed_model}" if self._encoder is not None else "tfidf"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, beat_index: int, summary: str) -> None:
+        """Index (or re-index) the summary of an accepted beat."""
+        if beat_index in self._entries:
+            self._df.subtract(set(self._entries[beat_index].terms))
+        block = format_summary(beat_index, summary)
+        entry = _Entry(beat_index, summary, block, estimate_tokens(block), Counter(_terms(summary)))
+        if self._encoder is not None:
+            entry.vector = self._embed(summary)
+        self._df.update(set(entry.terms))
+        self._entries[beat_index] = entry
+
+    def recall(
+        self,
+        query: str,
+        budget_tokens: int,
+        recent: int = 0,
+        skip_latest: int = 0,
+        before: int | None = None,
+    ) -> str:
+        """Select beat summaries for a prompt, returned in story order.
+
+        The newest `recent` beats are always taken first (immediate continuity),
+        then earlier beats ranked by similarity to `query` fill the rest of the
+        budget. `skip_latest` leaves out the newest beats entirely (the narrator
+        still has those in its own history). Only beats before `before` count.
+        """
+        pool = sorted(i for i in self._entries if before is None or i < before)
+        if skip_latest:
+            pool = pool[:-skip_latest] if skip_latest < len(pool) else []
+        if not pool:
+            return ""
+
+        chosen: list[int] = []
+        used = 0
+        forced = pool[-recent:] if recent else []
+        for i in reversed(forced):
+            cost = self._entries[i].tokens + 1
+            if used + cost > budget_tokens:
+                break
+            chosen.append(i)
+            used += cost
+
+        rest = [i for i in pool if i not in forced]
+        for _score, i in self._rank(query, rest):
+            cost = self._entries[i].tokens + 1
+            if used + cost > budget_tokens:
+                continue
+            chosen.append(i)
+            used += cost
+
+        if not chosen:
+            return ""
+        return "\n\n" + "\n\n".join(self._entries[i].block for i in sorted(chosen))
+
+    # -- scoring -------------------------------------------------------------
+
+    def _rank(self, query: str, candidates: list[int]) -> list[tuple[float, int]]:
+        """Candidates by descending similarity; ties go to the newer beat."""
+        if not candidates:
+            return []
+        if self._encoder is not None:
+            q = self._embed(query)
+            scored = [(sum(a * b for a, b in zip(q, self._entries[i].vector)), i) for i in candidates]
+        else:
+            scored = self._tfidf_scores(query, candidates)
+        return sorted(scored, key=lambda s: (s[0], s[1]), reverse=True)
+
+    def _tfidf_scores(self, query: str, candidates: list[int]) -> list[tuple[float, int]]:
+        n_docs = len(self._entries)
+
+        def weights(terms: Counter) -> dict[str, float]:
+            return {
+                t: (1.0 + math.log(c)) * (math.log((1 + n_docs) / (1 + self._df[t])) + 1.0)
+                for t, c in terms.items()
+            }
+
+        q = weights(Counter(_terms(query)))
+        q_norm = math.sqrt(sum(w * w for w in q.values())) or 1.0
+        scored = []
+        for i in candidates:
+            d = weights(self._entries[i].terms)
+            d_norm = math.sqrt(sum(w * w for w in d.values())) or 1.0
+            dot = sum(w * d[t] for t, w in q.items() if t in d)
+            scored.append((dot / (q_norm * d_norm), i))
+        return scored
+
+    def _embed(self, text: str) -> list[float]:
+        return self._encoder.encode(text, normalize_embeddings=True).tolist()
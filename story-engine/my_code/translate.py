@@ -6,17 +6,28 @@ Usage:
     python -m my_code.translate input.md --target Hinglish --hint "Write in Roman script (Latin alphabet), not Devanagari"
     python -m my_code.translate input.md --target Urdu --hint "Use Arabic script"
     python -m my_code.translate input.md --target Hindi --output /tmp/out.md
+    python -m my_code.translate input.md --target Hindi --batch-tokens 1500 --parallel 4
+
+Every finished paragraph is appended to a translation cache next to the output
+(.<output-stem>.translation-cache.jsonl), keyed by a hash of the source paragraph,
+languages and hint. Re-running the same command resumes after a crash, and after
+editing the input only the changed paragraphs are retranslated.
 """
 
 from __future__ import annotations
 
 import argparse
-import gc
+import hashlib
+import json
 import logging
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from my_code.agents.translator import create_translator
+from my_code.models.pool import agent_pool, invoke
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +37,8 @@ logging.basicConfig(
 log = logging.getLogger(__name__)
 
 _CONTEXT_WINDOW = 2
+_CHARS_PER_TOKEN = 4  # rough estimate — good enough for batch budgeting
+_MARKER_RE = re.compile(r"^\[\[(\d+)\]\]\s*$", re.MULTILINE)
 
 
 def _split_paragraphs(text: str) -> list[str]:
@@ -35,18 +48,26 @@ def _split_paragraphs(text: str) -> list[str]:
 
 def _detect_language(first_paragraph: str, target_lang: str, hint: str | None) -> str:
     log.info("Detecting source language...")
-    agent = create_translator(source_lang="auto", target_lang=target_lang, hint=hint)
     prompt = (
         "Identify the language of the following text. "
         "Reply with only the full language name in English (e.g. 'English', 'Hindi', 'French').\n\n"
         f"{first_paragraph}"
     )
-    result = agent(prompt)
+    with _lease_translator("auto", target_lang, hint) as agent:
+        result = invoke(agent, prompt, stateless=True)
     detected = str(result).strip().splitlines()[0].strip(" .,")
     log.info("Detected source language: %s", detected)
     return detected
 
 
+def _lease_translator(source_lang: str, target_lang: str, hint: str | None):
+    """Borrow a pooled TranslatorAgent for this language pair (one per in-flight call)."""
+    return agent_pool.lease(
+        ("translator", source_lang, target_lang, hint),
+        lambda: create_translator(source_lang=source_lang, target_lang=target_lang, hint=hint),
+    )
+
+
 def _build_context_block(recent: list[str]) -> str:
     if not recent:
         return ""
@@ -67,17 +88,167 @@ def _translate_paragraph(
     index: int,
     total: int,
 ) -> str:
-    gc.collect()
-    agent = create_translator(source_lang=source_lang, target_lang=target_lang, hint=hint)
     context_block = _build_context_block(context)
     prompt = f"{context_block}Translate the following paragraph:\n\n{paragraph}"
     log.info("Paragraph %d/%d → translating (%d context paragraphs)", index, total, len(context))
-    result = agent(prompt)
+    with _lease_translator(source_lang, target_lang, hint) as agent:
+        result = invoke(agent, prompt, stateless=True)
     translated = str(result).strip()
     log.info("Paragraph %d/%d ← done (%d chars)", index, total, len(translated))
     return translated
 
 
+# ---------------------------------------------------------------------------
+# Translation cache / checkpoint
+# ---------------------------------------------------------------------------
+
+def _cache_path(output_path: Path) -> Path:
+    return output_path.parent / f".{output_path.stem}.translation-cache.jsonl"
+
+
+def _cache_key(paragraph: str, source_lang: str, target_lang: str, hint: str | None) -> str:
+    raw = "\0".join([source_lang, target_lang, hint or "", paragraph])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _TranslationCache:
+    """Append-only JSONL store of {key, text} records.
+
+    Each record is flushed as soon as a paragraph (or batch) finishes, so the
+    file doubles as a resume checkpoint. A torn final line from a crash is
+    skipped on load; later records for the same key win.
+    """
+
+    def __init__(self, path: Path, enabled: bool = True):
+        self.path = path
+        self.enabled = enabled
+        self._entries: dict[str, str] = {}
+        self._lock = threading.Lock()
+        if enabled and path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                try:
+                    rec = json.loads(line)
+                    self._entries[rec["key"]] = rec["text"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+            log.info("Translation cache: %d entries loaded from %s", len(self._entries), path.name)
+
+    def get(self, key: str) -> str | None:
+        return self._entries.get(key) if self.enabled else None
+
+    def put_many(self, items: list[tuple[str, str]]) -> None:
+        if not self.enabled or not items:
+            return
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                for key, text in items:
+                    self._entries[key] = text
+                    fh.write(json.dumps({"key": key, "text": text}, ensure_ascii=False) + "\n")
+                fh.flush()
+
+
+# ---------------------------------------------------------------------------
+# Batched mode
+# ---------------------------------------------------------------------------
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // _CHARS_PER_TOKEN)
+
+
+def _make_batches(pending: list[int], paragraphs: list[str], budget_tokens: int) -> list[list[int]]:
+    """Group pending paragraph indices into runs that fit the token budget.
+
+    A batch only contains consecutive paragraphs so the model sees coherent
+    text; a paragraph larger than the budget is sent on its own.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    used = 0
+    for i in pending:
+        cost = _estimate_tokens(paragraphs[i])
+        contiguous = not current or current[-1] == i - 1
+        if current and (used + cost > budget_tokens or not contiguous):
+            batches.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _build_source_context_block(recent: list[str]) -> str:
+    if not recent:
+        return ""
+    joined = "\n\n".join(recent)
+    return (
+        "[Preceding source text — for continuity only, do not translate]\n"
+        f"{joined}\n"
+        "[End of preceding text]\n\n"
+    )
+
+
+def _parse_batch(raw: str, count: int) -> list[str] | None:
+    """Split a marked-up batch response back into paragraphs; None if malformed."""
+    parts = _MARKER_RE.split(raw)
+    # parts = [preamble, "1", text1, "2", text2, ...]
+    found = {int(n): t.strip() for n, t in zip(parts[1::2], parts[2::2])}
+    if sorted(found) != list(range(1, count + 1)) or not all(found.values()):
+        return None
+    return [found[n] for n in range(1, count + 1)]
+
+
+def _translate_batch(
+    batch: list[int],
+    paragraphs: list[str],
+    context_paragraphs: int,
+    source_lang: str,
+    target_lang: str,
+    hint: str | None,
+    total: int,
+) -> list[str]:
+    """Translate a run of paragraphs in one request, using source-side context.
+
+    Source-side context (the original paragraphs preceding the batch) has no
+    dependency on other batches' output, so batches can run concurrently.
+    Falls back to paragraph-by-paragraph if the response markers don't line up.
+    """
+    first, last = batch[0], batch[-1]
+    context = paragraphs[max(0, first - context_paragraphs):first] if context_paragraphs else []
+    marked = "\n\n".join(f"[[{n}]]\n{paragraphs[i]}" for n, i in enumerate(batch, start=1))
+    prompt = (
+        f"{_build_source_context_block(context)}"
+        f"Translate the following {len(batch)} paragraphs. Each starts with a marker line "
+        f"like [[1]]. Reproduce every marker line exactly, on its own line, followed by "
+        f"that paragraph's translation.\n\n{marked}"
+    )
+    log.info("Paragraphs %d-%d/%d → translating batch (%d paragraphs)", first + 1, last + 1, total, len(batch))
+    with _lease_translator(source_lang, target_lang, hint) as agent:
+        raw = str(invoke(agent, prompt, stateless=True)).strip()
+    parsed = _parse_batch(raw, len(batch))
+    if parsed is None:
+        log.warning("Paragraphs %d-%d/%d: batch markers mismatched — retrying one by one", first + 1, last + 1, total)
+        parsed = [
+            _translate_paragraph(
+                paragraph=paragraphs[i],
+                context=[],
+                source_lang=source_lang,
+                target_lang=target_lang,
+                hint=hint,
+                index=i + 1,
+                total=total,
+            )
+            for i in batch
+        ]
+    log.info("Paragraphs %d-%d/%d ← done", first + 1, last + 1, total)
+    return parsed
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
 def run_translation(
     input_path: Path,
     target_lang: str,
@@ -85,33 +256,67 @@ def run_translation(
     context_paragraphs: int,
     hint: str | None,
     output_path: Path | None,
+    batch_tokens: int = 0,
+    parallel: int = 1,
+    use_cache: bool = True,
 ) -> Path:
+    """Translate input_path into target_lang and write the result.
+
+    batch_tokens=0 keeps the original serial mode (one paragraph per request,
+    rolling translated context). batch_tokens>0 groups paragraphs into batches
+    of roughly that many source tokens with source-side context, and runs up to
+    `parallel` batches concurrently; output order is always preserved.
+    """
     text = input_path.read_text(encoding="utf-8")
     paragraphs = _split_paragraphs(text)
     total = len(paragraphs)
     log.info("Input: %s — %d paragraphs", input_path.name, total)
 
+    if output_path is None:
+        output_path = input_path.with_suffix(f".translated{input_path.suffix}")
+
     if not source_lang:
         source_lang = _detect_language(paragraphs[0], target_lang, hint)
 
-    translated: list[str] = []
-    rolling_context: list[str] = []
-
-    for i, para in enumerate(paragraphs, start=1):
-        result = _translate_paragraph(
-            paragraph=para,
-            context=rolling_context[-context_paragraphs:],
-            source_lang=source_lang,
-            target_lang=target_lang,
-            hint=hint,
-            index=i,
-            total=total,
-        )
-        translated.append(result)
-        rolling_context.append(result)
+    cache = _TranslationCache(_cache_path(output_path), enabled=use_cache)
+    keys = [_cache_key(p, source_lang, target_lang, hint) for p in paragraphs]
+    translated: list[str | None] = [cache.get(k) for k in keys]
+    pending = [i for i, t in enumerate(translated) if t is None]
+    if len(pending) < total:
+        log.info("Cache: %d/%d paragraphs already translated, %d to go", total - len(pending), total, len(pending))
 
-    if output_path is None:
-        output_path = input_path.with_suffix(f".translated{input_path.suffix}")
+    if batch_tokens > 0:
+        batches = _make_batches(pending, paragraphs, batch_tokens)
+        log.info("Batched mode: %d batches, up to %d in flight", len(batches), parallel)
+        with ThreadPoolExecutor(max_workers=max(1, parallel)) as pool:
+            futures = {
+                pool.submit(
+                    _translate_batch, batch, paragraphs, context_paragraphs,
+                    source_lang, target_lang, hint, total,
+                ): batch
+                for batch in batches
+            }
+            for fut in as_completed(futures):
+                batch = futures[fut]
+                results = fut.result()
+                for i, result in zip(batch, results):
+                    translated[i] = result
+                cache.put_many([(keys[i], r) for i, r in zip(batch, results)])
+    else:
+        for i in pending:
+            # Rolling context: the nearest already-translated paragraphs before this one
+            rolling_context = [t for t in translated[:i] if t is not None]
+            result = _translate_paragraph(
+                paragraph=paragraphs[i],
+                context=rolling_context[-context_paragraphs:] if context_paragraphs else [],
+                source_lang=source_lang,
+                target_lang=target_lang,
+                hint=hint,
+                index=i + 1,
+                total=total,
+            )
+            translated[i] = result
+            cache.put_many([(keys[i], result)])
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text("\n\n".join(translated), encoding="utf-8")
@@ -141,6 +346,24 @@ def main() -> None:
         default=None,
         help="Output file path (default: <input>.translated.<ext>)",
     )
+    parser.add_argument(
+        "--batch-tokens",
+        type=int,
+        default=0,
+        help="Batched mode: group paragraphs into requests of ~N source tokens, using "
+             "source-side context (default: 0 = one paragraph per request)",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Batched mode: number of batches in flight at once (default: 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not write the translation cache / resume checkpoint",
+    )
     args = parser.parse_args()
 
     if not args.input.exists():
@@ -154,6 +377,9 @@ def main() -> None:
         context_paragraphs=args.context_paragraphs,
         hint=args.hint,
         output_path=args.output,
+        batch_tokens=args.batch_tokens,
+        parallel=args.parallel,
+        use_cache=not args.no_cache,
     )
     print(f"\nTranslation complete: {output}")
 